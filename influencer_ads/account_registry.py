@@ -0,0 +1,151 @@
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from typing import Dict, List, Optional
+
+from gmail_client import GmailClient, TOKEN_FILE, DEFAULT_CONCURRENCY
+
+# 계정 목록 파일
+# 예: [{"name": "creator_a", "token_file": "tokens/creator_a.pickle"}, ...]
+ACCOUNTS_FILE = 'accounts.json'
+
+
+class AccountRegistry:
+    """관리 중인 Gmail 계정과 계정별 클라이언트 관리"""
+
+    def __init__(self, accounts_file: str = ACCOUNTS_FILE, concurrency: int = DEFAULT_CONCURRENCY):
+        """
+        Args:
+            accounts_file: 계정 목록 JSON 파일
+            concurrency: 계정별 Gmail 서비스 풀 크기
+        """
+        self.accounts_file = accounts_file
+        self.concurrency = concurrency
+        self.accounts: Dict[str, Dict] = {}
+        self._clients: Dict[str, GmailClient] = {}
+        self._lock = threading.Lock()
+        self.load_accounts()
+
+    def load_accounts(self):
+        """계정 목록 로드 (파일이 없으면 기존 token.pickle 단일 계정)"""
+        accounts = []
+        if os.path.exists(self.accounts_file):
+            try:
+                with open(self.accounts_file, 'r', encoding='utf-8') as f:
+                    accounts = json.load(f)
+            except Exception as e:
+                print(f"계정 목록 로드 오류: {e}")
+
+        if not accounts:
+            accounts = [{'name': 'default', 'token_file': TOKEN_FILE}]
+
+        self.accounts = {account['name']: account for account in accounts}
+
+    def get_account_names(self) -> List[str]:
+        """등록된 계정 이름 목록"""
+        return list(self.accounts.keys())
+
+    def get_client(self, name: str) -> GmailClient:
+        """계정별 Gmail 클라이언트 반환 (처음 요청 시 생성 후 재사용)"""
+        with self._lock:
+            client = self._clients.get(name)
+        if client is not None:
+            return client
+
+        # 인증이 오래 걸릴 수 있으므로 잠금 밖에서 생성 (다른 계정 생성을 막지 않음)
+        account = self.accounts[name]
+        client = GmailClient(
+            token_file=account.get('token_file', TOKEN_FILE),
+            concurrency=self.concurrency,
+            account=name
+        )
+        with self._lock:
+            return self._clients.setdefault(name, client)
+
+    def get_reply_client(self, email: Dict) -> GmailClient:
+        """
+        이메일을 받은 계정의 Gmail 클라이언트 (회신 전송용)
+
+        다른 메일함에서 회신이 나가지 않도록 첫 번째 계정으로 대신하지 않는다.
+
+        Raises:
+            ValueError: 이메일에 계정 정보가 없거나 등록되지 않은 계정인 경우
+        """
+        name = email.get('account')
+        if not name:
+            raise ValueError("이 이메일을 받은 계정 정보가 없습니다. 이메일을 다시 가져와 주세요.")
+        if name not in self.accounts:
+            raise ValueError(f"등록되지 않은 계정입니다: {name}")
+        return self.get_client(name)
+
+    def clear_clients(self):
+        """캐시된 클라이언트 폐기 (토큰 재설정 후 재인증용)"""
+        with self._lock:
+            self._clients.clear()
+
+    def get_quota_usage(self) -> List[Dict]:
+        """생성된 클라이언트들의 계정별 할당량 사용량"""
+        with self._lock:
+            clients = list(self._clients.values())
+        return [client.quota.snapshot() for client in clients]
+
+
+class MultiAccountFetcher:
+    """여러 계정에서 동시에 이메일을 가져와 하나의 목록으로 병합"""
+
+    def __init__(self, registry: AccountRegistry):
+        self.registry = registry
+
+    def fetch(self, accounts: Optional[List[str]] = None, query: Optional[str] = None,
+              max_results: int = 20) -> List[Dict]:
+        """
+        계정별로 이메일을 병렬 조회한 뒤 계정 태그를 붙여 병합
+
+        Args:
+            accounts: 조회할 계정 이름 목록 (None이면 전체)
+            query: Gmail 검색 쿼리 (None이면 협찬 키워드 검색)
+            max_results: 계정당 가져올 최대 이메일 수
+
+        Returns:
+            계정을 번갈아가며 섞은 이메일 리스트 (각 항목에 'account' 포함)
+        """
+        names = accounts or self.registry.get_account_names()
+        if not names:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            per_account = list(executor.map(
+                lambda name: self._fetch_account(name, query, max_results), names
+            ))
+
+        return self.interleave(per_account)
+
+    def _fetch_account(self, name: str, query: Optional[str], max_results: int) -> List[Dict]:
+        """계정 하나의 이메일 조회 (실패한 계정은 빈 목록)"""
+        try:
+            client = self.registry.get_client(name)
+            if query is None:
+                emails = client.search_sponsorship_emails(max_results=max_results)
+            else:
+                emails = client.get_emails(query=query, max_results=max_results)
+        except Exception as e:
+            print(f"계정 '{name}' 이메일 가져오기 오류: {e}")
+            return []
+
+        for email in emails:
+            email['account'] = name
+        return emails
+
+    @staticmethod
+    def interleave(per_account: List[List[Dict]]) -> List[Dict]:
+        """계정별 목록을 라운드로빈으로 병합
+
+        큰 받은편지함 하나가 분류 파이프라인 앞쪽을 독점하지 않도록
+        각 계정에서 한 건씩 번갈아 꺼낸다.
+        """
+        merged = []
+        for row in zip_longest(*per_account):
+            merged.extend(email for email in row if email is not None)
+        return merged
@@ -1,14 +1,13 @@
+import time
+
+# 스크립트 재실행(rerun) 소요 시간 측정 시작
+_RERUN_STARTED_AT = time.perf_counter()
+
 import streamlit as st
 import os
-from datetime import datetime, timedelta
+import tempfile
 from dotenv import load_dotenv
-from gmail_client import GmailClient
-from classifier import SponsorshipClassifier
-from translation_client import TranslationClient
-from schedule_analyzer import ScheduleAnalyzer
-from email_manager import EmailManager
-from calendar_client import CalendarClient
-import pandas as pd
+from result_store import ResultRecord, ResultStore
 
 # 환경 변수 로드
 load_dotenv()
@@ -192,8 +191,96 @@ with col3:
 st.markdown("<br>", unsafe_allow_html=True)
 
 
-def initialize_clients():
-    """클라이언트 초기화"""
+# 파이프라인 동시 처리 수 (Gmail 서비스 풀 크기 등에 사용)
+PIPELINE_CONCURRENCY = int(os.getenv('PIPELINE_CONCURRENCY', '4'))
+
+# 결과 화면 한 페이지에 표시할 이메일 카드 수
+CARDS_PER_PAGE = int(os.getenv('CARDS_PER_PAGE', '10'))
+
+# 결과 정렬 기준: 표시 이름 -> ResultStore 보상 조건 열
+SORT_OPTIONS = {
+    "기본 순서": None,
+    "고정금액 높은 순": 'fixed_fee',
+    "조회수보상(CPM) 높은 순": 'cpm',
+    "판매수수료 높은 순": 'commission',
+}
+
+# 결과 화면 (선택한 화면만 렌더링)
+RESULT_VIEWS = ["🟢 1단계", "🟡 2단계", "🔴 3단계", "📋 전체", "💖 찜한 이메일", "📧 회신", "📅 캘린더"]
+
+# 카테고리 화면: 화면 이름 -> (카테고리, 제목, 카드 키 접두사)
+CATEGORY_VIEWS = {
+    "🟢 1단계": ('tier1', "1단계: 고정 금액만", "tier1"),
+    "🟡 2단계": ('tier2', "2단계: 고정 금액 + 조회수 수익", "tier2"),
+    "🔴 3단계": ('tier3', "3단계: 고정 금액 + 조회수 + 판매 수수료", "tier3"),
+    "📋 전체": (None, "전체 이메일", "all"),
+}
+
+
+# 클라이언트는 프로세스 전체에서 한 번만 생성하고 재사용 (st.cache_resource)
+# 무거운 모듈(google API, requests 등)은 처음 필요한 시점에 import
+@st.cache_resource(show_spinner=False)
+def get_account_registry():
+    """Gmail 계정 목록 (accounts.json, 없으면 token.pickle 단일 계정)"""
+    from account_registry import AccountRegistry
+    return AccountRegistry(concurrency=PIPELINE_CONCURRENCY)
+
+
+def get_gmail_client(account: str = None):
+    """계정별 Gmail 클라이언트 (토큰 로드 + 서비스 빌드는 계정당 1회)"""
+    registry = get_account_registry()
+    return registry.get_client(account or registry.get_account_names()[0])
+
+
+@st.cache_resource(show_spinner=False)
+def get_classifier(api_key: str):
+    """분류기 (CLASSIFIER_JSON_MODE=0이면 예전 줄 형식 응답 요청)"""
+    from classifier import SponsorshipClassifier
+    return SponsorshipClassifier(api_key, json_mode=os.getenv('CLASSIFIER_JSON_MODE', '1') != '0')
+
+
+@st.cache_resource(show_spinner=False)
+def get_translation_client():
+    """번역 클라이언트"""
+    from translation_client import TranslationClient
+    return TranslationClient()
+
+
+@st.cache_resource(show_spinner=False)
+def get_schedule_analyzer():
+    """일정 분석기"""
+    from schedule_analyzer import ScheduleAnalyzer
+    from date_resolver import DEFAULT_TIMEZONE
+    from result_store import set_event_builder
+    analyzer = ScheduleAnalyzer(timezone=os.getenv('SCHEDULE_TIMEZONE', DEFAULT_TIMEZONE))
+    # 저장된 결과의 캘린더 이벤트도 같은 설정의 분석기로 생성
+    set_event_builder(analyzer)
+    return analyzer
+
+
+@st.cache_resource(show_spinner=False)
+def get_email_manager():
+    """이메일 관리자 (찜 목록, 회신 템플릿)"""
+    from email_manager import EmailManager
+    return EmailManager()
+
+
+@st.cache_resource(show_spinner=False)
+def get_search_index():
+    """처리한 이메일 로컬 검색 인덱스"""
+    from search_index import SearchIndex
+    return SearchIndex()
+
+
+@st.cache_resource(show_spinner=False)
+def get_calendar_client():
+    """캘린더 클라이언트 (인증은 처음 사용할 때 수행)"""
+    from calendar_client import CalendarClient
+    return CalendarClient()
+
+
+def initialize_clients(account: str = None):
+    """클라이언트 초기화 (캐시된 인스턴스 반환)"""
     try:
         # Naver HyperCLOVA API 키 확인
         clova_api_key = os.getenv('CLOVA_STUDIO_KEY', 'nv-bf2506d5f74f4d0c921a472cb24d8c44tQby')
@@ -215,22 +302,22 @@ def initialize_clients():
             return None, None, None, None, None, None
         
         # Gmail 클라이언트 초기화
-        gmail_client = GmailClient()
+        gmail_client = get_gmail_client(account)
         
         # 분류기 초기화
-        classifier = SponsorshipClassifier(clova_api_key)
+        classifier = get_classifier(clova_api_key)
         
         # 번역 클라이언트 초기화
-        translation_client = TranslationClient()
+        translation_client = get_translation_client()
         
         # 일정 분석기 초기화
-        schedule_analyzer = ScheduleAnalyzer()
+        schedule_analyzer = get_schedule_analyzer()
         
         # 이메일 관리자 초기화
-        email_manager = EmailManager()
+        email_manager = get_email_manager()
         
         # 캘린더 클라이언트 초기화
-        calendar_client = CalendarClient()
+        calendar_client = get_calendar_client()
         
         return gmail_client, classifier, translation_client, schedule_analyzer, email_manager, calendar_client
     
@@ -251,7 +338,59 @@ def initialize_clients():
         return None, None, None, None, None, None
 
 
-def display_email_card(email, classification, explanation, details, translation_data=None, schedule_data=None, email_manager=None, calendar_client=None, tab_prefix=""):
+def display_schedule_conflicts(schedule_data):
+    """일정과 겹치는 캘린더 일정 및 추천 빈 시간 표시"""
+    conflicts = schedule_data.get('conflicts')
+    if not conflicts:
+        return
+    
+    names = ', '.join(conflict['summary'] for conflict in conflicts)
+    message = f"⚠️ 기존 일정과 겹칩니다: {names}"
+    if schedule_data.get('free_slot'):
+        message += f"\n\n가장 가까운 빈 시간: {schedule_data['free_slot'].strftime('%Y년 %m월 %d일 %H:%M')}"
+    st.warning(message)
+
+
+# 카드 버튼은 fragment로 분리하여 클릭 시 해당 버튼 영역만 다시 실행 (전체 화면 재실행 없음)
+@st.fragment
+def calendar_add_button(email, schedule_data, calendar_client, key):
+    """이메일 일정을 캘린더에 추가하는 버튼"""
+    if st.button("📅 캘린더에 추가", key=key):
+        if calendar_client:
+            result = calendar_client.create_event(
+                title=email['subject'],
+                description=email.get('body', email.get('snippet', '')),
+                start_datetime=schedule_data['calendar_event']['start'],
+                end_datetime=schedule_data['calendar_event']['end'],
+                source_id=email['id']
+            )
+            
+            if result['success']:
+                st.success(result['message'])
+            else:
+                st.error(result['message'])
+        else:
+            st.error("캘린더 클라이언트가 초기화되지 않았습니다.")
+
+
+@st.fragment
+def favorite_button(email, classification, explanation, email_manager, unique_key, favorites_counter=None):
+    """찜하기/찜 해제 버튼 (클릭 콜백에서 상태를 바꾼 뒤 이 영역만 다시 그림)"""
+    if email_manager.is_favorite(email['id']):
+        st.button("💖 찜 해제", key=f"unfavorite_{unique_key}",
+                  on_click=email_manager.remove_from_favorites, args=(email['id'],))
+    else:
+        st.button("🤍 찜하기", key=f"favorite_{unique_key}",
+                  on_click=email_manager.add_to_favorites, args=(email, classification, explanation))
+    
+    # 사이드바 찜 개수 갱신 (전체 실행 때 만든 자리 표시자에 바뀐 경우만 다시 씀)
+    favorite_count = email_manager.favorite_count()
+    if favorites_counter is not None and st.session_state.get('favorites_count_shown') != favorite_count:
+        favorites_counter.metric("💖 찜한 이메일", favorite_count)
+        st.session_state['favorites_count_shown'] = favorite_count
+
+
+def display_email_card(email, classification, explanation, details, translation_data=None, schedule_data=None, email_manager=None, calendar_client=None, tab_prefix="", favorites_counter=None):
     """이메일 카드 UI (개선된 디자인)"""
     # 카테고리별 색상 및 라벨
     category_info = {
@@ -287,6 +426,8 @@ def display_email_card(email, classification, explanation, details, translation_
     
     with col1:
         st.markdown(f"**👤 발신자:** {email['sender']}")
+        if email.get('account'):
+            st.markdown(f"**👥 계정:** {email['account']}")
         st.markdown(f"**📅 날짜:** {email['date']}")
         
         # 번역 정보 표시
@@ -296,26 +437,13 @@ def display_email_card(email, classification, explanation, details, translation_
         # 일정 정보 표시
         if schedule_data and schedule_data.get('has_schedule'):
             st.markdown(f"**📅 일정:** {schedule_data['calendar_event']['datetime_display']}")
+            display_schedule_conflicts(schedule_data)
             
             # 캘린더 추가 버튼들
             col_cal1, col_cal2 = st.columns(2)
             
             with col_cal1:
-                if st.button("📅 캘린더에 추가", key=f"add_calendar_{tab_prefix}_{email['id']}"):
-                    if calendar_client:
-                        result = calendar_client.create_event(
-                            title=email['subject'],
-                            description=email.get('body', email.get('snippet', '')),
-                            start_datetime=schedule_data['calendar_event']['start'],
-                            end_datetime=schedule_data['calendar_event']['end']
-                        )
-                        
-                        if result['success']:
-                            st.success(result['message'])
-                        else:
-                            st.error(result['message'])
-                    else:
-                        st.error("캘린더 클라이언트가 초기화되지 않았습니다.")
+                calendar_add_button(email, schedule_data, calendar_client, f"add_calendar_{tab_prefix}_{email['id']}")
             
             with col_cal2:
                 if schedule_data['calendar_event']['calendar_link']:
@@ -354,18 +482,9 @@ def display_email_card(email, classification, explanation, details, translation_
         
         # 찜 기능
         if email_manager:
-            is_favorite = email_manager.is_favorite(email['id'])
             # 탭 접두사와 이메일 ID를 조합한 고유 키 생성
             unique_key = f"{tab_prefix}_{email['id']}"
-            
-            if is_favorite:
-                if st.button("💖 찜 해제", key=f"unfavorite_{unique_key}"):
-                    email_manager.remove_from_favorites(email['id'])
-                    st.rerun()
-            else:
-                if st.button("🤍 찜하기", key=f"favorite_{unique_key}"):
-                    email_manager.add_to_favorites(email, classification, explanation)
-                    st.rerun()
+            favorite_button(email, classification, explanation, email_manager, unique_key, favorites_counter)
         
         if details:
             st.markdown("<br>", unsafe_allow_html=True)
@@ -376,6 +495,113 @@ def display_email_card(email, classification, explanation, details, translation_
     st.markdown("</div>", unsafe_allow_html=True)
 
 
+def display_result_page(classified_emails, category, tab_prefix, email_manager, calendar_client, favorites_counter=None):
+    """카테고리 결과를 보상 조건으로 정렬/필터한 뒤 선택한 페이지의 카드만 표시"""
+    if not classified_emails.count(category):
+        st.info("해당하는 이메일이 없습니다.")
+        return
+    
+    col_sort, col_fee, col_commission = st.columns(3)
+    with col_sort:
+        sort_label = st.selectbox("정렬", list(SORT_OPTIONS), key=f"sort_{tab_prefix}")
+    with col_fee:
+        min_fee = st.number_input("최소 고정금액 (만원)", min_value=0, value=0, step=10, key=f"min_fee_{tab_prefix}")
+    with col_commission:
+        min_commission = st.number_input("최소 판매수수료 (%)", min_value=0.0, value=0.0, step=1.0, key=f"min_commission_{tab_prefix}")
+    
+    min_values = {}
+    if min_fee:
+        min_values['fixed_fee'] = min_fee * 10_000
+    if min_commission:
+        min_values['commission'] = min_commission
+    
+    sort_by = SORT_OPTIONS[sort_label]
+    if sort_by or min_values:
+        items = classified_emails.query(category, sort_by=sort_by, min_values=min_values)
+    else:
+        items = classified_emails.items(category)
+    
+    total = len(items)
+    if not total:
+        st.info("조건에 맞는 이메일이 없습니다.")
+        return
+    
+    page_count = max(1, -(-total // CARDS_PER_PAGE))
+    page = 1
+    if page_count > 1:
+        page = st.number_input(
+            f"페이지 (전체 {page_count}쪽, {total}건)",
+            min_value=1,
+            max_value=page_count,
+            value=1,
+            step=1,
+            key=f"page_{tab_prefix}"
+        )
+    
+    start = (page - 1) * CARDS_PER_PAGE
+    for item in items[start:start + CARDS_PER_PAGE]:
+        display_email_card(
+            item['email'],
+            item['classification'],
+            item['explanation'],
+            item['details'],
+            item.get('translation_data'),
+            item.get('schedule_data'),
+            email_manager,
+            calendar_client,
+            tab_prefix,
+            favorites_counter
+        )
+
+
+# 로컬 검색 카테고리 필터: 표시 이름 -> 분류 카테고리
+SEARCH_CATEGORIES = {
+    "전체": None,
+    "🟢 1단계": 'tier1',
+    "🟡 2단계": 'tier2',
+    "🔴 3단계": 'tier3',
+    "협찬 아님": 'not_sponsorship',
+    "불명확": 'unclear',
+}
+
+
+@st.fragment
+def local_search():
+    """처리한 이메일 검색 (로컬 인덱스 조회, 검색어를 바꿔도 이 영역만 다시 그림)"""
+    search_index = get_search_index()
+    if not search_index.available:
+        st.info("검색 인덱스를 사용할 수 없습니다.")
+        return
+    
+    col_query, col_category = st.columns([3, 1])
+    with col_query:
+        query = st.text_input(
+            "검색어",
+            placeholder="예: 유튜브 리뷰 수수료",
+            help=f"지금까지 분류한 이메일 {search_index.count()}건의 제목, 발신자, 본문, 번역문, 분류 설명에서 찾습니다",
+            key="local_search_query"
+        )
+    with col_category:
+        category_label = st.selectbox("분류", list(SEARCH_CATEGORIES), key="local_search_category")
+    
+    if not query.strip():
+        return
+    
+    started = time.perf_counter()
+    hits = search_index.search(query, SEARCH_CATEGORIES[category_label])
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    st.caption(f"{len(hits)}건 ({elapsed_ms:.1f}ms)")
+    
+    for hit in hits:
+        with st.expander(f"📧 {hit['subject']} — {hit['sender']}"):
+            st.write(f"**📅 날짜:** {hit['date']}")
+            if hit['account']:
+                st.write(f"**👥 계정:** {hit['account']}")
+            st.write(f"**🏷️ 분류:** {hit['classification']}")
+            st.write(f"**📝 분석 결과:** {hit['explanation']}")
+            st.text(hit['preview'])
+
+
 def main():
     """메인 함수"""
     
@@ -409,6 +635,16 @@ def main():
             }[x]
         )
         
+        # 여러 계정이 등록된 경우 조회할 계정 선택
+        account_names = get_account_registry().get_account_names()
+        selected_accounts = account_names[:1]
+        if len(account_names) > 1:
+            selected_accounts = st.multiselect(
+                "👥 계정",
+                options=account_names,
+                default=account_names
+            )
+        
         search_query = ""
         if search_option == 'custom':
             search_query = st.text_input(
@@ -427,6 +663,10 @@ def main():
         if st.button("🔄 인증 토큰 재설정", help="Gmail 인증 문제가 있을 때 사용"):
             if os.path.exists('token.pickle'):
                 os.remove('token.pickle')
+            # 캐시된 인증 정보와 Gmail 클라이언트도 폐기해야 다음 요청에서 재인증
+            from credential_broker import get_credential_broker
+            get_credential_broker().invalidate('token.pickle')
+            get_account_registry().clear_clients()
             st.success("✅ 인증 토큰이 삭제되었습니다. 새로 인증하세요.")
         
         fetch_button = st.button("📥 이메일 가져오기", type="primary", use_container_width=True)
@@ -442,28 +682,81 @@ def main():
         if 'classified_emails' in st.session_state:
             emails = st.session_state['classified_emails']
             
-            # 카테고리별 개수
-            tier1_count = sum(1 for e in emails if e['classification'] == 'tier1')
-            tier2_count = sum(1 for e in emails if e['classification'] == 'tier2')
-            tier3_count = sum(1 for e in emails if e['classification'] == 'tier3')
-            
+            # 카테고리별 개수 (결과를 추가할 때 함께 집계됨)
             st.metric("📧 총 이메일", len(emails))
-            st.metric("🟢 1단계", tier1_count)
-            st.metric("🟡 2단계", tier2_count)
-            st.metric("🔴 3단계", tier3_count)
+            st.metric("🟢 1단계", emails.count('tier1'))
+            st.metric("🟡 2단계", emails.count('tier2'))
+            st.metric("🔴 3단계", emails.count('tier3'))
+        
+        # 찜 개수는 카드의 찜 버튼 fragment가 직접 갱신
+        favorites_counter = st.empty()
+        try:
+            favorite_count = get_email_manager().favorite_count()
+            favorites_counter.metric("💖 찜한 이메일", favorite_count)
+            st.session_state['favorites_count_shown'] = favorite_count
+        except Exception:
+            pass
         
         st.markdown("</div>", unsafe_allow_html=True)
+        
+        # 계정별 Gmail 할당량 사용량
+        quota_usage = get_account_registry().get_quota_usage()
+        if quota_usage:
+            with st.expander("👥 계정별 Gmail 할당량"):
+                for usage in quota_usage:
+                    line = f"**{usage['account']}**: {usage['used']} units 사용"
+                    if usage['remaining_daily'] is not None:
+                        line += f" / 남은 예산 {usage['remaining_daily']}"
+                    if usage['waited']:
+                        line += f" (속도 조절 대기 {usage['waited']}초)"
+                    st.write(line)
+        
+        # 이 세션의 최근 분류 응답 형식과 백엔드별 호출 집계 (분류기는 세션끼리 공유하므로 세션별로 따로 모음)
+        # 재요청은 해석할 수 없는 응답 때문에 추가로 든 LLM 호출
+        classification_stats = st.session_state.get('classification_stats')
+        parse_stats = classification_stats['parse'] if classification_stats else None
+        if parse_stats and parse_stats['requests']:
+            with st.expander("🤖 분류 LLM 호출 (최근 분류)"):
+                st.write(f"**요청:** {parse_stats['requests']}건")
+                st.write(f"**JSON:** {parse_stats['json']}건 / **예전 형식:** {parse_stats['legacy']}건")
+                st.write(f"**재요청:** {parse_stats['retries']}회 / **해석 실패:** {parse_stats['failed']}건")
+                for name, stats in classification_stats['backends'].items():
+                    if stats['calls'] or stats['errors']:
+                        st.write(f"**{name}:** {stats['calls']}회, 오류 {stats['errors']}회, "
+                                 f"{stats['tokens']:,}토큰 (약 {stats['cost']:,.1f}원), "
+                                 f"평균 {stats['avg_latency_ms']:,.0f}ms")
+                
+                # 분류 단계가 여러 개일 때 단계별 처리/에스컬레이션 (확신도 기준 조정용)
+                cascade_stats = classification_stats['cascade']
+                if len(cascade_stats) > 1:
+                    st.markdown("**단계별 처리**")
+                    for name, stats in cascade_stats.items():
+                        st.write(f"**{name}:** {stats['calls']}건 중 확정 {stats['accepted']}건, "
+                                 f"다음 단계로 {stats['escalated']}건 ({stats['escalation_rate']:.0%}), "
+                                 f"오류 {stats['errors']}건, 평균 {stats['avg_latency_ms']:,.0f}ms, "
+                                 f"약 {stats['cost']:,.1f}원")
     
     # 메인 영역
     if fetch_button:
         with st.spinner("🔄 이메일을 가져오는 중..."):
-            gmail_client, classifier, translation_client, schedule_analyzer, email_manager, calendar_client = initialize_clients()
+            gmail_client, classifier, translation_client, schedule_analyzer, email_manager, calendar_client = initialize_clients(
+                selected_accounts[0] if selected_accounts else None
+            )
             
             if gmail_client is None or classifier is None:
                 return
             
             # 이메일 가져오기
-            if search_option == 'auto':
+            if len(selected_accounts) > 1:
+                # 여러 계정을 동시에 조회하고 계정별로 번갈아 병합
+                from account_registry import MultiAccountFetcher
+                fetcher = MultiAccountFetcher(get_account_registry())
+                emails = fetcher.fetch(
+                    accounts=selected_accounts,
+                    query=None if search_option == 'auto' else search_query,
+                    max_results=max_emails
+                )
+            elif search_option == 'auto':
                 emails = gmail_client.search_sponsorship_emails(max_results=max_emails)
             else:
                 emails = gmail_client.get_emails(query=search_query, max_results=max_emails)
@@ -507,21 +800,32 @@ def main():
             st.success(f"✅ {len(emails)}개의 이메일을 가져왔습니다.")
         
         # 이메일 분류
-        classified_emails = []
+        classified_emails = ResultStore()
         progress_bar = st.progress(0)
         status_text = st.empty()
         
-        import time
+        # 일정 분석은 배치 단위로 수행 (기준 시각은 한 번만 계산,
+        # 캘린더 이벤트는 일정이 발견된 이메일에 대해서만 생성)
+        schedule_batch = schedule_analyzer.analyze_many([]) if schedule_analyzer else None
+        scheduled_keys = []
+        
+        # 분류한 이메일은 한 건씩 바로 로컬 검색 인덱스에 추가
+        try:
+            search_index = get_search_index()
+        except Exception as e:
+            print(f"검색 인덱스 초기화 오류: {e}")
+            search_index = None
         
+        # 번역 수행 (분류와 일정 분석은 번역된 이메일로 수행)
+        translations = []
+        emails_for_classification = []
         for i, email in enumerate(emails):
-            status_text.text(f"분류 및 분석 중... ({i+1}/{len(emails)})")
+            status_text.text(f"번역 중... ({i+1}/{len(emails)})")
             
-            # 번역 수행
             translation_data = None
             if translation_client:
                 translation_data = translation_client.translate_email(email)
             
-            # 번역된 이메일로 분류 수행
             email_for_classification = email
             if translation_data and translation_data.get('is_translated'):
                 email_for_classification = {
@@ -529,35 +833,54 @@ def main():
                     'subject': translation_data['translated_subject'],
                     'body': translation_data['translated_body']
                 }
+            translations.append(translation_data)
+            emails_for_classification.append(email_for_classification)
+        
+        # 분류 수행 (LLM 백엔드가 허용하는 만큼 동시에 요청, API 제한 간격은 백엔드가 조절)
+        def show_classification_progress(done, total):
+            status_text.text(f"분류 중... ({done}/{total})")
+            progress_bar.progress(done / total)
+        
+        classification_stats = classifier.new_stats()
+        classifications = classifier.classify_many(emails_for_classification, show_classification_progress,
+                                                   stats=classification_stats)
+        
+        for email, translation_data, email_for_classification, (classification, explanation, details) in zip(
+                emails, translations, emails_for_classification, classifications):
+            # 일정 분석 수행 (결과에는 시작 시각과 종류만 보관)
+            schedule = None
+            if schedule_batch is not None:
+                schedule_key = schedule_batch.add(email_for_classification)
+                schedule = schedule_batch.schedule_summary(schedule_key)
+                if schedule is not None:
+                    scheduled_keys.append(schedule_key)
             
-            # 분류 수행
-            classification, explanation, details = classifier.classify_email(email_for_classification)
-            
-            # 일정 분석 수행
-            schedule_data = None
-            if schedule_analyzer:
-                schedule_data = schedule_analyzer.analyze_schedule(email_for_classification)
-            
-            classified_emails.append({
-                'email': email,
-                'classification': classification,
-                'explanation': explanation,
-                'details': details,
-                'translation_data': translation_data,
-                'schedule_data': schedule_data
-            })
-            
-            progress_bar.progress((i + 1) / len(emails))
-            
-            # API 제한 방지: 각 요청 사이에 1초 대기
-            if i < len(emails) - 1:  # 마지막 요청 후에는 대기 안함
-                time.sleep(1)
+            record = ResultRecord(email, classification, explanation, details, translation_data, schedule)
+            classified_emails.add(record)
+            if search_index is not None:
+                search_index.add(record)
+        
+        # 추출된 일정 전체를 캐시된 캘린더 일정과 한 번에 비교 (이메일별 API 호출 없음)
+        if scheduled_keys and calendar_client:
+            status_text.text("캘린더 일정과 겹치는지 확인 중...")
+            try:
+                conflicts = schedule_batch.check_conflicts(
+                    calendar_client.busy_index(schedule_analyzer.resolver.timezone)
+                )
+                for schedule_key in scheduled_keys:
+                    record = classified_emails.get(schedule_key)
+                    if record is not None and schedule_key in conflicts:
+                        record.conflicts = conflicts[schedule_key]['conflicts']
+                        record.free_slot = conflicts[schedule_key]['free_slot']
+            except Exception as e:
+                print(f"일정 충돌 확인 오류: {e}")
         
         status_text.empty()
         progress_bar.empty()
         
         # 세션 상태에 저장
         st.session_state['classified_emails'] = classified_emails
+        st.session_state['classification_stats'] = classification_stats.snapshot()
         
         st.success("✅ 모든 이메일 분류가 완료되었습니다!")
     
@@ -565,102 +888,27 @@ def main():
     if 'classified_emails' in st.session_state:
         classified_emails = st.session_state['classified_emails']
         
-        # 이메일 관리자 초기화 (세션 상태에서 가져오거나 새로 생성)
-        if 'email_manager' not in st.session_state:
-            try:
-                email_manager = EmailManager()
-                st.session_state['email_manager'] = email_manager
-            except:
-                email_manager = None
-        else:
-            email_manager = st.session_state['email_manager']
+        # 이메일 관리자 초기화 (프로세스 전체에서 공유되는 캐시 인스턴스)
+        try:
+            email_manager = get_email_manager()
+        except:
+            email_manager = None
         
-        # 캘린더 클라이언트 초기화 (세션 상태에서 가져오거나 새로 생성)
-        if 'calendar_client' not in st.session_state:
-            try:
-                calendar_client = CalendarClient()
-                st.session_state['calendar_client'] = calendar_client
-            except:
-                calendar_client = None
-        else:
-            calendar_client = st.session_state['calendar_client']
-        
-        # 필터 탭
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["🟢 1단계", "🟡 2단계", "🔴 3단계", "📋 전체", "💖 찜한 이메일", "📧 회신", "📅 캘린더"])
-        
-        with tab1:
-            st.header("1단계: 고정 금액만")
-            tier1_emails = [e for e in classified_emails if e['classification'] == 'tier1']
-            if tier1_emails:
-                for item in tier1_emails:
-                    display_email_card(
-                        item['email'],
-                        item['classification'],
-                        item['explanation'],
-                        item['details'],
-                        item.get('translation_data'),
-                        item.get('schedule_data'),
-                        email_manager,
-                        calendar_client,
-                        "tier1"
-                    )
-            else:
-                st.info("해당하는 이메일이 없습니다.")
-        
-        with tab2:
-            st.header("2단계: 고정 금액 + 조회수 수익")
-            tier2_emails = [e for e in classified_emails if e['classification'] == 'tier2']
-            if tier2_emails:
-                for item in tier2_emails:
-                    display_email_card(
-                        item['email'],
-                        item['classification'],
-                        item['explanation'],
-                        item['details'],
-                        item.get('translation_data'),
-                        item.get('schedule_data'),
-                        email_manager,
-                        calendar_client,
-                        "tier2"
-                    )
-            else:
-                st.info("해당하는 이메일이 없습니다.")
-        
-        with tab3:
-            st.header("3단계: 고정 금액 + 조회수 + 판매 수수료")
-            tier3_emails = [e for e in classified_emails if e['classification'] == 'tier3']
-            if tier3_emails:
-                for item in tier3_emails:
-                    display_email_card(
-                        item['email'],
-                        item['classification'],
-                        item['explanation'],
-                        item['details'],
-                        item.get('translation_data'),
-                        item.get('schedule_data'),
-                        email_manager,
-                        calendar_client,
-                        "tier3"
-                    )
-            else:
-                st.info("해당하는 이메일이 없습니다.")
-        
-        with tab4:
-            st.header("전체 이메일")
-            for item in classified_emails:
-                display_email_card(
-                    item['email'],
-                    item['classification'],
-                    item['explanation'],
-                    item['details'],
-                    item.get('translation_data'),
-                    item.get('schedule_data'),
-                    email_manager,
-                    calendar_client,
-                    "all"
-                )
+        # 캘린더 클라이언트 초기화 (프로세스 전체에서 공유되는 캐시 인스턴스)
+        try:
+            calendar_client = get_calendar_client()
+        except:
+            calendar_client = None
+        
+        # 화면 선택 (탭과 달리 선택한 화면만 렌더링)
+        view = st.radio("화면", RESULT_VIEWS, horizontal=True, label_visibility="collapsed", key="result_view")
+        
+        if view in CATEGORY_VIEWS:
+            category, title, tab_prefix = CATEGORY_VIEWS[view]
+            st.header(title)
+            display_result_page(classified_emails, category, tab_prefix, email_manager, calendar_client, favorites_counter)
         
-        with tab5:
+        if view == "💖 찜한 이메일":
             st.header("💖 찜한 이메일")
             favorites = email_manager.get_favorites() if email_manager else []
             if favorites:
@@ -680,6 +928,13 @@ def main():
                             st.write(f"**📅 날짜:** {favorite['date']}")
                             st.write(f"**🏷️ 분류:** {favorite['classification']}")
                             st.write(f"**💭 설명:** {favorite['explanation']}")
+                            # 본문은 펼칠 때만 읽음 (현재 결과에 있는 이메일이면 저장소를 읽지 않음)
+                            if st.checkbox("📄 본문 보기", key=f"favorite_body_{favorite['id']}"):
+                                current = classified_emails.get(favorite['id'])
+                                if current:
+                                    st.text(current['email'].get('body', current['email'].get('snippet', '')))
+                                else:
+                                    st.text(email_manager.get_favorite_body(favorite['id']))
                         
                         with col2:
                             if st.button("🗑️ 찜 해제", key=f"remove_favorite_{i}"):
@@ -688,18 +943,18 @@ def main():
             else:
                 st.info("찜한 이메일이 없습니다.")
         
-        with tab6:
+        if view == "📧 회신":
             st.header("📧 회신")
             
             # 회신할 이메일 선택
             reply_email_id = st.selectbox(
                 "회신할 이메일 선택",
-                options=[item['email']['id'] for item in classified_emails],
-                format_func=lambda x: next(item['email']['subject'] for item in classified_emails if item['email']['id'] == x)
+                options=classified_emails.ids(),
+                format_func=lambda x: classified_emails.get(x)['email']['subject']
             )
             
             if reply_email_id:
-                selected_email = next(item for item in classified_emails if item['email']['id'] == reply_email_id)
+                selected_email = classified_emails.get(reply_email_id)
                 
                 # 회신 템플릿 선택
                 template_type = st.selectbox(
@@ -731,9 +986,9 @@ def main():
                 
                 with col1:
                     if st.button("📤 회신 전송", type="primary"):
-                        # Gmail 클라이언트 초기화
+                        # 이메일을 받은 계정의 캐시된 Gmail 클라이언트 재사용 (계정을 모르면 전송하지 않음)
                         try:
-                            gmail_client = GmailClient()
+                            gmail_client = get_account_registry().get_reply_client(selected_email['email'])
                             result = gmail_client.send_reply(
                                 reply_email_id,
                                 reply_subject,
@@ -745,6 +1000,8 @@ def main():
                                 st.success(result['message'])
                             else:
                                 st.error(result['message'])
+                        except ValueError as e:
+                            st.error(f"회신을 보낼 수 없습니다: {str(e)}")
                         except Exception as e:
                             st.error(f"Gmail 클라이언트 초기화 실패: {str(e)}")
                 
@@ -753,7 +1010,7 @@ def main():
                         email_manager.update_reply_template(template_type, reply_subject, reply_body)
                         st.success("템플릿이 저장되었습니다.")
         
-        with tab7:
+        if view == "📅 캘린더":
             st.header("📅 캘린더 관리")
             
             if calendar_client:
@@ -788,13 +1045,71 @@ def main():
                 
                 # 일정이 있는 이메일들 표시
                 st.markdown("### 📧 일정이 포함된 이메일")
-                scheduled_emails = [item for item in classified_emails if item.get('schedule_data', {}).get('has_schedule')]
+                scheduled_emails = classified_emails.scheduled()
                 
                 if scheduled_emails:
+                    if st.button(f"📅 일정이 있는 이메일 모두 캘린더에 추가 ({len(scheduled_emails)}건)", key="calendar_add_all"):
+                        with st.spinner("캘린더에 일정을 추가하는 중..."):
+                            result = calendar_client.create_events_batch([
+                                {
+                                    'source_id': item.id,
+                                    'title': item.subject,
+                                    'description': item.body,
+                                    'start': item.schedule[0]  # 종료 시각은 시작 + 1시간
+                                }
+                                for item in scheduled_emails
+                            ])
+                        
+                        if result['success']:
+                            st.success(result['message'])
+                        else:
+                            st.error(result['message'])
+                        
+                        status_icons = {'created': '✅', 'skipped': '⏭️', 'failed': '❌'}
+                        for item_result in result['results']:
+                            st.write(f"{status_icons.get(item_result['status'], '•')} {item_result['title']} - {item_result['message']}")
+                    
+                    # 모든 일정을 하나의 ICS 파일로 내보내기 (같은 이메일은 고정 UID라 다시 가져와도 중복되지 않음)
+                    if st.button(f"📥 ICS 파일 만들기 ({len(scheduled_emails)}건)", key="calendar_export_ics"):
+                        from ics_export import write_ics
+                        from calendar_cache import zone_info
+                        from schedule_analyzer import ScheduleBatch
+                        schedule_tz = zone_info(schedule_analyzer.resolver.timezone) if schedule_analyzer else None
+                        with tempfile.NamedTemporaryFile('wb', suffix='.ics', delete=False) as ics_file:
+                            # 저장된 일정 시각으로 바로 기록 (결과마다 캘린더 링크까지 만드는 schedule_data를 거치지 않음)
+                            write_ics(
+                                (
+                                    (item.id, {
+                                        'title': item.subject,
+                                        'description': item.body,
+                                        'start': item.schedule[0].replace(tzinfo=schedule_tz),
+                                        'end': item.schedule[0].replace(tzinfo=schedule_tz) + ScheduleBatch.EVENT_DURATION,
+                                    })
+                                    for item in scheduled_emails
+                                ),
+                                ics_file
+                            )
+                        previous_path = st.session_state.get('ics_export_path')
+                        if previous_path and os.path.exists(previous_path):
+                            os.remove(previous_path)
+                        st.session_state['ics_export_path'] = ics_file.name
+                    
+                    ics_path = st.session_state.get('ics_export_path')
+                    if ics_path and os.path.exists(ics_path):
+                        with open(ics_path, 'rb') as ics_file:
+                            st.download_button(
+                                "💾 ICS 다운로드",
+                                data=ics_file,
+                                file_name="sponsorship_schedules.ics",
+                                mime="text/calendar",
+                                key="calendar_download_ics"
+                            )
+                    
                     for item in scheduled_emails:
                         with st.expander(f"📅 {item['email']['subject']}"):
                             schedule_data = item['schedule_data']
                             st.write(f"**일정:** {schedule_data['calendar_event']['datetime_display']}")
+                            display_schedule_conflicts(schedule_data)
                             st.write(f"**발신자:** {item['email']['sender']}")
                             
                             col1, col2 = st.columns(2)
@@ -804,7 +1119,8 @@ def main():
                                         title=item['email']['subject'],
                                         description=item['email'].get('body', item['email'].get('snippet', '')),
                                         start_datetime=schedule_data['calendar_event']['start'],
-                                        end_datetime=schedule_data['calendar_event']['end']
+                                        end_datetime=schedule_data['calendar_event']['end'],
+                                        source_id=item['email']['id']
                                     )
                                     
                                     if result['success']:
@@ -820,30 +1136,45 @@ def main():
             else:
                 st.error("캘린더 클라이언트가 초기화되지 않았습니다.")
         
-        # CSV 다운로드 기능
-        if st.button("📥 결과를 CSV로 다운로드"):
-            # DataFrame 생성
-            data = []
-            for item in classified_emails:
-                email = item['email']
-                data.append({
-                    '제목': email['subject'],
-                    '발신자': email['sender'],
-                    '날짜': email['date'],
-                    '분류': item['classification'],
-                    '설명': item['explanation'],
-                    '상세정보': str(item['details'])
-                })
-            
-            df = pd.DataFrame(data)
-            csv = df.to_csv(index=False, encoding='utf-8-sig')
+        # 결과 내보내기 (결과 목록에서 행을 하나씩 바로 기록, 큰 파일은 임시 파일로 넘어감)
+        from result_export import parquet_available
+        export_formats = {'CSV': ('csv', 'text/csv')}
+        if parquet_available():
+            export_formats['Parquet'] = ('parquet', 'application/vnd.apache.parquet')
+        
+        col_export1, col_export2 = st.columns([1, 3])
+        with col_export1:
+            export_format = st.selectbox("내보내기 형식", list(export_formats), key="export_format")
+        
+        extension, mime = export_formats[export_format]
+        if st.button(f"📥 결과를 {export_format}로 내보내기"):
+            from result_export import write_export_file
             
-            st.download_button(
-                label="CSV 파일 다운로드",
-                data=csv,
-                file_name="sponsorship_classification.csv",
-                mime="text/csv"
-            )
+            # 결과는 임시 파일에 행 단위로 기록 (다운로드 버튼에는 'rb'로 다시 연 파일을 넘김)
+            new_path = write_export_file(classified_emails, extension)
+            previous_path = st.session_state.get('result_export_path')
+            if previous_path and os.path.exists(previous_path):
+                os.remove(previous_path)
+            st.session_state['result_export_path'] = new_path
+        
+        export_path = st.session_state.get('result_export_path')
+        if export_path and os.path.exists(export_path) and export_path.endswith(f'.{extension}'):
+            with open(export_path, 'rb') as export_file:
+                st.download_button(
+                    label=f"{export_format} 파일 다운로드",
+                    data=export_file,
+                    file_name=f"sponsorship_classification.{extension}",
+                    mime=mime,
+                    key="result_download"
+                )
+    
+    # 처리한 이메일 로컬 검색 (Gmail 요청 없음)
+    with st.expander("🔍 처리한 이메일 검색"):
+        local_search()
+    
+    # 이번 재실행에 걸린 시간 (시작 ~ 렌더링 완료)
+    rerun_ms = (time.perf_counter() - _RERUN_STARTED_AT) * 1000
+    st.sidebar.caption(f"⏱️ 화면 갱신: {rerun_ms:.0f}ms")
 
 
 if __name__ == "__main__":
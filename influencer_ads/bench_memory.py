@@ -0,0 +1,103 @@
+"""
+분류 결과 세션 메모리 측정 스크립트
+
+사용법:
+    python bench_memory.py [--emails 10000] [--seed 42]
+
+합성 이메일 코퍼스(bench_schedule.py와 같은 코퍼스)를 분류 결과로 만들어
+세션에 보관할 때 남는 메모리(tracemalloc)를 두 방식으로 비교한다.
+    - dict  : 예전 방식 (원본 이메일 dict + 번역 dict + 전체 일정 분석 dict)
+    - record: ResultRecord (__slots__, 문자열은 한 번만 보관, 파생 값은 읽을 때 생성)
+분류기/번역 API는 호출하지 않고, 영어 이메일 일부를 번역된 것으로 가정한다.
+"""
+import argparse
+import gc
+import tracemalloc
+
+from bench_schedule import build_corpus
+from result_store import ResultRecord, ResultStore
+from schedule_analyzer import ScheduleAnalyzer
+
+# 분류기 결과 대신 쓰는 고정 값
+EXPLANATION = '고정 금액만 제시되어 있어 1단계로 분류했습니다.'
+DETAILS = {'고정 금액': '있음', '조회수 수익': '없음', '판매 수수료': '없음'}
+
+
+def iter_results(count: int, seed: int, analyzer: ScheduleAnalyzer):
+    """(이메일, 번역 데이터, 일정 배치, 일정 키) 생성 (이메일은 매번 새로 만들어 측정에 포함)"""
+    batch = analyzer.analyze_many([])
+    for email in build_corpus(count, seed):
+        email['date'] = 'Thu, 2 Oct 2025 04:15:03 +0900'
+        email['snippet'] = email['body'][:200]
+
+        translation_data = None
+        if email['body'].startswith(('Hello', 'The', 'Please', 'We', "Let's", 'Looking', 'Could')):
+            translated_subject = email['subject'] + ' (번역)'
+            translated_body = email['body'] + ' (번역)'
+            translation_data = {
+                'original_subject': email['subject'],
+                'original_body': email['body'],
+                'translated_subject': translated_subject,
+                'translated_body': translated_body,
+                'detected_language': 'en',
+                'is_translated': True
+            }
+
+        key = batch.add(email)
+        yield email, translation_data, batch, key
+
+
+def build_dicts(count: int, seed: int, analyzer: ScheduleAnalyzer):
+    """예전 방식의 결과 목록"""
+    results = []
+    for email, translation_data, batch, key in iter_results(count, seed, analyzer):
+        results.append({
+            'email': email,
+            'classification': 'tier1',
+            'explanation': EXPLANATION,
+            'details': dict(DETAILS),
+            'translation_data': translation_data,
+            'schedule_data': batch.to_schedule_data(key) if batch.has_schedule(key) else None
+        })
+    return results
+
+
+def build_records(count: int, seed: int, analyzer: ScheduleAnalyzer):
+    """ResultRecord 결과 목록"""
+    store = ResultStore()
+    for email, translation_data, batch, key in iter_results(count, seed, analyzer):
+        store.add(ResultRecord(email, 'tier1', EXPLANATION, dict(DETAILS), translation_data,
+                               batch.schedule_summary(key)))
+    return store
+
+
+def measure(label: str, build, count: int, seed: int, analyzer: ScheduleAnalyzer):
+    """결과 목록을 만든 뒤 남아 있는 메모리 출력"""
+    gc.collect()
+    tracemalloc.start()
+    results = build(count, seed, analyzer)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<8} {current / 1024 / 1024:>8.1f} MB  "
+          f"({current / count:>7,.0f} B/email, 최대 {peak / 1024 / 1024:.1f} MB)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='분류 결과 세션 메모리 측정')
+    parser.add_argument('--emails', type=int, default=10000, help='합성 이메일 수')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    args = parser.parse_args()
+
+    analyzer = ScheduleAnalyzer()
+
+    print("=" * 70)
+    print(f"분류 결과 세션 메모리 (합성 코퍼스 {args.emails:,}건)")
+    print("=" * 70)
+    measure("dict", build_dicts, args.emails, args.seed, analyzer)
+    measure("record", build_records, args.emails, args.seed, analyzer)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+일정 추출 처리량 측정 스크립트
+
+사용법:
+    python bench_schedule.py [--emails 5000] [--seed 42]
+
+한국어/영어가 섞인 합성 이메일 코퍼스(상대 날짜 표현 포함)를 만들어
+ScheduleAnalyzer의 날짜/시간 추출 및 analyze_schedule 처리량(emails/sec)을 측정한다.
+비교를 위해 예전 방식(패턴별 re.finditer 10회)의 처리량도 함께 출력한다.
+예전 방식은 상대 날짜('다음주 화요일', 'next Friday')를 찾지 못하므로 매칭 수가 다를 수 있다.
+"""
+import argparse
+import random
+import re
+import time
+from datetime import datetime
+
+from schedule_analyzer import ScheduleAnalyzer
+
+# 예전 방식: 패턴마다 따로 전체 텍스트를 스캔
+LEGACY_DATE_PATTERNS = [
+    r'(\d{4})[년\-\/](\d{1,2})[월\-\/](\d{1,2})[일]?',
+    r'(\d{1,2})[월\-\/](\d{1,2})[일]?',
+    r'(\d{1,2})[일]',
+    r'(\d{4})[년\-\/](\d{1,2})[월\-\/](\d{1,2})',
+    r'(\d{1,2})[\/\-](\d{1,2})',
+]
+LEGACY_TIME_PATTERNS = [
+    r'(\d{1,2}):(\d{2})',
+    r'(\d{1,2})시\s*(\d{1,2})분?',
+    r'(\d{1,2})시',
+    r'오전\s*(\d{1,2}):?(\d{1,2})?',
+    r'오후\s*(\d{1,2}):?(\d{1,2})?',
+]
+
+KO_SENTENCES = [
+    "안녕하세요, 브랜드 마케팅 담당자입니다.",
+    "신제품 리뷰 영상 협찬을 제안드립니다.",
+    "촬영은 {month}월 {day}일 오후 {hour}시에 진행하려고 합니다.",
+    "콘텐츠 업로드 마감은 {year}년 {month}월 {day}일입니다.",
+    "미팅은 {hour}:30에 화상회의로 진행됩니다.",
+    "고정 광고비 {fee}만원과 판매 수수료 10%를 드립니다.",
+    "{day}일까지 회신 부탁드립니다.",
+    "일정 확인 후 연락 부탁드립니다.",
+    "{weekday_ko} 오후 {hour}시에 미팅 가능하실까요?",
+    "업로드는 {relative_ko}까지 부탁드립니다.",
+]
+
+EN_SENTENCES = [
+    "Hello, we would love to collaborate with you on our new campaign.",
+    "The shoot is planned for {month}/{day} at {hour}:00.",
+    "Please upload the video before the deadline on {year}-{month}-{day}.",
+    "We offer a fixed fee plus commission on sales.",
+    "Let's schedule a call to discuss the partnership details.",
+    "Looking forward to hearing from you.",
+    "Could we have a call {relative_en} at {hour}pm?",
+    "Please submit the draft by {month_en} {day}th.",
+]
+
+KO_RELATIVE = ['내일', '모레', '다음주 화요일', '이번 주 금요일', '이번 달 말', '다음 달 {day}일', '3일 후', '2주 뒤']
+EN_RELATIVE = ['tomorrow', 'next Friday', 'this Monday', 'end of the month', 'in 2 weeks', 'next week']
+MONTHS_EN = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+             'August', 'September', 'October', 'November', 'December']
+WEEKDAYS_KO = ['월요일', '화요일', '수요일', '목요일', '금요일', '다음주 수요일', '이번 주 목요일']
+
+
+def build_corpus(count: int, seed: int):
+    """합성 이메일 코퍼스 생성"""
+    rng = random.Random(seed)
+    emails = []
+    for i in range(count):
+        sentences = KO_SENTENCES if rng.random() < 0.7 else EN_SENTENCES
+        picked = [rng.choice(sentences) for _ in range(rng.randint(4, 12))]
+        body = ' '.join(
+            sentence.format(
+                year=2025,
+                month=rng.randint(1, 12),
+                day=rng.randint(1, 28),
+                hour=rng.randint(1, 12),
+                fee=rng.randint(10, 500),
+                month_en=rng.choice(MONTHS_EN),
+                weekday_ko=rng.choice(WEEKDAYS_KO),
+                relative_ko=rng.choice(KO_RELATIVE).format(day=rng.randint(1, 28)),
+                relative_en=rng.choice(EN_RELATIVE),
+            )
+            for sentence in picked
+        )
+        emails.append({
+            'id': f'msg{i:06d}',
+            'subject': f'협찬 제안 #{i}',
+            'sender': 'brand@example.com',
+            'body': body,
+        })
+    return emails
+
+
+def legacy_scan(text: str) -> int:
+    """예전 방식의 날짜/시간 스캔 (매칭 수 반환)"""
+    found = 0
+    for pattern in LEGACY_DATE_PATTERNS + LEGACY_TIME_PATTERNS:
+        for _ in re.finditer(pattern, text):
+            found += 1
+    return found
+
+
+def measure(label: str, func, emails):
+    """emails 전체에 func를 적용하고 처리량 출력"""
+    start = time.perf_counter()
+    found = 0
+    for email in emails:
+        found += func(email)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<28} {len(emails) / elapsed:>10,.0f} emails/sec  (매칭 {found:,}개)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='일정 추출 처리량 측정')
+    parser.add_argument('--emails', type=int, default=5000, help='합성 이메일 수')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    args = parser.parse_args()
+
+    emails = build_corpus(args.emails, args.seed)
+    now = datetime.now()
+
+    def combined(email):
+        return f"{email['subject']} {email['body']}"
+
+    print("=" * 70)
+    print(f"일정 추출 처리량 (합성 코퍼스 {len(emails):,}건)")
+    print("=" * 70)
+    measure("legacy (패턴별 finditer)", lambda e: legacy_scan(combined(e)), emails)
+    # 측정마다 새 분석기를 만들어 상대 날짜 해석 캐시가 빈 상태에서 시작
+    analyzer = ScheduleAnalyzer()
+    measure("single-pass scan", lambda e: sum(map(len, analyzer.scan(combined(e), now))), emails)
+    analyzer = ScheduleAnalyzer()
+    measure("analyze_schedule (건별)", lambda e: int(analyzer.analyze_schedule(e, now)['has_schedule']), emails)
+
+    analyzer = ScheduleAnalyzer()
+    start = time.perf_counter()
+    batch = analyzer.analyze_many(emails, now)
+    elapsed = time.perf_counter() - start
+    print(f"  {'analyze_many (배치)':<28} {len(emails) / elapsed:>10,.0f} emails/sec  "
+          f"(일정 {len(batch.scheduled_keys()):,}건, 추출 {len(batch.kinds):,}행)")
+
+
+if __name__ == "__main__":
+    main()
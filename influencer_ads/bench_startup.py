@@ -0,0 +1,110 @@
+"""
+앱 시작/재실행 비용 측정 스크립트
+
+사용법:
+    python bench_startup.py [--reruns 20]
+
+1) 모듈 import 시간: 새 파이썬 프로세스에서 각 모듈을 import 하는 데 걸리는 시간
+   - eager: 예전 app.py가 최상단에서 import 하던 모듈 묶음
+   - lazy : 현재 app.py가 최상단에서 import 하는 모듈 묶음
+2) 클라이언트 생성 비용: token.pickle 로드 + build('gmail', 'v1')를
+   재실행마다 반복하는 경우와 한 번만 수행(캐시)하는 경우 비교
+   (token.pickle 이 없으면 건너뜀)
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+# 예전 app.py 최상단 import 목록 (클라이언트 모듈이 끌고 오던 의존성 포함)
+EAGER_IMPORTS = [
+    'streamlit',
+    'dotenv',
+    'requests',
+    'pandas',
+    'google.auth.transport.requests',
+    'google_auth_oauthlib.flow',
+    'googleapiclient.discovery',
+]
+
+# 현재 app.py 최상단 import 목록 (나머지는 실제 사용 시점에 로드)
+LAZY_IMPORTS = [
+    'streamlit',
+    'dotenv',
+]
+
+
+def measure_import(modules, repeat=3):
+    """새 프로세스에서 모듈 묶음을 import 하는 시간(ms) 측정 (최소값)"""
+    code = (
+        "import time\n"
+        "t = time.perf_counter()\n"
+        + "".join(f"import {m}\n" for m in modules)
+        + "print((time.perf_counter() - t) * 1000)\n"
+    )
+    best = None
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, '-c', code],
+            capture_output=True, text=True
+        )
+        if result.returncode != 0:
+            missing = result.stderr.strip().splitlines()[-1] if result.stderr else 'unknown'
+            return None, missing
+        elapsed = float(result.stdout.strip())
+        best = elapsed if best is None else min(best, elapsed)
+    return best, None
+
+
+def measure_client_build(reruns):
+    """클라이언트 생성 비용 측정 (재실행마다 생성 vs 1회 생성)"""
+    if not os.path.exists('token.pickle'):
+        print("  token.pickle 없음 - 클라이언트 생성 측정 건너뜀")
+        return
+
+    from gmail_client import GmailClient
+
+    start = time.perf_counter()
+    for _ in range(reruns):
+        GmailClient()
+    uncached = (time.perf_counter() - start) * 1000
+
+    cached_client = None
+    start = time.perf_counter()
+    for _ in range(reruns):
+        if cached_client is None:
+            cached_client = GmailClient()
+    cached = (time.perf_counter() - start) * 1000
+
+    print(f"  재실행 {reruns}회, 매번 생성 : {uncached:8.1f} ms")
+    print(f"  재실행 {reruns}회, 캐시 사용 : {cached:8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='앱 시작/재실행 비용 측정')
+    parser.add_argument('--reruns', type=int, default=20, help='재실행 시뮬레이션 횟수')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("모듈 import 시간 (새 프로세스, 3회 중 최소값)")
+    print("=" * 60)
+    eager_ms, eager_err = measure_import(EAGER_IMPORTS)
+    lazy_ms, lazy_err = measure_import(LAZY_IMPORTS)
+
+    if eager_err or lazy_err:
+        print(f"  측정 실패 (패키지 미설치?): {eager_err or lazy_err}")
+    else:
+        print(f"  eager : {eager_ms:8.1f} ms  ({', '.join(EAGER_IMPORTS)})")
+        print(f"  lazy  : {lazy_ms:8.1f} ms  ({', '.join(LAZY_IMPORTS)})")
+        print(f"  감소  : {eager_ms - lazy_ms:8.1f} ms ({(1 - lazy_ms / eager_ms) * 100:.0f}%)")
+
+    print()
+    print("=" * 60)
+    print("Gmail 클라이언트 생성 비용")
+    print("=" * 60)
+    measure_client_build(args.reruns)
+
+
+if __name__ == "__main__":
+    main()
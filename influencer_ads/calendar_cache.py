@@ -0,0 +1,171 @@
+import os
+import json
+import tempfile
+import threading
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 로컬 캘린더 이벤트 캐시 파일
+CACHE_FILE = 'calendar_cache.json'
+
+# 종일 일정(date만 있는 이벤트)을 해석할 시간대
+LOCAL_TIMEZONE = 'Asia/Seoul'
+
+
+def zone_info(name: str = LOCAL_TIMEZONE):
+    """시간대 이름에 해당하는 tzinfo (zoneinfo가 없으면 고정 +09:00)"""
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(name)
+    except Exception:
+        return timezone(timedelta(hours=9))
+
+
+_LOCAL_TZ = zone_info()
+
+
+def parse_event_time(value: Optional[Dict]) -> Optional[datetime]:
+    """이벤트의 start/end 필드를 시간대 정보가 있는 datetime으로 변환
+
+    {'dateTime': '2024-01-15T14:00:00+09:00'} 또는 종일 일정 {'date': '2024-01-15'}
+    """
+    if not value:
+        return None
+    if value.get('dateTime'):
+        parsed = datetime.fromisoformat(value['dateTime'].replace('Z', '+00:00'))
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=_LOCAL_TZ)
+    if value.get('date'):
+        return datetime.fromisoformat(value['date']).replace(tzinfo=_LOCAL_TZ)
+    return None
+
+
+def to_aware(value: datetime, tzinfo=None) -> datetime:
+    """시간대 정보가 없는 datetime은 tzinfo(기본값은 로컬 시간대)로 간주"""
+    return value if value.tzinfo else value.replace(tzinfo=tzinfo or _LOCAL_TZ)
+
+
+class CalendarEventCache:
+    """Calendar API 이벤트의 로컬 사본과 증분 동기화 토큰
+
+    CalendarClient.sync_events가 변경분(syncToken)만 받아 apply로 반영하고,
+    다가오는 일정 조회는 시작 시각 순 인덱스에서 이진 탐색으로 처리한다.
+    """
+
+    def __init__(self, cache_file: str = CACHE_FILE):
+        """
+        Args:
+            cache_file: 캐시를 저장할 JSON 파일
+        """
+        self.cache_file = cache_file
+        self.events: Dict[str, Dict] = {}
+        self.sync_token: Optional[str] = None
+        self.synced_at: Optional[str] = None
+        # (시작 시각, 이벤트 ID, 종료 시각) 정렬 목록 (변경 후 처음 조회할 때 다시 만듦)
+        self._by_start: Optional[List[Tuple[datetime, str, datetime]]] = None
+        # _by_start 앞에서부터의 최대 종료 시각 (진행 중인 일정의 시작 위치 이진 탐색용)
+        self._max_ends: List[datetime] = []
+        self._lock = threading.RLock()
+        self.load()
+
+    def load(self):
+        """캐시 파일 로드 (없거나 손상되면 빈 캐시)"""
+        with self._lock:
+            if not os.path.exists(self.cache_file):
+                return
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.events = data.get('events', {})
+                self.sync_token = data.get('sync_token')
+                self.synced_at = data.get('synced_at')
+                self._by_start = None
+            except Exception as e:
+                print(f"캘린더 캐시 로드 오류: {e}")
+                self.clear()
+
+    def save(self):
+        """캐시 파일 저장 (임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 기존 파일 유지)"""
+        with self._lock:
+            data = {
+                'sync_token': self.sync_token,
+                'synced_at': self.synced_at,
+                'events': self.events,
+            }
+            directory = os.path.dirname(os.path.abspath(self.cache_file))
+            try:
+                fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.calendar_cache_', suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(temp_path, self.cache_file)
+            except Exception as e:
+                print(f"캘린더 캐시 저장 오류: {e}")
+
+    def clear(self):
+        """모든 이벤트와 동기화 토큰 삭제 (전체 재동기화 전)"""
+        with self._lock:
+            self.events = {}
+            self.sync_token = None
+            self.synced_at = None
+            self._by_start = None
+
+    def apply(self, items: Iterable[Dict]) -> int:
+        """events.list 결과(변경분)를 반영하고 변경된 이벤트 수 반환
+
+        취소된 이벤트(status == 'cancelled')는 삭제하고 나머지는 추가/갱신한다.
+        """
+        changed = 0
+        with self._lock:
+            for event in items:
+                event_id = event.get('id')
+                if not event_id:
+                    continue
+                if event.get('status') == 'cancelled':
+                    if self.events.pop(event_id, None) is not None:
+                        changed += 1
+                else:
+                    self.events[event_id] = event
+                    changed += 1
+            if changed:
+                self._by_start = None
+            self.synced_at = datetime.now(timezone.utc).isoformat()
+        return changed
+
+    def upcoming(self, now: Optional[datetime] = None, max_results: int = 10) -> List[Dict]:
+        """아직 끝나지 않은(진행 중이거나 앞으로 시작하는) 이벤트를 시작 시각 순으로 반환"""
+        now = to_aware(now) if now else datetime.now(timezone.utc)
+        with self._lock:
+            index = self._index()
+            # 최대 종료 시각이 now 이하인 앞부분은 모두 끝난 일정이므로 건너뜀
+            position = bisect_right(self._max_ends, now)
+            result = []
+            for _, event_id, end in index[position:]:
+                if end > now:
+                    result.append(self.events[event_id])
+                    if len(result) == max_results:
+                        break
+            return result
+
+    def timed_events(self) -> List[Tuple[datetime, datetime, Dict]]:
+        """(시작, 종료, 이벤트) 목록 (시작 시각 순, 시각을 알 수 없는 이벤트 제외)"""
+        with self._lock:
+            result = []
+            for start, event_id, end in self._index():
+                result.append((start, end, self.events[event_id]))
+            return result
+
+    def _index(self) -> List[Tuple[datetime, str, datetime]]:
+        """시작 시각 순 인덱스 (self._lock 보유 상태에서 호출, 종료 시각이 없으면 시작 시각)"""
+        if self._by_start is None:
+            index = []
+            for event_id, event in self.events.items():
+                start = parse_event_time(event.get('start'))
+                if start is not None:
+                    index.append((start, event_id, parse_event_time(event.get('end')) or start))
+            index.sort()
+            max_ends = []
+            for _, _, end in index:
+                max_ends.append(max(max_ends[-1], end) if max_ends else end)
+            self._by_start = index
+            self._max_ends = max_ends
+        return self._by_start
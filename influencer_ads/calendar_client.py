@@ -1,16 +1,34 @@
 import os
-import pickle
-from datetime import datetime, timedelta
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-import streamlit as st
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Set
+from credential_broker import get_credential_broker
+from calendar_cache import LOCAL_TIMEZONE, CalendarEventCache
 
 # Google Calendar API 스코프
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# 캘린더 인증 토큰 파일
+TOKEN_FILE = 'calendar_token.pickle'
+
+# 이 앱이 만든 이벤트에 붙이는 비공개 확장 속성 (중복 추가 방지용)
+APP_PROPERTY = 'createdBy'
+APP_NAME = 'influencer_ads'
+SOURCE_PROPERTY = 'gmailMessageId'
+
+# 배치 요청 하나에 담을 최대 이벤트 수 (Calendar API 권장 상한)
+BATCH_SIZE = 50
+
+# 동기화(events.list)에서 받을 이벤트 필드
+SYNC_FIELDS = (
+    'nextPageToken,nextSyncToken,'
+    'items(id,status,summary,description,location,start,end,transparency,htmlLink,extendedProperties)'
+)
+
+# 전체 동기화(syncToken 없음)에서 받을 과거 일정 범위
+# 반복 일정을 펼쳐(singleEvents) 받으므로 기간을 제한하지 않으면 캘린더 전체 이력을 받게 됨
+FULL_SYNC_LOOKBACK = timedelta(days=30)
+
 class CalendarClient:
     """Google Calendar API 클라이언트"""
     
@@ -18,75 +36,55 @@ class CalendarClient:
         """캘린더 클라이언트 초기화"""
         self.service = None
         self.credentials = None
+        # 로컬 이벤트 캐시 (syncToken으로 변경분만 받아 갱신)
+        self.cache = CalendarEventCache()
+        self._sync_lock = threading.Lock()
         
     def authenticate(self):
-        """Google Calendar API 인증"""
+        """Google Calendar API 인증 (토큰 로드/갱신은 공유 CredentialBroker가 담당)"""
         try:
-            # 기존 토큰 확인
-            if os.path.exists('calendar_token.pickle'):
-                with open('calendar_token.pickle', 'rb') as token:
-                    self.credentials = pickle.load(token)
-            
-            # 토큰이 없거나 유효하지 않은 경우
-            if not self.credentials or not self.credentials.valid:
-                if self.credentials and self.credentials.expired and self.credentials.refresh_token:
-                    self.credentials.refresh(Request())
-                else:
-                    if not os.path.exists('credentials.json'):
-                        raise FileNotFoundError("credentials.json 파일을 찾을 수 없습니다.")
-                    
-                    flow = InstalledAppFlow.from_client_secrets_file(
-                        'credentials.json', SCOPES)
-                    self.credentials = flow.run_local_server(port=0)
-                
-                # 토큰 저장
-                with open('calendar_token.pickle', 'wb') as token:
-                    pickle.dump(self.credentials, token)
-            
-            # 서비스 빌드
-            self.service = build('calendar', 'v3', credentials=self.credentials)
+            broker = get_credential_broker()
+            self.credentials = broker.get_credentials(TOKEN_FILE, SCOPES)
+            self.service = broker.build_service(
+                'calendar', 'v3', token_file=TOKEN_FILE, scopes=SCOPES
+            )
             return True
             
         except Exception as e:
+            import streamlit as st
             st.error(f"캘린더 인증 실패: {str(e)}")
             return False
     
-    def create_event(self, title, description, start_datetime, end_datetime=None, location=None):
-        """캘린더 이벤트 생성"""
+    def create_event(self, title, description, start_datetime, end_datetime=None, location=None, source_id=None):
+        """캘린더 이벤트 생성
+        
+        source_id(Gmail 메시지 ID)를 주면 이벤트에 태그로 저장하고,
+        같은 메시지로 이미 만든 이벤트가 있으면 새로 만들지 않는다.
+        """
+        from googleapiclient.errors import HttpError
+        
         try:
             if not self.service:
                 if not self.authenticate():
                     return {'success': False, 'message': '캘린더 인증에 실패했습니다.'}
             
-            # 종료 시간이 없으면 시작 시간 + 1시간으로 설정
-            if not end_datetime:
-                if isinstance(start_datetime, str):
-                    start_dt = datetime.fromisoformat(start_datetime.replace('Z', '+00:00'))
-                else:
-                    start_dt = start_datetime
-                end_dt = start_dt + timedelta(hours=1)
-            else:
-                if isinstance(end_datetime, str):
-                    end_dt = datetime.fromisoformat(end_datetime.replace('Z', '+00:00'))
-                else:
-                    end_dt = end_datetime
+            if source_id:
+                existing = self.service.events().list(
+                    calendarId='primary',
+                    privateExtendedProperty=f'{SOURCE_PROPERTY}={source_id}',
+                    maxResults=1,
+                    fields='items(id,htmlLink)'
+                ).execute().get('items', [])
+                if existing:
+                    return {
+                        'success': True,
+                        'message': f'이미 캘린더에 있는 일정입니다: {title}',
+                        'event_id': existing[0]['id'],
+                        'event_link': existing[0].get('htmlLink', ''),
+                        'skipped': True
+                    }
             
-            # 이벤트 생성
-            event = {
-                'summary': title,
-                'description': description,
-                'start': {
-                    'dateTime': start_datetime.isoformat() if isinstance(start_datetime, datetime) else start_datetime,
-                    'timeZone': 'Asia/Seoul',
-                },
-                'end': {
-                    'dateTime': end_dt.isoformat() if isinstance(end_dt, datetime) else end_datetime,
-                    'timeZone': 'Asia/Seoul',
-                },
-            }
-            
-            if location:
-                event['location'] = location
+            event = self._build_event(title, description, start_datetime, end_datetime, location, source_id)
             
             # 이벤트 추가
             created_event = self.service.events().insert(
@@ -102,44 +100,289 @@ class CalendarClient:
             }
             
         except HttpError as e:
-            error_msg = f"캘린더 API 오류: {str(e)}"
-            if e.resp.status == 403:
-                error_msg += "\n캘린더 API 권한이 없습니다. Google Cloud Console에서 Calendar API를 활성화하세요."
-            return {'success': False, 'message': error_msg}
+            return {'success': False, 'message': self._http_error_message(e)}
             
         except Exception as e:
             return {'success': False, 'message': f'일정 추가 실패: {str(e)}'}
     
-    def get_upcoming_events(self, max_results=10):
-        """다가오는 이벤트 조회"""
+    def create_events_batch(self, items: List[Dict]) -> Dict:
+        """
+        여러 이벤트를 배치 요청으로 한 번에 추가 (이미 추가된 이메일은 건너뜀)
+        
+        Args:
+            items: [{'source_id', 'title', 'description', 'start', 'end'}, ...]
+                   source_id는 Gmail 메시지 ID
+        
+        Returns:
+            {'success', 'message', 'results': [{'source_id', 'title', 'status', 'message', ...}]}
+            status는 'created', 'skipped', 'failed' 중 하나이며 results는 입력 순서를 따른다.
+        """
+        from googleapiclient.errors import HttpError
+        
+        if not items:
+            return {'success': True, 'message': '추가할 일정이 없습니다.', 'results': []}
+        
         try:
             if not self.service:
                 if not self.authenticate():
-                    return {'success': False, 'events': [], 'message': '캘린더 인증에 실패했습니다.'}
+                    return {'success': False, 'message': '캘린더 인증에 실패했습니다.', 'results': []}
+            
+            results = [{'source_id': item['source_id'], 'title': item['title']} for item in items]
+            
+            # 대상 기간의 기존 이벤트를 한 번만 조회해 이미 추가된 메시지 확인
+            starts = [self._to_datetime(item['start']) for item in items]
+            ends = [self._to_datetime(item['end']) if item.get('end') else start + timedelta(hours=1)
+                    for item, start in zip(items, starts)]
+            existing = self.get_existing_source_ids(min(starts), max(ends))
+            
+            pending = {}
+            for index, item in enumerate(items):
+                source_id = item['source_id']
+                if source_id in existing:
+                    results[index].update({'status': 'skipped', 'message': '이미 캘린더에 있는 일정입니다.'})
+                elif source_id in pending:
+                    results[index].update({'status': 'skipped', 'message': '같은 이메일이 목록에 중복되어 있습니다.'})
+                else:
+                    pending[source_id] = index
+            
+            def on_response(request_id, response, exception):
+                index = pending[request_id]
+                if exception is not None:
+                    message = self._http_error_message(exception) if isinstance(exception, HttpError) else str(exception)
+                    results[index].update({'status': 'failed', 'message': message})
+                else:
+                    results[index].update({
+                        'status': 'created',
+                        'message': '캘린더에 일정이 추가되었습니다.',
+                        'event_id': response['id'],
+                        'event_link': response.get('htmlLink', '')
+                    })
+            
+            source_ids = list(pending)
+            for chunk_start in range(0, len(source_ids), BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=on_response)
+                for source_id in source_ids[chunk_start:chunk_start + BATCH_SIZE]:
+                    item = items[pending[source_id]]
+                    event = self._build_event(
+                        item['title'], item.get('description', ''), item['start'], item.get('end'),
+                        item.get('location'), source_id
+                    )
+                    batch.add(self.service.events().insert(calendarId='primary', body=event), request_id=source_id)
+                batch.execute()
+            
+            counts = {status: sum(1 for result in results if result.get('status') == status)
+                      for status in ('created', 'skipped', 'failed')}
+            return {
+                'success': counts['failed'] == 0,
+                'message': f"추가 {counts['created']}건, 건너뜀 {counts['skipped']}건, 실패 {counts['failed']}건",
+                'results': results
+            }
             
-            # 현재 시간
-            now = datetime.utcnow().isoformat() + 'Z'
+        except HttpError as e:
+            return {'success': False, 'message': self._http_error_message(e), 'results': []}
             
-            # 이벤트 조회
-            events_result = self.service.events().list(
+        except Exception as e:
+            return {'success': False, 'message': f'일정 일괄 추가 실패: {str(e)}', 'results': []}
+    
+    def get_existing_source_ids(self, start: datetime, end: datetime) -> Set[str]:
+        """기간 안에 이 앱이 만든 이벤트들의 Gmail 메시지 ID 집합"""
+        source_ids = set()
+        page_token = None
+        
+        while True:
+            response = self.service.events().list(
                 calendarId='primary',
-                timeMin=now,
-                maxResults=max_results,
+                timeMin=self._to_rfc3339(start - timedelta(days=1)),
+                timeMax=self._to_rfc3339(end + timedelta(days=1)),
+                privateExtendedProperty=f'{APP_PROPERTY}={APP_NAME}',
                 singleEvents=True,
-                orderBy='startTime'
+                maxResults=2500,
+                pageToken=page_token,
+                fields='nextPageToken,items(extendedProperties/private)'
             ).execute()
             
-            events = events_result.get('items', [])
+            for event in response.get('items', []):
+                source_id = event.get('extendedProperties', {}).get('private', {}).get(SOURCE_PROPERTY)
+                if source_id:
+                    source_ids.add(source_id)
+            
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return source_ids
+    
+    def _build_event(self, title, description, start_datetime, end_datetime=None, location=None,
+                     source_id: Optional[str] = None) -> Dict:
+        """events.insert 요청 본문 생성"""
+        # 종료 시간이 없으면 시작 시간 + 1시간으로 설정
+        if not end_datetime:
+            end_dt = self._to_datetime(start_datetime) + timedelta(hours=1)
+        else:
+            end_dt = self._to_datetime(end_datetime)
+        
+        event = {
+            'summary': title,
+            'description': description,
+            'start': {
+                'dateTime': start_datetime.isoformat() if isinstance(start_datetime, datetime) else start_datetime,
+                'timeZone': 'Asia/Seoul',
+            },
+            'end': {
+                'dateTime': end_dt.isoformat(),
+                'timeZone': 'Asia/Seoul',
+            },
+        }
+        
+        if location:
+            event['location'] = location
+        
+        if source_id:
+            event['extendedProperties'] = {
+                'private': {APP_PROPERTY: APP_NAME, SOURCE_PROPERTY: source_id}
+            }
+        
+        return event
+    
+    @staticmethod
+    def _to_datetime(value) -> datetime:
+        """ISO 문자열 또는 datetime을 datetime으로 변환"""
+        if isinstance(value, str):
+            return datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return value
+    
+    @staticmethod
+    def _to_rfc3339(value: datetime) -> str:
+        """events.list의 timeMin/timeMax 형식 (시간대가 없으면 UTC로 표기, 조회 기간을 하루씩 넓혀 오차 흡수)"""
+        return value.isoformat() if value.tzinfo else value.isoformat() + 'Z'
+    
+    @staticmethod
+    def _http_error_message(error) -> str:
+        """Calendar API HttpError를 사용자 메시지로 변환"""
+        error_msg = f"캘린더 API 오류: {str(error)}"
+        if error.resp.status == 403:
+            error_msg += "\n캘린더 API 권한이 없습니다. Google Cloud Console에서 Calendar API를 활성화하세요."
+        return error_msg
+    
+    def sync_events(self) -> Dict:
+        """
+        로컬 이벤트 캐시를 Calendar API와 동기화
+        
+        저장된 syncToken이 있으면 그 이후 변경분만 받고, 토큰이 만료되면(410)
+        캐시를 비우고 전체 목록을 다시 받는다.
+        
+        Returns:
+            {'success', 'message', 'changed': 반영된 이벤트 수, 'full_sync': 전체 동기화 여부}
+        """
+        from googleapiclient.errors import HttpError
+        
+        with self._sync_lock:
+            try:
+                if not self.service:
+                    if not self.authenticate():
+                        return {'success': False, 'message': '캘린더 인증에 실패했습니다.', 'changed': 0, 'full_sync': False}
+                
+                full_sync = self.cache.sync_token is None
+                try:
+                    changed = self._sync(self.cache.sync_token)
+                except HttpError as e:
+                    if e.resp.status != 410:
+                        raise
+                    # syncToken 만료: 전체 재동기화
+                    self.cache.clear()
+                    full_sync = True
+                    changed = self._sync(None)
+                
+                return {
+                    'success': True,
+                    'message': f'캘린더 동기화 완료 (변경 {changed}건)',
+                    'changed': changed,
+                    'full_sync': full_sync
+                }
+                
+            except HttpError as e:
+                return {'success': False, 'message': self._http_error_message(e), 'changed': 0, 'full_sync': False}
+                
+            except Exception as e:
+                return {'success': False, 'message': f'캘린더 동기화 실패: {str(e)}', 'changed': 0, 'full_sync': False}
+    
+    def _sync(self, sync_token: Optional[str]) -> int:
+        """events.list를 끝까지 페이지 순회하며 캐시에 반영
+        
+        sync_token이 있으면 그 이후 변경분만 받는다. 없으면 FULL_SYNC_LOOKBACK 전 이후에
+        끝나는 일정만 전체 목록으로 받는다 (timeMin은 첫 요청에만 쓸 수 있고 syncToken
+        요청에는 함께 쓸 수 없음). 정렬과 조회는 캐시에서 처리한다.
+        """
+        changed = 0
+        page_token = None
+        
+        if sync_token:
+            base_params = {'syncToken': sync_token}
+        else:
+            base_params = {'timeMin': self._to_rfc3339(datetime.now(timezone.utc) - FULL_SYNC_LOOKBACK)}
+        
+        while True:
+            params = {
+                'calendarId': 'primary',
+                'singleEvents': True,
+                'maxResults': 2500,
+                'fields': SYNC_FIELDS,
+                **base_params,
+            }
+            if page_token:
+                params['pageToken'] = page_token
+            
+            response = self.service.events().list(**params).execute()
+            changed += self.cache.apply(response.get('items', []))
+            
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+        
+        # 마지막 페이지에만 nextSyncToken이 있음
+        self.cache.sync_token = response.get('nextSyncToken')
+        self.cache.save()
+        return changed
+    
+    def get_upcoming_events(self, max_results=10):
+        """다가오는 이벤트 조회 (변경분만 동기화한 뒤 로컬 캐시에서 조회)"""
+        try:
+            sync_result = self.sync_events()
+            if not sync_result['success'] and not self.cache.synced_at:
+                return {'success': False, 'events': [], 'message': sync_result['message']}
+            
+            events = self.cache.upcoming(max_results=max_results)
+            message = f'{len(events)}개의 다가오는 일정을 찾았습니다.'
+            if not sync_result['success']:
+                # 동기화에 실패해도 마지막으로 받은 캐시는 보여줌
+                message += f" (동기화 실패로 {self.cache.synced_at} 기준 캐시 표시)"
             
             return {
                 'success': True,
                 'events': events,
-                'message': f'{len(events)}개의 다가오는 일정을 찾았습니다.'
+                'message': message
             }
             
         except Exception as e:
             return {'success': False, 'events': [], 'message': f'일정 조회 실패: {str(e)}'}
     
+    def busy_index(self, timezone: str = LOCAL_TIMEZONE):
+        """
+        캐시된 캘린더 일정으로 만든 겹침 조회 인덱스 (schedule_conflicts.BusyIndex)
+        
+        이미 인증했거나 저장된 토큰이 있을 때만 변경분을 동기화하고(새 인증 창을 띄우지 않음),
+        그 외에는 마지막으로 받은 캐시를 그대로 사용한다.
+        
+        Args:
+            timezone: 조회할 일정(시간대 정보 없음)의 시간대 (ScheduleAnalyzer와 같은 값)
+        """
+        from schedule_conflicts import BusyIndex
+        
+        if self.service or os.path.exists(TOKEN_FILE):
+            sync_result = self.sync_events()
+            if not sync_result['success']:
+                print(f"캘린더 동기화 오류: {sync_result['message']}")
+        
+        return BusyIndex(self.cache.timed_events(), timezone)
+    
     def generate_calendar_link(self, title, description, start_datetime, end_datetime=None, location=None):
         """Google Calendar 링크 생성 (인증 없이)"""
         try:
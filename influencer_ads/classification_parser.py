@@ -0,0 +1,288 @@
+import re
+import json
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 분류 카테고리 정의
+CATEGORIES = {
+    'tier1': '1단계: 고정 금액 (영상 제작 및 게시)',
+    'tier2': '2단계: 고정 금액 + 조회수 기반 수익',
+    'tier3': '3단계: 고정 금액 + 조회수 기반 수익 + 제품 판매 수수료',
+    'not_sponsorship': '협찬 요청이 아님',
+    'unclear': '정보 불충분 (추가 확인 필요)'
+}
+
+# 모델이 카테고리 대신 쓰는 표현 → 카테고리
+CATEGORY_ALIASES = {
+    '1단계': 'tier1', 'tier 1': 'tier1',
+    '2단계': 'tier2', 'tier 2': 'tier2',
+    '3단계': 'tier3', 'tier 3': 'tier3',
+    '협찬 아님': 'not_sponsorship', '협찬 요청이 아님': 'not_sponsorship', '협찬아님': 'not_sponsorship',
+    'not sponsorship': 'not_sponsorship', 'not-sponsorship': 'not_sponsorship',
+    '불명확': 'unclear', '정보 불충분': 'unclear', '분류 불가': 'unclear',
+}
+
+# 예전 줄 형식의 항목 이름 (대소문자, 한국어 이름 허용)
+_SECTION_LABELS = {
+    'category': 'category', '카테고리': 'category', '분류': 'category', '분류 결과': 'category',
+    'explanation': 'explanation', '설명': 'explanation', '분류 이유': 'explanation', '이유': 'explanation',
+    'details': 'details', '상세정보': 'details', '상세 정보': 'details', '세부 정보': 'details',
+    'confidence': 'confidence', '확신도': 'confidence', '신뢰도': 'confidence',
+}
+
+# "**CATEGORY:** tier2", "## 설명: ...", "- 카테고리 : 1단계" 등
+_SECTION_PATTERN = re.compile(
+    r'^[#>\s]*[-*•]?\s*(?P<label>' + '|'.join(sorted(map(re.escape, _SECTION_LABELS), key=len, reverse=True))
+    + r')\s*[:：]\s*(?P<value>.*)$',
+    re.IGNORECASE
+)
+_DETAIL_PATTERN = re.compile(r'^[-*•]\s*(?P<key>[^:：]+?)\s*[:：]\s*(?P<value>.*)$')
+_MARKDOWN_PATTERN = re.compile(r'\*\*|__|`')
+_CODE_FENCE_PATTERN = re.compile(r'```(?:json)?\s*(.*?)```', re.DOTALL | re.IGNORECASE)
+
+_PROMPT_BODY = """당신은 인플루언서의 협찬 요청 이메일을 분석하고 분류하는 전문 AI 어시스턴트입니다.
+
+이메일을 읽고 다음 3가지 카테고리 중 하나로 분류하세요:
+
+**1단계 (tier1)**: 고정 금액만 지급
+- 영상을 만들어 게시하면 정해진 금액을 받는 형태
+- 조회수나 판매량과 무관하게 고정 비용만 지급
+- 예: "영상 1개당 100만원 지급", "고정 광고비 50만원"
+
+**2단계 (tier2)**: 고정 금액 + 조회수 기반 추가 수익
+- 기본 금액 + 조회수/뷰에 따른 추가 보상
+- 판매 수수료는 없음
+- 예: "기본 50만원 + 조회수 1만당 5만원 추가", "CPM 기반 수익 배분"
+
+**3단계 (tier3)**: 고정 금액 + 조회수 수익 + 제품 판매 수수료
+- 기본 금액 + 조회수 보상 + 제품 판매 시 커미션
+- 가장 복합적인 수익 구조
+- 예: "기본료 + 조회수 보상 + 판매액의 10% 수수료", "affiliate 링크를 통한 판매 수익 공유"
+
+**not_sponsorship**: 협찬 요청이 아닌 경우
+
+**unclear**: 정보가 불충분하여 분류가 어려운 경우
+"""
+
+_JSON_FORMAT = """
+반드시 아래 형식의 JSON 객체 하나로만 응답하세요 (코드 블록이나 다른 문장 없이):
+
+{"category": "tier1|tier2|tier3|not_sponsorship|unclear", "confidence": 0.0~1.0 사이의 분류 확신도, "explanation": "분류 이유를 한국어로 2-3문장으로 설명", "details": {"고정금액": "금액 또는 명시 안됨", "조회수보상": "있음/없음 및 상세", "판매수수료": "있음/없음 및 상세", "제품/서비스": "무엇인지", "특이사항": "기타 주목할 내용"}}
+"""
+
+_LEGACY_FORMAT = """
+반드시 아래 형식으로 정확하게 응답해주세요:
+
+CATEGORY: [tier1/tier2/tier3/not_sponsorship/unclear]
+CONFIDENCE: [0.0~1.0 사이의 분류 확신도]
+EXPLANATION: [분류 이유를 한국어로 2-3문장으로 설명]
+DETAILS:
+- 고정금액: [금액 또는 "명시 안됨"]
+- 조회수보상: [있음/없음 및 상세]
+- 판매수수료: [있음/없음 및 상세]
+- 제품/서비스: [무엇인지]
+- 특이사항: [기타 주목할 내용]
+"""
+
+# 응답을 해석하지 못했을 때 다시 요청하는 횟수
+PARSE_RETRIES = 1
+
+# 응답을 해석하지 못했을 때 같은 대화에 이어 보내는 재요청
+RETRY_PROMPT = ("응답 형식을 해석할 수 없습니다. 위 분류 결과를 category, explanation, details 키를 가진 "
+                "JSON 객체 하나로만 다시 작성하세요. category는 tier1, tier2, tier3, not_sponsorship, unclear 중 하나입니다.")
+
+
+def get_system_prompt(json_mode: bool = True) -> str:
+    """분류 시스템 프롬프트 (json_mode면 JSON 응답, 아니면 예전 줄 형식)"""
+    return _PROMPT_BODY + (_JSON_FORMAT if json_mode else _LEGACY_FORMAT)
+
+
+def normalize_category(value) -> Optional[str]:
+    """카테고리 표현 → CATEGORIES 키 (알 수 없으면 None)"""
+    text = _MARKDOWN_PATTERN.sub('', str(value or '')).strip().strip('[]()"\'.').strip()
+    key = text.lower()
+    if key in CATEGORIES:
+        return key
+    if key in CATEGORY_ALIASES:
+        return CATEGORY_ALIASES[key]
+    # "tier2 (고정 금액 + 조회수)", "2단계: 고정 금액 + 조회수" 등 앞부분만 일치
+    for name in CATEGORIES:
+        if key.startswith(name):
+            return name
+    for alias, name in CATEGORY_ALIASES.items():
+        if key.startswith(alias):
+            return name
+    return None
+
+
+def parse_confidence(value) -> Optional[float]:
+    """확신도 표현 ("0.8", "80%", 0.8) → 0.0~1.0 (해석할 수 없으면 None)"""
+    match = re.search(r'\d+(?:\.\d+)?', str(value if value is not None else ''))
+    if match is None:
+        return None
+    confidence = float(match.group())
+    if confidence > 1:
+        # 퍼센트로 쓴 경우
+        confidence /= 100
+    return min(confidence, 1.0)
+
+
+def _parse_json(result: str) -> Optional[Tuple[str, str, Dict, Optional[float]]]:
+    """JSON 응답 파싱 및 검증 (JSON이 아니거나 카테고리가 잘못되면 None)"""
+    fenced = _CODE_FENCE_PATTERN.search(result)
+    text = fenced.group(1) if fenced else result
+    start, end = text.find('{'), text.rfind('}')
+    if start < 0 or end <= start:
+        return None
+    try:
+        data = json.loads(text[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    category = normalize_category(data.get('category'))
+    if category is None:
+        return None
+
+    explanation = data.get('explanation') or ''
+    if isinstance(explanation, list):
+        explanation = ' '.join(map(str, explanation))
+
+    details = {}
+    raw_details = data.get('details')
+    if isinstance(raw_details, dict):
+        for key, value in raw_details.items():
+            if isinstance(value, list):
+                value = ', '.join(map(str, value))
+            details[str(key).strip()] = '' if value is None else str(value).strip()
+    return category, str(explanation).strip(), details, parse_confidence(data.get('confidence'))
+
+
+def _parse_lines(result: str) -> Tuple[Optional[str], str, Dict, Optional[float]]:
+    """예전 줄 형식 응답 파싱 (마크다운 강조, 한국어 항목 이름, 여러 줄 설명 허용)"""
+    category = None
+    confidence = None
+    explanation_lines = []
+    details = {}
+    section = None
+    last_detail = None
+
+    for raw_line in result.strip().split('\n'):
+        line = _MARKDOWN_PATTERN.sub('', raw_line).strip()
+        if not line:
+            continue
+
+        match = _SECTION_PATTERN.match(line)
+        if match:
+            section = _SECTION_LABELS[match.group('label').lower()]
+            value = match.group('value').strip()
+            if section == 'category':
+                category = normalize_category(value) or category
+            elif section == 'confidence':
+                confidence = parse_confidence(value)
+            elif section == 'explanation' and value:
+                explanation_lines.append(value)
+            last_detail = None
+            continue
+
+        if section == 'details':
+            detail = _DETAIL_PATTERN.match(line)
+            if detail:
+                last_detail = detail.group('key').strip()
+                details[last_detail] = detail.group('value').strip()
+            elif last_detail is not None and raw_line[:1].isspace():
+                # 앞 항목 값이 들여쓴 다음 줄로 이어진 경우
+                details[last_detail] = (details[last_detail] + ' ' + line).strip()
+            else:
+                # 상세 정보 뒤에 붙은 설명 문장
+                explanation_lines.append(line.lstrip('-*• '))
+        elif section == 'explanation':
+            # 설명이 여러 줄인 경우
+            explanation_lines.append(line)
+
+    return category, ' '.join(explanation_lines), details, confidence
+
+
+def parse_classification_result(result: str) -> Tuple[Optional[str], str, Dict, Optional[float], str]:
+    """
+    분류 응답 파싱 (JSON을 먼저 시도하고, 아니면 예전 줄 형식으로 해석)
+
+    Returns:
+        (카테고리, 설명, 상세정보, 확신도, 형식) 튜플
+        확신도는 응답에 없으면 None
+        형식은 'json', 'legacy', 'failed' 중 하나이며 'failed'면 카테고리는 None
+    """
+    result = result or ''
+    parsed = _parse_json(result)
+    if parsed is not None:
+        return (*parsed, 'json')
+
+    category, explanation, details, confidence = _parse_lines(result)
+    if category is None:
+        return None, explanation, details, confidence, 'failed'
+    return category, explanation, details, confidence, 'legacy'
+
+
+class ParseStats:
+    """응답 형식별 집계 (재요청 횟수로 낭비된 LLM 호출 확인)
+
+    분류기 인스턴스는 여러 세션 스레드가 공유하므로 잠금으로 보호한다.
+    parent를 주면 같은 값을 parent에도 기록한다 (세션 집계 → 프로세스 전체 집계).
+    """
+
+    FIELDS = ('requests', 'json', 'legacy', 'retries', 'failed')
+
+    def __init__(self, parent: Optional['ParseStats'] = None):
+        self._lock = threading.Lock()
+        self._counts = {field: 0 for field in self.FIELDS}
+        self.parent = parent
+
+    def record(self, field: str):
+        """항목 1 증가"""
+        with self._lock:
+            self._counts[field] += 1
+        if self.parent is not None:
+            self.parent.record(field)
+
+    def snapshot(self) -> Dict[str, int]:
+        """현재 집계 복사본"""
+        with self._lock:
+            return dict(self._counts)
+
+
+def classify_with_retry(chat: Callable[[List[Dict], float], str], messages: List[Dict],
+                        stats: ParseStats, retries: int = PARSE_RETRIES
+                        ) -> Tuple[str, str, Dict, Optional[float], str]:
+    """
+    분류 요청 후 응답 파싱 (해석할 수 없으면 같은 대화에 형식 재요청)
+
+    Args:
+        chat: (메시지 목록, temperature) → 응답 텍스트
+        messages: 시스템 프롬프트와 이메일 내용 메시지
+        stats: 형식별 집계
+        retries: 최대 재요청 횟수
+
+    Returns:
+        (카테고리, 설명, 상세정보, 확신도, 형식) 튜플 (끝내 해석하지 못하면 'unclear', 형식 'failed')
+    """
+    stats.record('requests')
+    result = chat(messages, 0.3)
+    category, explanation, details, confidence, mode = parse_classification_result(result)
+
+    for _ in range(retries):
+        if mode != 'failed':
+            break
+        stats.record('retries')
+        messages = messages + [
+            {"role": "assistant", "content": result},
+            {"role": "user", "content": RETRY_PROMPT}
+        ]
+        result = chat(messages, 0.0)
+        category, explanation, details, confidence, mode = parse_classification_result(result)
+
+    stats.record(mode)
+    if mode == 'failed':
+        print(f"분류 응답 해석 실패: {result[:200]!r}")
+        return 'unclear', explanation or result.strip(), details, confidence, mode
+    return category, explanation, details, confidence, mode
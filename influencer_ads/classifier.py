@@ -1,116 +1,169 @@
-import requests
-from typing import Dict, Tuple
 import os
-import uuid
-import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+from classification_parser import (
+    CATEGORIES, PARSE_RETRIES, ParseStats, classify_with_retry, get_system_prompt, parse_classification_result
+)
+from llm_backends import BackendRouter, BackendStats, create_backend, router_from_env
 
+# 앞 단계 결과를 받아들일 최소 확신도 (이보다 낮으면 다음 단계로 넘김)
+DEFAULT_MIN_CONFIDENCE = float(os.getenv('CASCADE_MIN_CONFIDENCE', '0.7'))
 
-class ClovaAPI:
-    """Naver HyperCLOVA API 클라이언트 (최신 v3 API)"""
-    
-    def __init__(self, api_key: str, request_id: str):
-        # Naver CLOVA Studio API Key (Naver Cloud Platform > CLOVA Studio에서 발급)
-        self.api_key = api_key
-        # 요청 추적을 위한 고유 ID (자동 생성됨)
-        self.request_id = request_id
-        # HyperCLOVA X 최신 API 엔드포인트 (v3)
-        self.host = "https://clovastudio.stream.ntruss.com"
-        self.api_url = f"{self.host}/v3/chat-completions/HCX-005"
+
+class CascadeTier:
+    """분류 단계 하나 (이 단계에서 쓸 백엔드 라우터와 결과를 받아들일 기준)"""
     
-    def chat(self, messages: list, temperature: float = 0.5, max_tokens: int = 1000) -> str:
+    def __init__(self, name: str, router: BackendRouter, min_confidence: float = DEFAULT_MIN_CONFIDENCE):
         """
-        HyperCLOVA Chat API 호출 (v3 API)
-        
         Args:
-            messages: 대화 메시지 리스트
-            temperature: 생성 다양성 (0.0~1.0)
-            max_tokens: 최대 토큰 수
-        
-        Returns:
-            생성된 응답 텍스트
+            name: 단계 이름 (집계 표시용)
+            router: 이 단계의 백엔드 라우터
+            min_confidence: 응답 확신도가 이보다 낮으면 다음 단계로 넘김 (마지막 단계는 무시)
         """
-        # v3 API는 Authorization Bearer 토큰 방식 사용
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",  # Bearer 토큰 형식
-            "X-NCP-CLOVASTUDIO-REQUEST-ID": self.request_id,  # 요청 추적 ID
-            "Content-Type": "application/json; charset=utf-8"
+        self.name = name
+        self.router = router
+        self.min_confidence = min_confidence
+
+
+class CascadeStats:
+    """단계별 처리 수, 다음 단계로 넘긴 수, 오류 수, 응답 시간, 예상 비용 집계
+    
+    실제 트래픽에서 확신도 기준과 단계 구성을 조정할 때 쓴다.
+    parent를 주면 같은 값을 parent에도 기록한다 (세션 집계 → 프로세스 전체 집계).
+    """
+    
+    def __init__(self, tier_names: List[str], parent: Optional['CascadeStats'] = None):
+        self._lock = threading.Lock()
+        self._stats = {
+            name: {'calls': 0, 'accepted': 0, 'escalated': 0, 'errors': 0, 'latency_ms': 0.0, 'cost': 0.0}
+            for name in tier_names
         }
-        
-        # v3 API의 메시지 형식 변환
-        formatted_messages = []
-        for msg in messages:
-            formatted_messages.append({
-                "role": msg["role"],
-                "content": [{
-                    "type": "text",
-                    "text": msg["content"]
-                }]
-            })
-        
-        payload = {
-            "messages": formatted_messages,
-            "topP": 0.8,
-            "topK": 0,
-            "maxTokens": max_tokens,
-            "temperature": temperature,
-            "repetitionPenalty": 1.1,
-            "stop": [],
-            "includeAiFilters": True,
-            "seed": 0
+        self.parent = parent
+    
+    def record(self, tier: str, outcome: str, latency_ms: float, cost: float):
+        """단계 처리 결과 기록 (outcome: 'accepted', 'escalated', 'errors')"""
+        with self._lock:
+            stats = self._stats[tier]
+            stats['calls'] += 1
+            stats[outcome] += 1
+            stats['latency_ms'] += latency_ms
+            stats['cost'] += cost
+        if self.parent is not None:
+            self.parent.record(tier, outcome, latency_ms, cost)
+    
+    def snapshot(self) -> Dict[str, Dict]:
+        """단계별 집계 (평균 응답 시간, 다음 단계로 넘긴 비율 포함)"""
+        with self._lock:
+            return {
+                name: {
+                    **stats,
+                    'avg_latency_ms': stats['latency_ms'] / stats['calls'] if stats['calls'] else 0.0,
+                    'escalation_rate': stats['escalated'] / stats['calls'] if stats['calls'] else 0.0,
+                }
+                for name, stats in self._stats.items()
+            }
+
+
+class ClassificationStats:
+    """분류 요청 묶음(예: 세션 하나)의 응답 형식/백엔드/단계 집계
+
+    분류기는 여러 세션이 공유하므로 분류기 자체의 집계는 프로세스 전체 값이다.
+    세션별로 보여줄 값은 SponsorshipClassifier.new_stats()로 만든 이 객체에 따로 모은다.
+    """
+    
+    def __init__(self, parse: ParseStats, backends: BackendStats, cascade: CascadeStats):
+        self.parse = parse
+        self.backends = backends
+        self.cascade = cascade
+    
+    def snapshot(self) -> Dict[str, Dict]:
+        """{'parse': 응답 형식별, 'backends': 백엔드별, 'cascade': 단계별} 집계"""
+        return {
+            'parse': self.parse.snapshot(),
+            'backends': self.backends.snapshot(),
+            'cascade': self.cascade.snapshot(),
         }
-        
+
+
+def tiers_from_env(api_key: Optional[str] = None) -> List[CascadeTier]:
+    """
+    환경 변수로 분류 단계 구성
+    
+    CLASSIFIER_CASCADE: 싼/빠른 단계부터 쉼표로 구분한 백엔드 (예: 'mock,clova' 또는
+    'clova:HCX-DASH-002,clova:HCX-005'). 없으면 LLM_BACKENDS 라우터 한 단계만 사용한다.
+    생성에 실패한 단계(패키지 없음 등)는 건너뛴다. 같은 백엔드를 여러 단계에 써도 집계가
+    섞이지 않도록 단계 이름 앞에 순번을 붙인다 (예: '1:mock', '2:clova').
+    """
+    tiers = []
+    for spec in os.getenv('CLASSIFIER_CASCADE', '').split(','):
+        spec = spec.strip()
+        if not spec:
+            continue
         try:
-            response = requests.post(self.api_url, headers=headers, json=payload, timeout=30)
-            
-            if response.status_code == 200:
-                result_data = response.json()
-                # v3 API 응답 형식에 맞게 파싱
-                if 'result' in result_data and 'message' in result_data['result']:
-                    return result_data['result']['message']['content']
-                elif 'message' in result_data:
-                    # content가 배열 형태일 수 있음
-                    content = result_data['message'].get('content', '')
-                    if isinstance(content, list) and len(content) > 0:
-                        return content[0].get('text', '')
-                    return str(content)
-                else:
-                    return str(result_data)
-            else:
-                # 상세한 오류 정보 출력
-                error_detail = f"Status: {response.status_code}, Response: {response.text}"
-                raise Exception(f"API 오류: {error_detail}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"네트워크 오류: {str(e)}")
+            tiers.append(CascadeTier(f'{len(tiers) + 1}:{spec}', BackendRouter([create_backend(spec, api_key)])))
+        except Exception as e:
+            print(f"분류 단계 생성 오류 ({spec}): {e}")
+    if not tiers:
+        tiers.append(CascadeTier('default', router_from_env(api_key)))
+    return tiers
 
 
 class SponsorshipClassifier:
-    """Naver HyperCLOVA를 사용하여 협찬 이메일을 분류하는 클래스"""
+    """LLM으로 협찬 이메일을 분류하는 클래스
+    
+    프롬프트와 응답 파싱은 공통이고, 실제 호출은 llm_backends의 백엔드(CLOVA, OpenAI,
+    로컬 mock)가 맡는다. 어떤 백엔드를 어떤 순서로 쓸지는 BackendRouter가 정한다.
+    
+    단계(cascade)가 여러 개면 싼/빠른 단계부터 호출하고, 응답을 해석할 수 없거나
+    'unclear'이거나 확신도가 기준보다 낮을 때만 다음(더 강한) 단계로 넘긴다.
+    """
     
     # 분류 카테고리 정의
-    CATEGORIES = {
-        'tier1': '1단계: 고정 금액 (영상 제작 및 게시)',
-        'tier2': '2단계: 고정 금액 + 조회수 기반 수익',
-        'tier3': '3단계: 고정 금액 + 조회수 기반 수익 + 제품 판매 수수료',
-        'not_sponsorship': '협찬 요청이 아님',
-        'unclear': '정보 불충분 (추가 확인 필요)'
-    }
-    
-    def __init__(self, api_key: str):
+    CATEGORIES = CATEGORIES
+    
+    def __init__(self, api_key: str = None, json_mode: bool = True, router: Optional[BackendRouter] = None,
+                 tiers: Optional[List[CascadeTier]] = None):
         """
         Args:
-            api_key: Naver CLOVA Studio API 키 (환경 변수 CLOVA_STUDIO_KEY에서 로드)
+            api_key: Naver CLOVA Studio API 키 (clova 백엔드용, 환경 변수 CLOVA_STUDIO_KEY에서 로드)
+            json_mode: JSON 형식으로 응답 요청 (False면 예전 줄 형식 프롬프트)
+            router: 한 단계로 쓸 백엔드 라우터
+            tiers: 분류 단계 목록 (싼 단계부터, router와 tiers가 모두 없으면 환경 변수로 구성)
         """
         # API 키 저장 (Naver Cloud Platform > CLOVA Studio에서 발급받은 키)
         self.api_key = api_key
-        # 각 요청마다 고유한 UUID 생성
-        self.clova_api = ClovaAPI(api_key=api_key, request_id=str(uuid.uuid4()))
+        self.json_mode = json_mode
+        if tiers:
+            self.tiers = list(tiers)
+        elif router is not None:
+            self.tiers = [CascadeTier('default', router)]
+        else:
+            self.tiers = tiers_from_env(api_key)
+        names = [tier.name for tier in self.tiers]
+        if len(set(names)) != len(names):
+            raise ValueError(f"분류 단계 이름이 중복됩니다: {names}")
+        # 응답 형식별 집계 (JSON/예전 형식/재요청/실패, 프로세스 전체)
+        self.parse_stats = ParseStats()
+        # 단계별 처리/에스컬레이션/응답 시간/비용 집계 (프로세스 전체)
+        self.cascade_stats = CascadeStats([tier.name for tier in self.tiers])
+    
+    def new_stats(self) -> ClassificationStats:
+        """세션별 집계 (기록한 값은 분류기의 프로세스 전체 집계에도 더해짐)"""
+        return ClassificationStats(
+            ParseStats(parent=self.parse_stats),
+            BackendStats(),
+            CascadeStats([tier.name for tier in self.tiers], parent=self.cascade_stats),
+        )
     
-    def classify_email(self, email_data: Dict) -> Tuple[str, str, Dict]:
+    def classify_email(self, email_data: Dict, stats: Optional[ClassificationStats] = None) -> Tuple[str, str, Dict]:
         """
         이메일을 분류하고 상세 정보 추출
         
         Args:
             email_data: 이메일 데이터 (subject, sender, body 등)
+            stats: 세션별 집계 (없으면 프로세스 전체 집계에만 기록)
         
         Returns:
             (카테고리, 설명, 상세정보) 튜플
@@ -125,7 +178,7 @@ class SponsorshipClassifier:
 {email_data.get('body', email_data.get('snippet', ''))}
 """
         
-        # HyperCLOVA API 호출
+        # LLM 호출
         try:
             # 메시지 구성
             messages = [
@@ -139,88 +192,105 @@ class SponsorshipClassifier:
                 }
             ]
             
-            # API 호출 (매 요청마다 새로운 UUID 생성)
-            self.clova_api.request_id = str(uuid.uuid4())
-            result = self.clova_api.chat(messages, temperature=0.3, max_tokens=1000)
-            
-            # 결과 파싱
-            category, explanation, details = self._parse_classification_result(result)
-            
-            return category, explanation, details
+            # 단계별 호출 및 결과 파싱 (마지막 단계만 해석할 수 없는 응답에 형식 재요청)
+            return self._classify_cascade(messages, stats)
         
         except Exception as e:
             print(f"분류 오류: {str(e)}")
             return 'unclear', f'오류 발생: {str(e)}', {}
     
-    def _get_system_prompt(self) -> str:
-        """분류를 위한 시스템 프롬프트"""
-        return """당신은 인플루언서의 협찬 요청 이메일을 분석하고 분류하는 전문 AI 어시스턴트입니다.
-
-이메일을 읽고 다음 3가지 카테고리 중 하나로 분류하세요:
-
-**1단계 (tier1)**: 고정 금액만 지급
-- 영상을 만들어 게시하면 정해진 금액을 받는 형태
-- 조회수나 판매량과 무관하게 고정 비용만 지급
-- 예: "영상 1개당 100만원 지급", "고정 광고비 50만원"
-
-**2단계 (tier2)**: 고정 금액 + 조회수 기반 추가 수익
-- 기본 금액 + 조회수/뷰에 따른 추가 보상
-- 판매 수수료는 없음
-- 예: "기본 50만원 + 조회수 1만당 5만원 추가", "CPM 기반 수익 배분"
-
-**3단계 (tier3)**: 고정 금액 + 조회수 수익 + 제품 판매 수수료
-- 기본 금액 + 조회수 보상 + 제품 판매 시 커미션
-- 가장 복합적인 수익 구조
-- 예: "기본료 + 조회수 보상 + 판매액의 10% 수수료", "affiliate 링크를 통한 판매 수익 공유"
-
-**not_sponsorship**: 협찬 요청이 아닌 경우
-
-**unclear**: 정보가 불충분하여 분류가 어려운 경우
-
-반드시 아래 형식으로 정확하게 응답해주세요:
-
-CATEGORY: [tier1/tier2/tier3/not_sponsorship/unclear]
-EXPLANATION: [분류 이유를 한국어로 2-3문장으로 설명]
-DETAILS:
-- 고정금액: [금액 또는 "명시 안됨"]
-- 조회수보상: [있음/없음 및 상세]
-- 판매수수료: [있음/없음 및 상세]
-- 제품/서비스: [무엇인지]
-- 특이사항: [기타 주목할 내용]
-"""
+    def _classify_cascade(self, messages: List[Dict],
+                          stats: Optional[ClassificationStats] = None) -> Tuple[str, str, Dict]:
+        """싼 단계부터 호출하고, 결과를 받아들일 수 없으면 다음 단계로 넘김"""
+        parse_stats = stats.parse if stats else self.parse_stats
+        cascade_stats = stats.cascade if stats else self.cascade_stats
+        backend_stats = stats.backends if stats else None
+        for index, tier in enumerate(self.tiers):
+            is_last = index == len(self.tiers) - 1
+            responses = []
+            
+            def chat(tier_messages: list, temperature: float, tier=tier, responses=responses) -> str:
+                response = tier.router.complete(tier_messages, temperature=temperature, max_tokens=1000,
+                                                json_mode=self.json_mode, stats=backend_stats)
+                responses.append(response)
+                return response.text
+            
+            started = time.perf_counter()
+            try:
+                category, explanation, details, confidence, mode = classify_with_retry(
+                    chat, messages, parse_stats, retries=PARSE_RETRIES if is_last else 0
+                )
+            except Exception as e:
+                cascade_stats.record(tier.name, 'errors', (time.perf_counter() - started) * 1000,
+                                     sum(response.cost for response in responses))
+                if is_last:
+                    raise
+                print(f"분류 단계 오류 ({tier.name}), 다음 단계로 넘김: {e}")
+                continue
+            
+            escalate = not is_last and (
+                mode == 'failed'
+                or category == 'unclear'
+                or (confidence is not None and confidence < tier.min_confidence)
+            )
+            cascade_stats.record(tier.name, 'escalated' if escalate else 'accepted',
+                                 (time.perf_counter() - started) * 1000,
+                                 sum(response.cost for response in responses))
+            if not escalate:
+                return category, explanation, details
     
-    def _parse_classification_result(self, result: str) -> Tuple[str, str, Dict]:
-        """OpenAI 응답 파싱"""
-        lines = result.strip().split('\n')
-        
-        category = 'unclear'
-        explanation = ''
-        details = {}
+    def classify_many(self, emails: List[Dict],
+                      on_progress: Optional[Callable[[int, int], None]] = None,
+                      stats: Optional[ClassificationStats] = None) -> List[Tuple[str, str, Dict]]:
+        """
+        여러 이메일 분류 (입력 순서대로 결과 반환)
         
-        current_section = None
+        단계 백엔드가 허용하는 만큼(max_concurrency) 동시에 요청하고,
+        요청 간격은 백엔드가 조절한다.
         
-        for line in lines:
-            line = line.strip()
-            
-            if line.startswith('CATEGORY:'):
-                category = line.replace('CATEGORY:', '').strip()
-            elif line.startswith('EXPLANATION:'):
-                explanation = line.replace('EXPLANATION:', '').strip()
-            elif line.startswith('DETAILS:'):
-                current_section = 'details'
-            elif current_section == 'details' and line.startswith('-'):
-                # "- 키: 값" 형태 파싱
-                if ':' in line:
-                    key_value = line[1:].strip().split(':', 1)
-                    if len(key_value) == 2:
-                        key = key_value[0].strip()
-                        value = key_value[1].strip()
-                        details[key] = value
-            elif current_section is None and explanation:
-                # 설명이 여러 줄인 경우
-                explanation += ' ' + line
+        Args:
+            emails: 이메일 데이터 목록
+            on_progress: (완료 수, 전체 수)를 받는 콜백 (호출한 스레드에서 실행)
+            stats: 세션별 집계 (new_stats(), 없으면 프로세스 전체 집계에만 기록)
+        """
+        results = [None] * len(emails)
+        if not emails:
+            return results
         
-        return category, explanation, details
+        # 백엔드별 동시 요청 수는 백엔드가 제한하므로, 스레드 수는 가장 너그러운 단계 기준
+        concurrency = max(tier.router.primary.max_concurrency for tier in self.tiers)
+        workers = max(1, min(concurrency, len(emails)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.classify_email, email, stats): i for i, email in enumerate(emails)}
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                if on_progress:
+                    on_progress(done, len(emails))
+        return results
+    
+    def _get_system_prompt(self) -> str:
+        """분류를 위한 시스템 프롬프트"""
+        return get_system_prompt(self.json_mode)
+    
+    def _parse_classification_result(self, result: str) -> Tuple[str, str, Dict]:
+        """응답 파싱 (JSON 우선, 예전 줄 형식 허용, 해석할 수 없으면 'unclear')"""
+        category, explanation, details, _, _ = parse_classification_result(result)
+        return category or 'unclear', explanation, details
+    
+    def get_parse_stats(self) -> Dict[str, int]:
+        """응답 형식별 집계 (requests, json, legacy, retries, failed, 프로세스 전체)"""
+        return self.parse_stats.snapshot()
+    
+    def get_backend_stats(self) -> Dict[str, Dict]:
+        """백엔드별 호출 수, 오류 수, 토큰, 예상 비용, 평균 응답 시간 (모든 단계, 프로세스 전체)"""
+        stats = {}
+        for tier in self.tiers:
+            stats.update(tier.router.get_stats())
+        return stats
+    
+    def get_cascade_stats(self) -> Dict[str, Dict]:
+        """단계별 처리 수, 다음 단계로 넘긴 수/비율, 오류 수, 평균 응답 시간, 예상 비용 (프로세스 전체)"""
+        return self.cascade_stats.snapshot()
     
     def get_category_display_name(self, category: str) -> str:
         """카테고리 표시명 반환"""
@@ -0,0 +1,126 @@
+import re
+from typing import Dict, Optional, Tuple
+
+# 금액 표현: 숫자 + (천/백/십) + (만/억) 묶음이 이어진 것 ("1억 2천만원", "3천5백만", "1,000,000원")
+_AMOUNT_REGEX = r'(?:₩\s*)?(?:\d[\d,]*(?:\.\d+)?\s*[천백십]?\s*[만억]?\s*)+(?:원|₩)?'
+
+AMOUNT_PATTERN = re.compile(_AMOUNT_REGEX)
+_AMOUNT_TOKEN_PATTERN = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([천백십])?\s*([만억])?')
+
+# 조회수 보상: "1000회당 5천원", "조회수 1만회당 10만원", "CPM 3,000원", "조회수당 10원"
+VIEW_RATE_PATTERN = re.compile(
+    r'(?P<views>\d[\d,]*(?:\.\d+)?\s*[천만]?)\s*(?:회|뷰|조회수?)\s*당\s*(?P<rate>' + _AMOUNT_REGEX + r')'
+    r'|(?P<cpm>(?i:cpm))\s*[:은는]?\s*(?P<cpm_rate>' + _AMOUNT_REGEX + r')'
+    r'|조회수?\s*당\s*(?P<per_view>' + _AMOUNT_REGEX + r')'
+)
+
+# 판매 수수료: "판매액의 10%", "5~10 %" (범위는 하한), "수수료 7퍼센트"
+_PERCENT_UNIT = r'(?:%|퍼센트|프로)'
+PERCENT_PATTERN = re.compile(
+    r'(\d+(?:\.\d+)?)\s*' + _PERCENT_UNIT + r'?\s*~\s*\d+(?:\.\d+)?\s*' + _PERCENT_UNIT
+    + r'|(\d+(?:\.\d+)?)\s*' + _PERCENT_UNIT
+)
+
+_SMALL_UNITS = {'천': 1000, '백': 100, '십': 10}
+_LARGE_UNITS = {'만': 10_000, '억': 100_000_000}
+
+
+def parse_amount(text: str) -> Optional[int]:
+    """텍스트의 첫 번째 원화 금액 (원 단위 정수, 없으면 None)
+
+    '원'이나 만/억/천 단위가 붙은 숫자만 금액으로 본다 ("2회"의 2는 무시).
+    범위("50만~100만원")는 앞의 금액(하한)을 사용한다.
+    """
+    for match in AMOUNT_PATTERN.finditer(text or ''):
+        value = _amount_value(match.group())
+        if value is not None:
+            return value
+    return None
+
+
+def _amount_value(text: str) -> Optional[int]:
+    """금액 표현 하나를 원 단위로 변환 (단위/원 표시가 없으면 None)"""
+    tokens = _AMOUNT_TOKEN_PATTERN.findall(text)
+    has_unit = '원' in text or '₩' in text or any(small or large for _, small, large in tokens)
+    if not tokens or not has_unit:
+        return None
+
+    total = 0.0
+    section = 0.0
+    for number, small, large in tokens:
+        section += float(number.replace(',', '')) * _SMALL_UNITS.get(small, 1)
+        if large:
+            total += section * _LARGE_UNITS[large]
+            section = 0.0
+    return int(round(total + section))
+
+
+def _count_value(text: str) -> float:
+    """조회수 표현 ("1000", "1만", "10,000") → 숫자"""
+    text = text.replace(',', '').strip()
+    multiplier = 1
+    if text.endswith('만'):
+        multiplier, text = 10_000, text[:-1]
+    elif text.endswith('천'):
+        multiplier, text = 1000, text[:-1]
+    return float(text) * multiplier
+
+
+def _is_none(text: str) -> bool:
+    """'없음'으로 시작하는 항목 (보상이 없다고 명시됨)"""
+    return text.strip().startswith('없음')
+
+
+def parse_fixed_fee(text: str) -> Optional[int]:
+    """고정금액 → 원 (명시 안됨/해석 불가면 None, '없음'이면 0)"""
+    if not text:
+        return None
+    if _is_none(text):
+        return 0
+    return parse_amount(text)
+
+
+def parse_cpm(text: str) -> Optional[float]:
+    """조회수보상 → 1000회당 원 (CPM, 해석 불가면 None, '없음'이면 0)"""
+    if not text:
+        return None
+    if _is_none(text):
+        return 0.0
+
+    match = VIEW_RATE_PATTERN.search(text)
+    if match is None:
+        return None
+
+    if match.group('views'):
+        views = _count_value(match.group('views'))
+        rate = _amount_value(match.group('rate'))
+        if rate is None or not views:
+            return None
+        return rate * 1000 / views
+    if match.group('cpm'):
+        rate = _amount_value(match.group('cpm_rate'))
+        return float(rate) if rate is not None else None
+    rate = _amount_value(match.group('per_view'))
+    return rate * 1000.0 if rate is not None else None
+
+
+def parse_commission(text: str) -> Optional[float]:
+    """판매수수료 → 퍼센트 (해석 불가면 None, '없음'이면 0, 범위는 하한)"""
+    if not text:
+        return None
+    if _is_none(text):
+        return 0.0
+    match = PERCENT_PATTERN.search(text)
+    if match is None:
+        return None
+    return float(match.group(1) or match.group(2))
+
+
+def normalize_details(details: Dict) -> Tuple[Optional[int], Optional[float], Optional[float]]:
+    """분류기 DETAILS → (고정금액 원, 조회수보상 CPM 원, 판매수수료 %)"""
+    details = details or {}
+    return (
+        parse_fixed_fee(str(details.get('고정금액', '') or '')),
+        parse_cpm(str(details.get('조회수보상', '') or '')),
+        parse_commission(str(details.get('판매수수료', '') or '')),
+    )
@@ -0,0 +1,2 @@
+# test_clova_*.py는 import 시 바로 Clova API를 호출하는 수동 확인 스크립트이므로 pytest 수집에서 제외
+collect_ignore = ['test_clova_api.py', 'test_clova_v3.py']
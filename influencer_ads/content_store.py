@@ -0,0 +1,75 @@
+import os
+import zlib
+import hashlib
+import tempfile
+from typing import Iterator, Optional
+
+# 본문 저장 디렉터리
+CONTENT_DIR = 'email_bodies'
+
+
+class ContentStore:
+    """내용 주소 기반 압축 저장소 (SHA-256 해시 → zlib 압축 파일)
+
+    같은 본문은 같은 해시를 가지므로 한 번만 저장되고, 파일은 쓰고 나면 바뀌지 않으므로
+    여러 세션이 동시에 써도 잠금이 필요 없다. 해시 앞 2글자로 하위 디렉터리를 나눈다.
+    삭제는 참조를 기록하는 쪽(EmailManager)이 저장과 같은 DB 쓰기 잠금 안에서만 한다.
+    """
+
+    def __init__(self, directory: str = CONTENT_DIR):
+        """
+        Args:
+            directory: 압축 파일을 저장할 디렉터리
+        """
+        self.directory = directory
+
+    def _path(self, content_hash: str) -> str:
+        """해시에 해당하는 파일 경로"""
+        return os.path.join(self.directory, content_hash[:2], content_hash[2:] + '.z')
+
+    def put(self, text: str) -> str:
+        """본문을 저장하고 해시 반환 (이미 있으면 다시 쓰지 않음)"""
+        data = text.encode('utf-8')
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._path(content_hash)
+        if os.path.exists(path):
+            return content_hash
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(zlib.compress(data, 6))
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return content_hash
+
+    def get(self, content_hash: str) -> Optional[str]:
+        """해시에 해당하는 본문 (없으면 None)"""
+        try:
+            with open(self._path(content_hash), 'rb') as f:
+                return zlib.decompress(f.read()).decode('utf-8')
+        except FileNotFoundError:
+            return None
+
+    def hashes(self) -> Iterator[str]:
+        """저장된 본문의 해시 목록 (쓰는 중인 임시 파일 제외)"""
+        if not os.path.isdir(self.directory):
+            return
+        for prefix in os.listdir(self.directory):
+            subdir = os.path.join(self.directory, prefix)
+            if len(prefix) != 2 or not os.path.isdir(subdir):
+                continue
+            for name in os.listdir(subdir):
+                if name.endswith('.z'):
+                    yield prefix + name[:-2]
+
+    def delete(self, content_hash: str):
+        """본문 삭제 (다른 곳에서 참조하지 않는지는 호출하는 쪽에서 확인)"""
+        try:
+            os.remove(self._path(content_hash))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,243 @@
+import os
+import pickle
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+# 만료 몇 분 전에 미리 갱신할지
+REFRESH_MARGIN = timedelta(minutes=5)
+
+# 갱신 실패 시 재시도 간격 (초)
+RETRY_INTERVAL = 60
+
+
+class _TokenEntry:
+    """토큰 파일 하나에 대한 인증 정보와 갱신 상태"""
+
+    def __init__(self, token_file: str, scopes: List[str]):
+        self.token_file = token_file
+        self.scopes = scopes
+        self.credentials = None
+        # 같은 토큰에 대한 로드/갱신은 한 번에 하나의 스레드만 수행
+        self.lock = threading.Lock()
+        self.timer: Optional[threading.Timer] = None
+
+
+def _utcnow() -> datetime:
+    """현재 UTC 시각 (google-auth의 expiry와 같은 naive 형식)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class _BrokeredCredentials:
+    """AuthorizedHttp에 넘기는 인증 정보 대리 객체
+
+    AuthorizedHttp는 요청 전 만료됐거나 401을 받으면 인증 정보를 직접 갱신하는데,
+    그 갱신을 브로커로 돌려 토큰별 잠금 안에서만 일어나게 한다.
+    나머지 속성(token, valid, apply 등)은 현재 인증 정보를 그대로 따른다.
+    """
+
+    def __init__(self, broker: 'CredentialBroker', entry: _TokenEntry):
+        self._broker = broker
+        self._entry = entry
+
+    def __getattr__(self, name):
+        return getattr(self._entry.credentials, name)
+
+    def refresh(self, request):
+        """갱신 요청 (잠금을 기다리는 동안 다른 스레드가 갱신했으면 다시 갱신하지 않음)"""
+        credentials = self._entry.credentials
+        self._broker._refresh_entry(self._entry, credentials.token if credentials else None)
+
+    def before_request(self, request, method, url, headers):
+        """요청 헤더에 토큰 추가 (유효하지 않으면 브로커를 통해 먼저 갱신)"""
+        if not self.valid:
+            self.refresh(request)
+        self.apply(headers)
+
+
+class CredentialBroker:
+    """Gmail/Calendar 클라이언트가 공유하는 인증 정보 관리자
+
+    - 토큰 파일은 프로세스당 한 번만 로드
+    - 만료 전에 백그라운드 스레드에서 미리 갱신
+    - 토큰별 잠금으로 여러 스레드가 동시에 갱신 요청을 보내지 않도록 직렬화
+      (서비스의 AuthorizedHttp가 하는 갱신도 _BrokeredCredentials로 같은 잠금을 거침)
+    - 서비스는 라이브러리에 포함된 정적 discovery 문서로 빌드 (네트워크 조회 없음)
+    """
+
+    def __init__(self, client_secrets_file: str = 'credentials.json'):
+        self.client_secrets_file = client_secrets_file
+        self._entries: Dict[str, _TokenEntry] = {}
+        self._entries_lock = threading.Lock()
+
+    def get_credentials(self, token_file: str, scopes: List[str]):
+        """토큰 파일에 해당하는 유효한 인증 정보 반환"""
+        entry = self._get_entry(token_file, scopes)
+
+        with entry.lock:
+            if entry.credentials is None:
+                entry.credentials = self._load_credentials(entry)
+                self._schedule_refresh(entry)
+            elif not entry.credentials.valid:
+                # 백그라운드 갱신이 아직 돌지 않은 경우에만 요청 경로에서 갱신
+                self._refresh_locked(entry)
+            return entry.credentials
+
+    def build_service(self, api: str, version: str, token_file: str, scopes: List[str], http=None):
+        """정적 discovery 문서로 API 서비스 객체 생성
+
+        Args:
+            api: API 이름 (예: 'gmail', 'calendar')
+            version: API 버전 (예: 'v1', 'v3')
+            token_file: 토큰 파일 경로
+            scopes: 필요한 OAuth 스코프
+            http: 사용할 httplib2.Http 객체 (지정하지 않으면 새로 생성)
+        """
+        from google_auth_httplib2 import AuthorizedHttp
+        from googleapiclient.discovery import build_from_document
+        from googleapiclient.http import build_http
+
+        self.get_credentials(token_file, scopes)
+        credentials = _BrokeredCredentials(self, self._get_entry(token_file, scopes))
+        document = _load_discovery_document(api, version)
+        return build_from_document(
+            document, http=AuthorizedHttp(credentials, http=http if http is not None else build_http())
+        )
+
+    def invalidate(self, token_file: str):
+        """캐시된 인증 정보 폐기 (토큰 재설정 시 사용)"""
+        with self._entries_lock:
+            entry = self._entries.pop(token_file, None)
+
+        if entry:
+            with entry.lock:
+                if entry.timer:
+                    entry.timer.cancel()
+                entry.credentials = None
+
+    def _get_entry(self, token_file: str, scopes: List[str]) -> _TokenEntry:
+        """토큰 파일별 엔트리 조회 (없으면 생성)"""
+        with self._entries_lock:
+            entry = self._entries.get(token_file)
+            if entry is None:
+                entry = _TokenEntry(token_file, scopes)
+                self._entries[token_file] = entry
+            return entry
+
+    def _load_credentials(self, entry: _TokenEntry):
+        """토큰 파일 로드, 필요 시 갱신 또는 새 로그인 (entry.lock 보유 상태에서 호출)"""
+        from google.auth.transport.requests import Request
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        creds = None
+        if os.path.exists(entry.token_file):
+            with open(entry.token_file, 'rb') as token:
+                creds = pickle.load(token)
+
+        if creds and creds.valid:
+            return creds
+
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            if not os.path.exists(self.client_secrets_file):
+                raise FileNotFoundError(
+                    f"{self.client_secrets_file} 파일이 없습니다. "
+                    "Google Cloud Console에서 OAuth 2.0 클라이언트 ID를 생성하고 "
+                    "credentials.json 파일을 다운로드하세요."
+                )
+            flow = InstalledAppFlow.from_client_secrets_file(
+                self.client_secrets_file, entry.scopes)
+            creds = flow.run_local_server(port=0)
+
+        self._save_credentials(entry.token_file, creds)
+        return creds
+
+    def _refresh_entry(self, entry: _TokenEntry, stale_token: Optional[str]):
+        """요청 경로에서의 갱신 (stale_token이 이미 바뀌었으면 다른 스레드가 갱신한 것)"""
+        with entry.lock:
+            if entry.credentials is None:
+                # 토큰 재설정 후 남아 있던 서비스가 요청한 경우
+                entry.credentials = self._load_credentials(entry)
+                self._schedule_refresh(entry)
+            elif entry.credentials.token == stale_token or not entry.credentials.valid:
+                self._refresh_locked(entry)
+
+    def _refresh_locked(self, entry: _TokenEntry):
+        """토큰 갱신 후 저장 (entry.lock 보유 상태에서 호출)"""
+        from google.auth.transport.requests import Request
+
+        entry.credentials.refresh(Request())
+        self._save_credentials(entry.token_file, entry.credentials)
+        self._schedule_refresh(entry)
+
+    def _background_refresh(self, entry: _TokenEntry):
+        """타이머 스레드에서 실행되는 선제 갱신"""
+        with entry.lock:
+            creds = entry.credentials
+            if creds is None:
+                return
+
+            # 다른 스레드가 이미 갱신했다면 다음 일정만 다시 잡음
+            if creds.expiry and creds.expiry - _utcnow() > REFRESH_MARGIN:
+                self._schedule_refresh(entry)
+                return
+
+            try:
+                self._refresh_locked(entry)
+            except Exception as e:
+                print(f"토큰 백그라운드 갱신 오류 ({entry.token_file}): {e}")
+                self._start_timer(entry, RETRY_INTERVAL)
+
+    def _schedule_refresh(self, entry: _TokenEntry):
+        """만료 REFRESH_MARGIN 전에 갱신되도록 타이머 예약"""
+        creds = entry.credentials
+        if not creds or not creds.expiry or not creds.refresh_token:
+            return
+
+        # google-auth의 expiry는 UTC 기준 naive datetime
+        delay = (creds.expiry - REFRESH_MARGIN - _utcnow()).total_seconds()
+        self._start_timer(entry, max(delay, 0))
+
+    def _start_timer(self, entry: _TokenEntry, delay: float):
+        """갱신 타이머 시작 (기존 타이머는 취소)"""
+        if entry.timer:
+            entry.timer.cancel()
+        entry.timer = threading.Timer(delay, self._background_refresh, args=(entry,))
+        entry.timer.daemon = True
+        entry.timer.start()
+
+    @staticmethod
+    def _save_credentials(token_file: str, creds):
+        """인증 정보 저장"""
+        with open(token_file, 'wb') as token:
+            pickle.dump(creds, token)
+
+
+@lru_cache(maxsize=None)
+def _load_discovery_document(api: str, version: str) -> str:
+    """google-api-python-client에 포함된 정적 discovery 문서를 한 번만 읽음
+
+    build_from_document가 파싱된 dict를 수정하므로 문자열 상태로 캐시하고
+    빌드할 때마다 새로 파싱한다.
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+
+    content = get_static_doc(api, version)
+    if content is None:
+        raise ValueError(f"{api} {version}의 정적 discovery 문서를 찾을 수 없습니다.")
+    return content
+
+
+_broker: Optional[CredentialBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_credential_broker() -> CredentialBroker:
+    """프로세스 전역 CredentialBroker 반환"""
+    global _broker
+    with _broker_lock:
+        if _broker is None:
+            _broker = CredentialBroker()
+        return _broker
@@ -0,0 +1,220 @@
+import calendar
+import re
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+# 기본 시간대 (협찬 일정은 한국 시간 기준)
+DEFAULT_TIMEZONE = 'Asia/Seoul'
+
+KO_WEEKDAYS = {'월': 0, '화': 1, '수': 2, '목': 3, '금': 4, '토': 5, '일': 6}
+
+EN_WEEKDAYS = {
+    'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6,
+}
+
+EN_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# 상대 날짜 표현 (ScheduleAnalyzer가 한 번의 스캔에 사용하는 컴파일된 패턴의 일부)
+# 각 분기가 고정 글자로 시작해야 정규식 엔진이 매칭되지 않는 분기를 바로 건너뛰므로
+# 한국어 표현은 하나의 그룹으로 찾고 세부 해석은 resolve에서 문자열로 처리한다.
+KO_RELATIVE_REGEX = r"""
+    (?P<ko_relative>
+        오늘|내일|모레|글피                                                    # 내일
+      | (?:이번\s*주|금주|다음\s*주|차주|다다음\s*주)\s*[월화수목금토일]요일          # 다음주 화요일
+      | (?:이번\s*달|이달|다음\s*달|내달)\s*(?:말|초|\d{1,2}\s*일)                  # 이번 달 말, 다음 달 5일
+      | [월화수목금토일]요일                                                    # 금요일
+    )
+"""
+
+# 숫자로 시작하는 상대/영어 날짜 ("3일 후"는 날짜 패턴의 "N일" 분기에서 처리)
+NUMERIC_RELATIVE_REGEX = r"""
+    (?P<ko_offset>\d{1,3})\s*(?P<ko_offset_unit>주|개월)\s*(?:후|뒤)                                     # 2주 후
+  | (?P<en_day>\d{1,2})(?i:st|nd|rd|th)?\s+(?i:of\s+)?(?P<en_day_month>(?i:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-zA-Z]*\.?)(?:,?\s*(?P<en_day_year>\d{4}))?   # 10th of March
+"""
+
+# 영어 표현 (소문자로 바꾼 텍스트에 적용, 단독 요일은 오탐을 줄이기 위해 전체 이름만 인식)
+_EN_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+
+EN_RELATIVE_REGEX = r"""
+    (?=[adefijmnostw])(?<![a-z])
+    (?:
+        (?P<en_day_word>today|tonight|tomorrow)\b                                                 # tomorrow
+      | (?P<en_rel>this|next)\s+(?P<en_rel_wd>(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*)\b              # next friday
+      | (?P<en_month_name>""" + _EN_MONTH + r""")\s+(?P<en_month_day>\d{1,2})(?:st|nd|rd|th)?\b(?:,?\s*(?P<en_month_year>\d{4}))?   # march 10th
+      | (?P<en_eom>end)\s+of\s+(?:the\s+|this\s+)?(?P<en_eom_next>next\s+)?month\b                  # end of the month
+      | in\s+(?P<en_offset>\d{1,3})\s+(?P<en_offset_unit>day|week|month)s?\b                        # in 3 days
+      | next\s+(?P<en_next_unit>week|month)\b                                                       # next week
+      | (?P<en_wd>(?:mon|tues|wednes|thurs|fri|satur|sun)day)\b                                     # friday
+    )
+"""
+
+# 한국어 상대 표현 해석용 사전
+_KO_DAY_OFFSETS = {'오늘': 0, '내일': 1, '모레': 2, '글피': 3}
+_KO_WEEK_OFFSETS = {'이번주': 0, '금주': 0, '다음주': 1, '차주': 1, '다다음주': 2}
+_KO_MONTH_OFFSETS = {'이번달': 0, '이달': 0, '다음달': 1, '내달': 1}
+
+
+def _add_months(date: datetime, months: int) -> datetime:
+    """월 단위 이동 (말일을 넘으면 해당 월의 마지막 날로 보정)"""
+    month_index = date.month - 1 + months
+    year = date.year + month_index // 12
+    month = month_index % 12 + 1
+    return date.replace(year=year, month=month, day=min(date.day, _days_in_month(year, month)))
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """해당 월의 일 수"""
+    return calendar.monthrange(year, month)[1]
+
+
+def _en_weekday(word: str) -> Optional[int]:
+    """영어 요일 단어 → 요일 번호 (월=0), 요일이 아니면 None"""
+    weekday = EN_WEEKDAYS.get(word[:3].lower())
+    full_names = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+    lowered = word.lower()
+    if weekday is None or not (lowered == full_names[weekday][:len(lowered)] or lowered in ('tues', 'thur', 'thurs')):
+        return None
+    return weekday
+
+
+def _en_month(word: str) -> Optional[int]:
+    """영어 월 이름 → 월 번호, 월 이름이 아니면 None"""
+    lowered = word.rstrip('.').lower()
+    month = EN_MONTHS.get(lowered[:3])
+    full_names = ('january', 'february', 'march', 'april', 'may', 'june', 'july',
+                  'august', 'september', 'october', 'november', 'december')
+    if month is None or not (lowered == full_names[month - 1][:len(lowered)] or lowered == 'sept'):
+        return None
+    return month
+
+
+class RelativeDateResolver:
+    """'다음주 화요일', '이번 달 말', 'next Friday', 'by March 10th' 같은 표현을 날짜로 변환
+
+    기준 날짜와 시간대를 지정할 수 있으며, 연도가 생략된 날짜는
+    기준 날짜 이후 가장 가까운 날짜로 해석한다.
+    """
+
+    def __init__(self, timezone: str = DEFAULT_TIMEZONE):
+        self.timezone = timezone
+
+    def reference_now(self) -> datetime:
+        """설정된 시간대의 현재 시각 (다른 일정 데이터와 같이 시간대 정보 없는 datetime)"""
+        try:
+            from zoneinfo import ZoneInfo
+            return datetime.now(ZoneInfo(self.timezone)).replace(tzinfo=None)
+        except Exception:
+            return datetime.now()
+
+    @staticmethod
+    def upcoming(month: int, day: int, now: datetime) -> datetime:
+        """연도가 생략된 월/일을 기준 날짜 이후(당일 포함) 가장 가까운 날짜로 변환"""
+        if (month, day) < (now.month, now.day):
+            return datetime(now.year + 1, month, day)
+        return datetime(now.year, month, day)
+
+    @staticmethod
+    def upcoming_day(day: int, now: datetime) -> datetime:
+        """일만 있는 날짜를 이번 달 또는 (이미 지났으면) 다음 달의 날짜로 변환"""
+        if now.day <= day <= _days_in_month(now.year, now.month):
+            return datetime(now.year, now.month, day)
+
+        # 이번 달에 이미 지났거나 없는 날짜면 다음 달부터 해당 일이 있는 달을 찾음
+        candidate = _add_months(datetime(now.year, now.month, 1), 1)
+        for _ in range(12):
+            if day <= _days_in_month(candidate.year, candidate.month):
+                return candidate.replace(day=day)
+            candidate = _add_months(candidate, 1)
+        raise ValueError(f"{day}일에 해당하는 날짜가 없습니다.")
+
+    def resolve(self, groups: Dict, now: datetime) -> Optional[datetime]:
+        """상대 날짜 패턴의 매칭 그룹을 날짜로 변환 (해석할 수 없으면 None)"""
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        monday = today - timedelta(days=today.weekday())
+
+        if groups.get('ko_relative'):
+            return self._resolve_korean(re.sub(r'\s+', '', groups['ko_relative']), today, monday)
+
+        if groups.get('ko_offset'):
+            return self.offset(today, int(groups['ko_offset']), 'week' if groups['ko_offset_unit'] == '주' else 'month')
+
+        if groups.get('en_day'):
+            return self._month_day(groups['en_day_month'], groups['en_day'], groups['en_day_year'], now)
+
+        if groups.get('en_day_word'):
+            return today + timedelta(days=1 if groups['en_day_word'] == 'tomorrow' else 0)
+
+        if groups.get('en_rel'):
+            weekday = _en_weekday(groups['en_rel_wd'])
+            if weekday is None:
+                return None
+            weeks = 1 if groups['en_rel'] == 'next' else 0
+            return monday + timedelta(weeks=weeks, days=weekday)
+
+        if groups.get('en_month_name'):
+            return self._month_day(groups['en_month_name'], groups['en_month_day'], groups['en_month_year'], now)
+
+        if groups.get('en_eom'):
+            month_start = _add_months(today.replace(day=1), 1 if groups['en_eom_next'] else 0)
+            return month_start.replace(day=_days_in_month(month_start.year, month_start.month))
+
+        if groups.get('en_offset'):
+            return self.offset(today, int(groups['en_offset']), groups['en_offset_unit'])
+
+        if groups.get('en_next_unit'):
+            if groups['en_next_unit'] == 'week':
+                return monday + timedelta(weeks=1)
+            return _add_months(today.replace(day=1), 1)
+
+        if groups.get('en_wd'):
+            return self._next_weekday(today, _en_weekday(groups['en_wd']))
+
+        return None
+
+    def _resolve_korean(self, text: str, today: datetime, monday: datetime) -> Optional[datetime]:
+        """공백을 제거한 한국어 상대 표현 해석 ('다음주화요일', '이번달말' 등)"""
+        if text in _KO_DAY_OFFSETS:
+            return today + timedelta(days=_KO_DAY_OFFSETS[text])
+
+        if text.endswith('요일'):
+            weekday = KO_WEEKDAYS[text[-3]]
+            prefix = text[:-3]
+            if not prefix:  # '금요일'만 있으면 다가오는 금요일
+                return self._next_weekday(today, weekday)
+            return monday + timedelta(weeks=_KO_WEEK_OFFSETS[prefix], days=weekday)
+
+        prefix = '이달' if text.startswith('이달') else '내달' if text.startswith('내달') else text[:3]
+        month_start = _add_months(today.replace(day=1), _KO_MONTH_OFFSETS[prefix])
+        rest = text[len(prefix):]
+        if rest == '말':
+            return month_start.replace(day=_days_in_month(month_start.year, month_start.month))
+        if rest == '초':
+            return month_start
+        return month_start.replace(day=int(rest.rstrip('일')))
+
+    def _month_day(self, month_word: str, day: str, year: Optional[str], now: datetime) -> Optional[datetime]:
+        """영어 월 이름 + 일 (+ 연도) 변환"""
+        month = _en_month(month_word)
+        if month is None:
+            return None
+        if year:
+            return datetime(int(year), month, int(day))
+        return self.upcoming(month, int(day), now)
+
+    @staticmethod
+    def _next_weekday(today: datetime, weekday: int) -> datetime:
+        """오늘 이후(오늘 포함) 가장 가까운 해당 요일"""
+        return today + timedelta(days=(weekday - today.weekday()) % 7)
+
+    @staticmethod
+    def offset(now: datetime, amount: int, unit: str) -> datetime:
+        """N일/주/개월 후 ('day', 'week', 'month')"""
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if unit == 'day':
+            return today + timedelta(days=amount)
+        if unit == 'week':
+            return today + timedelta(weeks=amount)
+        return _add_months(today, amount)
@@ -1,28 +1,44 @@
 import os
-import pickle
 import json
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
 from typing import List, Dict, Optional
 from datetime import datetime
+from content_store import ContentStore
+
+# 찜 목록 필드 (SQLite 열 순서, 본문은 ContentStore에 두고 해시만 저장)
+FAVORITE_FIELDS = ('id', 'subject', 'sender', 'date', 'classification', 'explanation', 'added_date', 'body_hash')
 
 class EmailManager:
-    """이메일 찜, 회신 등의 추가 기능을 관리하는 클래스"""
+    """이메일 찜, 회신 등의 추가 기능을 관리하는 클래스
+    
+    찜 목록은 SQLite(favorites.db, WAL 모드)에 이메일 ID를 키로 저장하여
+    추가/삭제 시 해당 행만 트랜잭션으로 기록하고, 여러 세션이 동시에 써도 안전하다.
+    찜 여부는 메모리의 ID 집합으로 O(1)에 확인한다.
+    본문은 압축된 내용 주소 저장소(email_bodies/)에 따로 두고 펼칠 때만 읽는다.
+    본문 저장과 참조가 없어진 본문 삭제는 모두 DB 쓰기 잠금(BEGIN IMMEDIATE) 안에서 하므로
+    다른 프로세스가 같은 본문을 찜하는 도중에 파일이 지워지지 않는다.
+    """
     
     def __init__(self):
-        self.favorites_file = 'favorites.json'
+        self.favorites_db = 'favorites.db'
+        self.favorites_file = 'favorites.json'  # 예전 형식 (처음 실행 시 DB로 옮김)
         self.replies_file = 'reply_templates.json'
+        self._lock = threading.Lock()
+        self._conn = None
+        self.bodies = ContentStore()
         self.load_data()
     
     def load_data(self):
         """저장된 데이터 로드"""
-        # 찜 목록 로드
-        if os.path.exists(self.favorites_file):
-            try:
-                with open(self.favorites_file, 'r', encoding='utf-8') as f:
-                    self.favorites = json.load(f)
-            except:
-                self.favorites = []
-        else:
-            self.favorites = []
+        # 찜 목록 DB 연결 (ID만 메모리에 로드)
+        with self._lock:
+            self._conn = self._connect()
+            self._migrate_json_favorites()
+            self._sweep_bodies()
+            self._favorite_ids = {row[0] for row in self._conn.execute('SELECT id FROM favorites')}
         
         # 회신 템플릿 로드
         if os.path.exists(self.replies_file):
@@ -34,14 +50,106 @@ class EmailManager:
         else:
             self.reply_templates = self.get_default_templates()
     
-    def save_data(self):
-        """데이터 저장"""
+    def _connect(self) -> sqlite3.Connection:
+        """찜 목록 DB 연결 및 테이블 생성 (캐시된 인스턴스를 여러 세션 스레드가 공유)"""
+        conn = sqlite3.connect(self.favorites_db, timeout=10, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS favorites (
+                    id TEXT PRIMARY KEY,
+                    subject TEXT,
+                    sender TEXT,
+                    date TEXT,
+                    classification TEXT,
+                    explanation TEXT,
+                    added_date TEXT,
+                    body_hash TEXT
+                )"""
+            )
+            conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        self._migrate_inline_bodies(conn)
+        return conn
+    
+    @staticmethod
+    @contextmanager
+    def _write_transaction(conn: sqlite3.Connection):
+        """다른 프로세스의 쓰기와 직렬화되는 트랜잭션 (끝나면 커밋, 오류 시 롤백)"""
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            yield conn
+    
+    def _migrate_inline_bodies(self, conn: sqlite3.Connection):
+        """본문을 행에 직접 저장하던 예전 테이블의 본문을 ContentStore로 옮김"""
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(favorites)')}
+        if 'body' not in columns:
+            return
+        
+        with self._write_transaction(conn):
+            if 'body_hash' not in columns:
+                conn.execute('ALTER TABLE favorites ADD COLUMN body_hash TEXT')
+            rows = conn.execute("SELECT id, body FROM favorites WHERE body IS NOT NULL AND body != ''").fetchall()
+            for email_id, body in rows:
+                conn.execute('UPDATE favorites SET body_hash = ?, body = NULL WHERE id = ?',
+                             (self.bodies.put(body), email_id))
+    
+    def _migrate_json_favorites(self):
+        """예전 favorites.json 내용을 DB로 한 번만 옮김 (원본 파일은 그대로 둠)"""
+        if self._conn.execute("SELECT 1 FROM meta WHERE key = 'json_migrated'").fetchone():
+            return
+        
+        favorites = []
+        if os.path.exists(self.favorites_file):
+            try:
+                with open(self.favorites_file, 'r', encoding='utf-8') as f:
+                    favorites = json.load(f)
+            except Exception as e:
+                print(f"찜 목록 마이그레이션 오류: {e}")
+        
+        with self._write_transaction(self._conn):
+            self._conn.executemany(
+                f"INSERT OR IGNORE INTO favorites ({', '.join(FAVORITE_FIELDS)}) "
+                f"VALUES ({', '.join('?' for _ in FAVORITE_FIELDS)})",
+                [self._favorite_row(item, item.get('body', '')) for item in favorites if item.get('id')]
+            )
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_migrated', ?)",
+                               (datetime.now().isoformat(),))
+    
+    def _favorite_row(self, item: Dict, body: str) -> tuple:
+        """찜 항목을 DB 행으로 변환 (본문은 ContentStore에 저장하고 해시로 대체)"""
+        row = dict(item, body_hash=self.bodies.put(body) if body else None)
+        return tuple(row.get(field, '') for field in FAVORITE_FIELDS)
+    
+    def _sweep_bodies(self, hashes: Optional[List[str]] = None):
+        """
+        찜 목록에서 참조하지 않는 본문 삭제
+        
+        DB 쓰기 잠금을 잡은 채로 참조 여부를 확인하고 지우므로, 본문을 저장하고 행을
+        추가하는 중인 다른 세션/프로세스와 겹치지 않는다.
+        
+        Args:
+            hashes: 확인할 해시 목록 (None이면 저장소 전체)
+        """
+        try:
+            with self._write_transaction(self._conn):
+                referenced = {row[0] for row in self._conn.execute(
+                    'SELECT DISTINCT body_hash FROM favorites WHERE body_hash IS NOT NULL'
+                )}
+                for content_hash in list(self.bodies.hashes() if hashes is None else hashes):
+                    if content_hash not in referenced:
+                        self.bodies.delete(content_hash)
+        except Exception as e:
+            print(f"본문 정리 오류: {e}")
+    
+    def save_templates(self):
+        """회신 템플릿 저장 (임시 파일에 쓴 뒤 교체하여 중간에 끊겨도 기존 파일 유지)"""
         try:
-            with open(self.favorites_file, 'w', encoding='utf-8') as f:
-                json.dump(self.favorites, f, ensure_ascii=False, indent=2)
-            
-            with open(self.replies_file, 'w', encoding='utf-8') as f:
+            directory = os.path.dirname(os.path.abspath(self.replies_file))
+            fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.reply_templates_', suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
                 json.dump(self.reply_templates, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.replies_file)
         except Exception as e:
             print(f"데이터 저장 오류: {e}")
     
@@ -109,29 +217,67 @@ class EmailManager:
             'date': email_data.get('date', ''),
             'classification': classification,
             'explanation': explanation,
-            'added_date': datetime.now().isoformat(),
-            'body': email_data.get('body', email_data.get('snippet', ''))
+            'added_date': datetime.now().isoformat()
         }
+        body = email_data.get('body', email_data.get('snippet', ''))
         
-        # 중복 확인
-        if not any(item['id'] == favorite_item['id'] for item in self.favorites):
-            self.favorites.append(favorite_item)
-            self.save_data()
-            return True
-        return False
+        # 중복 확인 (다른 프로세스가 먼저 추가한 경우도 INSERT OR IGNORE로 처리)
+        if favorite_item['id'] in self._favorite_ids:
+            return False
+        
+        with self._lock:
+            try:
+                # 본문 저장과 행 추가를 한 쓰기 트랜잭션에서 (그 사이에 본문이 정리되지 않도록)
+                with self._write_transaction(self._conn):
+                    cursor = self._conn.execute(
+                        f"INSERT OR IGNORE INTO favorites ({', '.join(FAVORITE_FIELDS)}) "
+                        f"VALUES ({', '.join('?' for _ in FAVORITE_FIELDS)})",
+                        self._favorite_row(favorite_item, body)
+                    )
+            except Exception as e:
+                print(f"데이터 저장 오류: {e}")
+                return False
+            self._favorite_ids.add(favorite_item['id'])
+        return cursor.rowcount > 0
     
     def remove_from_favorites(self, email_id: str):
-        """찜 목록에서 제거"""
-        self.favorites = [item for item in self.favorites if item['id'] != email_id]
-        self.save_data()
+        """찜 목록에서 제거 (같은 본문을 가진 다른 찜이 없으면 본문도 정리)"""
+        with self._lock:
+            try:
+                with self._write_transaction(self._conn):
+                    row = self._conn.execute('SELECT body_hash FROM favorites WHERE id = ?', (email_id,)).fetchone()
+                    self._conn.execute('DELETE FROM favorites WHERE id = ?', (email_id,))
+            except Exception as e:
+                print(f"데이터 저장 오류: {e}")
+                return
+            self._favorite_ids.discard(email_id)
+            if row and row[0]:
+                self._sweep_bodies([row[0]])
     
     def get_favorites(self) -> List[Dict]:
-        """찜 목록 반환"""
-        return self.favorites
+        """찜 목록 반환 (추가한 순서, 다른 세션의 변경 사항 포함, 본문 제외)"""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(FAVORITE_FIELDS)} FROM favorites ORDER BY added_date"
+            ).fetchall()
+            self._favorite_ids = {row[0] for row in rows}
+        return [dict(zip(FAVORITE_FIELDS, row)) for row in rows]
+    
+    def get_favorite_body(self, email_id: str) -> str:
+        """찜한 이메일의 본문 (필요할 때만 압축 저장소에서 읽음)"""
+        with self._lock:
+            row = self._conn.execute('SELECT body_hash FROM favorites WHERE id = ?', (email_id,)).fetchone()
+        if not row or not row[0]:
+            return ''
+        return self.bodies.get(row[0]) or ''
+    
+    def favorite_count(self) -> int:
+        """찜한 이메일 수"""
+        return len(self._favorite_ids)
     
     def is_favorite(self, email_id: str) -> bool:
         """찜 여부 확인"""
-        return any(item['id'] == email_id for item in self.favorites)
+        return email_id in self._favorite_ids
     
     def get_reply_template(self, classification: str) -> Dict:
         """분류에 따른 회신 템플릿 반환"""
@@ -142,11 +288,15 @@ class EmailManager:
     
     def update_reply_template(self, classification: str, subject: str, body: str):
         """회신 템플릿 업데이트"""
-        self.reply_templates[classification] = {
+        template = {
             'subject': subject,
             'body': body
         }
-        self.save_data()
+        # 바뀐 내용이 있을 때만 저장
+        if self.reply_templates.get(classification) == template:
+            return
+        self.reply_templates[classification] = template
+        self.save_templates()
     
     def get_all_templates(self) -> Dict:
         """모든 회신 템플릿 반환"""
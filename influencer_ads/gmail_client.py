@@ -1,11 +1,13 @@
-import os
-import pickle
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 import base64
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from typing import List, Dict
+from credential_broker import get_credential_broker
+from gmail_quota import (
+    QuotaMeter, get_error_status, is_daily_limit_error, is_rate_limit_error
+)
 
 # Gmail API 스코프 설정
 SCOPES = [
@@ -13,43 +15,120 @@ SCOPES = [
     'https://www.googleapis.com/auth/gmail.send'
 ]
 
+# Gmail 인증 토큰 파일
+TOKEN_FILE = 'token.pickle'
+
+# 동시에 Gmail API를 호출할 작업자 수 기본값
+DEFAULT_CONCURRENCY = 4
+
+# 속도 제한(429) 오류 시 최대 재시도 횟수
+MAX_RATE_LIMIT_RETRIES = 5
+
+
+class GmailServicePool:
+    """작업자마다 독립된 Gmail 서비스 객체를 빌려주는 풀
+    
+    googleapiclient의 httplib2 전송 계층은 스레드 안전하지 않으므로
+    서비스 객체(= httplib2.Http 연결)를 스레드 간에 공유하지 않고
+    checkout/checkin으로 한 번에 한 작업자만 사용하도록 한다.
+    """
+    
+    def __init__(self, token_file: str = TOKEN_FILE, size: int = DEFAULT_CONCURRENCY):
+        self.token_file = token_file
+        self.size = max(1, size)
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+    
+    def checkout(self, timeout: float = None):
+        """서비스 객체 대여 (여유가 없으면 반납될 때까지 대기)"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.size
+            if can_create:
+                self._created += 1
+        
+        if can_create:
+            try:
+                return self._build_service()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        
+        return self._idle.get(timeout=timeout)
+    
+    def checkin(self, service):
+        """대여한 서비스 객체 반납"""
+        self._idle.put(service)
+    
+    @contextmanager
+    def lease(self, timeout: float = None):
+        """with 문으로 서비스 객체를 대여하고 자동 반납"""
+        service = self.checkout(timeout)
+        try:
+            yield service
+        finally:
+            self.checkin(service)
+    
+    def _build_service(self):
+        """전용 httplib2.Http 연결을 가진 서비스 객체 생성"""
+        import httplib2
+        return get_credential_broker().build_service(
+            'gmail', 'v1', token_file=self.token_file, scopes=SCOPES,
+            http=httplib2.Http()
+        )
+
 
 class GmailClient:
     """Gmail API를 사용하여 이메일을 가져오는 클라이언트"""
     
-    def __init__(self):
-        self.service = None
+    def __init__(self, token_file: str = TOKEN_FILE, concurrency: int = DEFAULT_CONCURRENCY,
+                 account: str = 'default'):
+        """
+        Args:
+            token_file: Gmail 인증 토큰 파일
+            concurrency: 동시에 API를 호출할 작업자 수 (서비스 풀 크기)
+            account: 계정 이름 (여러 계정을 함께 처리할 때 결과 구분용)
+        """
+        self.token_file = token_file
+        self.concurrency = max(1, concurrency)
+        self.account = account
+        self.quota = QuotaMeter(account)
+        self.pool = None
         self.authenticate()
     
     def authenticate(self):
-        """Gmail API 인증 처리"""
-        creds = None
-        
-        # token.pickle 파일이 있으면 기존 인증 정보 로드
-        if os.path.exists('token.pickle'):
-            with open('token.pickle', 'rb') as token:
-                creds = pickle.load(token)
-        
-        # 유효한 인증 정보가 없으면 새로 로그인
-        if not creds or not creds.valid:
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-            else:
-                if not os.path.exists('credentials.json'):
-                    raise FileNotFoundError(
-                        "credentials.json 파일이 없습니다. "
-                        "Google Cloud Console에서 OAuth 2.0 클라이언트 ID를 생성하고 "
-                        "credentials.json 파일을 다운로드하세요."
-                    )
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    'credentials.json', SCOPES)
-                creds = flow.run_local_server(port=0)
-            
-            # 인증 정보 저장
-            with open('token.pickle', 'wb') as token:
-                pickle.dump(creds, token)
-        
-        self.service = build('gmail', 'v1', credentials=creds)
+        """Gmail API 인증 처리 (토큰 로드/갱신은 공유 CredentialBroker가 담당)"""
+        self.pool = GmailServicePool(self.token_file, self.concurrency)
+        # 첫 서비스 객체를 미리 만들어 인증 오류를 생성 시점에 드러냄
+        self.pool.checkin(self.pool.checkout())
+    
+    def _execute(self, method: str, make_request):
+        """
+        할당량을 확보한 뒤 API 요청 실행
+        
+        Args:
+            method: 할당량 계산용 메서드 이름 (예: 'messages.get')
+            make_request: 서비스 객체를 받아 요청 객체를 만드는 함수
+        
+        속도 제한 오류를 받으면 지수 백오프 후 재시도한다.
+        """
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.quota.acquire(method)
+            try:
+                with self.pool.lease() as service:
+                    return make_request(service).execute()
+            except Exception as e:
+                if attempt == MAX_RATE_LIMIT_RETRIES or not is_rate_limit_error(e):
+                    raise
+            
+            # 대기하는 동안 서비스 객체는 반납된 상태
+            self.quota.backoff(attempt)
     
     def get_emails(self, query: str = '', max_results: int = 10) -> List[Dict]:
         """
@@ -64,47 +143,56 @@ class GmailClient:
         """
         try:
             # 이메일 ID 목록 가져오기
-            results = self.service.users().messages().list(
+            results = self._execute('messages.list', lambda service: service.users().messages().list(
                 userId='me',
                 q=query,
                 maxResults=max_results
-            ).execute()
+            ))
             
             messages = results.get('messages', [])
             
             if not messages:
                 return []
             
-            # 각 이메일의 상세 정보 가져오기
-            emails = []
-            for message in messages:
-                msg = self.service.users().messages().get(
-                    userId='me',
-                    id=message['id'],
-                    format='full'
-                ).execute()
-                
-                email_data = self._parse_email(msg)
-                emails.append(email_data)
+            # 각 이메일의 상세 정보를 병렬로 가져오기 (결과 순서는 목록 순서 유지)
+            if self.concurrency == 1 or len(messages) == 1:
+                return [self._fetch_email(message['id']) for message in messages]
             
-            return emails
+            workers = min(self.concurrency, len(messages))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(
+                    lambda message: self._fetch_email(message['id']), messages
+                ))
         
         except Exception as e:
             error_msg = str(e)
             print(f"이메일 가져오기 오류: {error_msg}")
             
-            # 구체적인 오류 메시지 제공
-            if "403" in error_msg or "Forbidden" in error_msg:
+            # 구체적인 오류 메시지 제공 (HTTP 상태 코드와 오류 reason 기준)
+            status = get_error_status(e)
+            if is_daily_limit_error(e):
+                print("Gmail API 일일 할당량을 초과했습니다.")
+            elif is_rate_limit_error(e):
+                print("Gmail API 호출 속도 제한에 걸렸습니다. 잠시 후 다시 시도하세요.")
+            elif status == 403:
                 print("Gmail API 권한이 없습니다. OAuth 동의 화면 설정을 확인하세요.")
-            elif "401" in error_msg or "Unauthorized" in error_msg:
+            elif status == 401:
                 print("Gmail API 인증이 실패했습니다. 토큰을 재설정하세요.")
-            elif "quota" in error_msg.lower():
-                print("Gmail API 일일 할당량을 초과했습니다.")
-            elif "not found" in error_msg.lower():
+            elif status == 404:
                 print("Gmail API가 활성화되지 않았습니다.")
             
             return []
     
+    def _fetch_email(self, message_id: str) -> Dict:
+        """이메일 한 건의 상세 정보 조회"""
+        msg = self._execute('messages.get', lambda service: service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format='full'
+        ))
+        
+        return self._parse_email(msg)
+    
     def _parse_email(self, msg: Dict) -> Dict:
         """이메일 메시지 파싱"""
         headers = msg['payload']['headers']
@@ -131,7 +219,9 @@ class GmailClient:
             'sender': sender,
             'date': date,
             'body': body,
-            'snippet': msg.get('snippet', '')
+            'snippet': msg.get('snippet', ''),
+            # 회신은 이 이메일을 받은 계정으로 보내야 하므로 계정 이름을 함께 기록
+            'account': self.account
         }
     
     def _get_email_body(self, payload: Dict) -> str:
@@ -189,11 +279,11 @@ class GmailClient:
         """이메일 회신 전송"""
         try:
             # 원본 메시지 가져오기
-            original_message = self.service.users().messages().get(
+            original_message = self._execute('messages.get', lambda service: service.users().messages().get(
                 userId='me',
                 id=original_message_id,
                 format='full'
-            ).execute()
+            ))
             
             # 원본 메시지의 헤더에서 정보 추출
             headers = original_message['payload']['headers']
@@ -232,10 +322,10 @@ References: {original_message_id_header}
                 'raw': message_b64
             }
             
-            sent_message = self.service.users().messages().send(
+            sent_message = self._execute('messages.send', lambda service: service.users().messages().send(
                 userId='me',
                 body=message
-            ).execute()
+            ))
             
             return {
                 'success': True,
@@ -0,0 +1,163 @@
+import os
+import time
+import threading
+from typing import Dict, Optional
+
+# Gmail API 메서드별 할당량 단위 (https://developers.google.com/gmail/api/reference/quota)
+QUOTA_UNITS = {
+    'messages.list': 5,
+    'messages.get': 5,
+    'messages.send': 100,
+    'messages.modify': 5,
+    'messages.batchModify': 50,
+    'history.list': 2,
+    'labels.list': 1,
+    'getProfile': 1,
+}
+
+# 사용자당 분당 15,000 단위 → 초당 250 단위
+PER_USER_UNITS_PER_SECOND = 250
+
+# 계정별 하루 사용 예산 (0이면 제한 없음)
+DAILY_BUDGET = int(os.getenv('GMAIL_DAILY_QUOTA_BUDGET', '0'))
+
+# 속도 제한 오류로 판단하는 Google API 오류 reason
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+# 하루 할당량 소진으로 판단하는 reason (재시도해도 소용 없음)
+DAILY_LIMIT_REASONS = {'dailyLimitExceeded', 'quotaExceeded'}
+
+
+class QuotaExhaustedError(Exception):
+    """계정의 하루 할당량 예산을 모두 사용한 경우"""
+
+
+class QuotaMeter:
+    """계정 하나의 Gmail API 할당량 사용량 집계 및 호출 속도 조절
+
+    토큰 버킷 방식으로 초당 사용 단위를 PER_USER_UNITS_PER_SECOND 이하로 유지한다.
+    버킷이 비면 예외 대신 필요한 만큼 대기하므로, 대량 조회는 429 오류로
+    중간에 실패하지 않고 속도만 느려진다.
+    """
+
+    def __init__(self, account: str = 'default', units_per_second: int = PER_USER_UNITS_PER_SECOND,
+                 daily_budget: int = DAILY_BUDGET):
+        """
+        Args:
+            account: 계정 이름
+            units_per_second: 초당 허용 단위
+            daily_budget: 하루 사용 예산 (0이면 제한 없음)
+        """
+        self.account = account
+        self.units_per_second = units_per_second
+        self.daily_budget = daily_budget
+        self.used = 0
+        self.calls: Dict[str, int] = {}
+        self.waited = 0.0
+        self._tokens = float(units_per_second)
+        self._updated_at = time.monotonic()
+        self._day = time.strftime('%Y-%m-%d')
+        self._lock = threading.Lock()
+
+    def acquire(self, method: str, count: int = 1) -> int:
+        """호출 전에 비용만큼 단위를 확보 (부족하면 대기) 후 차감된 단위 반환"""
+        units = QUOTA_UNITS.get(method, 1) * count
+
+        while True:
+            with self._lock:
+                self._roll_day()
+                if self.daily_budget and self.used + units > self.daily_budget:
+                    raise QuotaExhaustedError(
+                        f"'{self.account}' 계정의 하루 Gmail 할당량 예산({self.daily_budget})을 모두 사용했습니다."
+                    )
+
+                self._refill()
+                # 한 번에 버킷보다 큰 비용은 버킷이 가득 찼을 때 통과시킴
+                needed = min(units, self.units_per_second)
+                if self._tokens >= needed:
+                    self._tokens -= units
+                    self.used += units
+                    self.calls[method] = self.calls.get(method, 0) + count
+                    return units
+
+                wait = (needed - self._tokens) / self.units_per_second
+                self.waited += wait
+
+            time.sleep(wait)
+
+    def backoff(self, attempt: int):
+        """속도 제한 오류를 받았을 때 지수적으로 대기하고 버킷을 비움"""
+        wait = min(2 ** attempt, 32)
+        with self._lock:
+            self._tokens = 0.0
+            self._updated_at = time.monotonic()
+            self.waited += wait
+        time.sleep(wait)
+
+    def remaining(self) -> Dict:
+        """남은 예산 (현재 초당 여유 단위, 하루 예산 잔여량)"""
+        with self._lock:
+            self._roll_day()
+            self._refill()
+            return {
+                'burst': max(int(self._tokens), 0),
+                'daily': self.daily_budget - self.used if self.daily_budget else None,
+            }
+
+    def snapshot(self) -> Dict:
+        """현재까지 사용량 요약"""
+        remaining = self.remaining()
+        with self._lock:
+            return {
+                'account': self.account,
+                'used': self.used,
+                'calls': dict(self.calls),
+                'waited': round(self.waited, 2),
+                'remaining_daily': remaining['daily'],
+            }
+
+    def _refill(self):
+        """경과 시간만큼 버킷 채우기 (self._lock 보유 상태에서 호출)"""
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(self.units_per_second, self._tokens + elapsed * self.units_per_second)
+
+    def _roll_day(self):
+        """날짜가 바뀌면 하루 사용량 초기화 (self._lock 보유 상태에서 호출)"""
+        today = time.strftime('%Y-%m-%d')
+        if today != self._day:
+            self._day = today
+            self.used = 0
+            self.calls = {}
+
+
+def get_error_reason(error: Exception) -> Optional[str]:
+    """googleapiclient HttpError에서 오류 reason 추출"""
+    details = getattr(error, 'error_details', None)
+    if isinstance(details, list):
+        for detail in details:
+            if isinstance(detail, dict) and detail.get('reason'):
+                return detail['reason']
+    return None
+
+
+def get_error_status(error: Exception) -> Optional[int]:
+    """googleapiclient HttpError의 HTTP 상태 코드"""
+    resp = getattr(error, 'resp', None)
+    return getattr(resp, 'status', None)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """잠시 후 재시도하면 되는 속도 제한 오류인지 확인"""
+    status = get_error_status(error)
+    if status == 429:
+        return True
+    return status == 403 and get_error_reason(error) in RATE_LIMIT_REASONS
+
+
+def is_daily_limit_error(error: Exception) -> bool:
+    """하루 할당량 소진 오류인지 확인"""
+    if isinstance(error, QuotaExhaustedError):
+        return True
+    return get_error_status(error) == 403 and get_error_reason(error) in DAILY_LIMIT_REASONS
@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+from typing import Dict, IO, Iterable, Iterator, Tuple
+
+from calendar_cache import to_aware
+
+# UID 도메인 (같은 이메일은 항상 같은 UID → 다시 가져오면 중복 대신 갱신)
+UID_DOMAIN = 'influencer-ads'
+
+PRODID = '-//influencer_ads//Sponsorship Schedule Export//KO'
+
+# RFC 5545: 한 줄은 줄바꿈 제외 75옥텟 이하
+MAX_LINE_OCTETS = 75
+
+
+def escape_text(value: str) -> str:
+    """TEXT 값 이스케이프 (역슬래시, 세미콜론, 쉼표, 줄바꿈)"""
+    return (
+        value.replace('\\', '\\\\')
+        .replace(';', '\\;')
+        .replace(',', '\\,')
+        .replace('\r\n', '\\n')
+        .replace('\r', '\\n')
+        .replace('\n', '\\n')
+    )
+
+
+def fold_line(line: str) -> str:
+    """75옥텟을 넘는 줄을 CRLF + 공백으로 접음 (UTF-8 문자 중간에서는 자르지 않음)"""
+    if len(line.encode('utf-8')) <= MAX_LINE_OCTETS:
+        return line + '\r\n'
+
+    parts = []
+    current = []
+    size = 0
+    limit = MAX_LINE_OCTETS
+    for ch in line:
+        ch_size = len(ch.encode('utf-8'))
+        if size + ch_size > limit:
+            parts.append(''.join(current))
+            current = []
+            size = 0
+            limit = MAX_LINE_OCTETS - 1  # 이어지는 줄은 앞의 공백 1옥텟 포함
+        current.append(ch)
+        size += ch_size
+    parts.append(''.join(current))
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def format_datetime(value) -> str:
+    """datetime 또는 ISO 문자열을 UTC 형식(YYYYMMDDTHHMMSSZ)으로 변환 (시간대가 없으면 한국 시간으로 간주)"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return to_aware(value).astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def make_uid(source_id: str) -> str:
+    """Gmail 메시지 ID로 만든 고정 UID"""
+    return f'{source_id}@{UID_DOMAIN}'
+
+
+def iter_ics(events: Iterable[Tuple[str, Dict]]) -> Iterator[str]:
+    """
+    ICS(iCalendar) 파일 내용을 줄 단위로 생성
+
+    이벤트를 하나씩 받아 바로 내보내므로 이메일 수와 관계없이 메모리 사용량이 일정하다.
+
+    Args:
+        events: (Gmail 메시지 ID, 캘린더 이벤트) 목록
+                이벤트는 ScheduleAnalyzer.create_calendar_event 형식 ('title', 'start', 'end', 'description')
+    """
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+    yield 'BEGIN:VCALENDAR\r\n'
+    yield 'VERSION:2.0\r\n'
+    yield fold_line(f'PRODID:{PRODID}')
+    yield 'CALSCALE:GREGORIAN\r\n'
+    yield 'METHOD:PUBLISH\r\n'
+
+    for source_id, event in events:
+        yield 'BEGIN:VEVENT\r\n'
+        yield fold_line(f'UID:{make_uid(source_id)}')
+        yield f'DTSTAMP:{stamp}\r\n'
+        yield f"DTSTART:{format_datetime(event['start'])}\r\n"
+        if event.get('end'):
+            yield f"DTEND:{format_datetime(event['end'])}\r\n"
+        yield fold_line(f"SUMMARY:{escape_text(event.get('title', ''))}")
+        if event.get('description'):
+            yield fold_line(f"DESCRIPTION:{escape_text(event['description'])}")
+        if event.get('location'):
+            yield fold_line(f"LOCATION:{escape_text(event['location'])}")
+        yield 'END:VEVENT\r\n'
+
+    yield 'END:VCALENDAR\r\n'
+
+
+def write_ics(events: Iterable[Tuple[str, Dict]], stream: IO[bytes]) -> int:
+    """
+    ICS 내용을 바이너리 스트림에 기록하고 이벤트 수 반환
+
+    Args:
+        events: (Gmail 메시지 ID, 캘린더 이벤트) 목록
+        stream: 쓰기 가능한 바이너리 파일 객체
+    """
+    count = 0
+    for line in iter_ics(events):
+        if line == 'END:VEVENT\r\n':
+            count += 1
+        stream.write(line.encode('utf-8'))
+    return count
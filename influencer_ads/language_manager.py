@@ -2,10 +2,59 @@ import os
 from typing import Dict, Any
 import streamlit as st
 
+from keyword_matcher import KeywordMatcher
+
+# 이메일 내용 번역용 간단한 키워드 매핑
+KEYWORD_TRANSLATIONS = {
+    'ko': {
+        'sponsorship': '협찬',
+        'collaboration': '제휴',
+        'partnership': '파트너십',
+        'advertisement': '광고',
+        'promotion': '홍보',
+        'influencer': '인플루언서',
+        'marketing': '마케팅',
+        'brand': '브랜드',
+        'revenue': '수익',
+        'payment': '지급',
+        'fee': '수수료'
+    },
+    'en': {
+        '협찬': 'sponsorship',
+        '제휴': 'collaboration',
+        '파트너십': 'partnership',
+        '광고': 'advertisement',
+        '홍보': 'promotion',
+        '인플루언서': 'influencer',
+        '마케팅': 'marketing',
+        '브랜드': 'brand',
+        '수익': 'revenue',
+        '지급': 'payment',
+        '수수료': 'fee'
+    },
+    'ja': {
+        'sponsorship': '協賛',
+        'collaboration': 'コラボレーション',
+        'partnership': 'パートナーシップ',
+        'advertisement': '広告',
+        'promotion': 'プロモーション',
+        'influencer': 'インフルエンサー',
+        'marketing': 'マーケティング',
+        'brand': 'ブランド',
+        'revenue': '収益',
+        'payment': '支払い',
+        'fee': '手数料'
+    }
+}
+
+
 class LanguageManager:
     """다국어 지원 관리자"""
     
     def __init__(self):
+        # 언어별 키워드 번역 매처 (translate_email_content에서 지연 생성)
+        self._keyword_matchers: Dict[str, KeywordMatcher] = {}
+        
         self.languages = {
             'ko': '한국어',
             'en': 'English',
@@ -161,57 +210,22 @@ class LanguageManager:
         return self.languages
     
     def translate_email_content(self, content: str, target_lang: str = None) -> str:
-        """이메일 내용 번역 (간단한 키워드 매핑)"""
+        """이메일 내용 번역 (간단한 키워드 매핑)
+        
+        키워드를 전체 단어 단위로 한 번에 치환하므로 'coffee' 안의 'fee'처럼
+        단어 일부가 바뀌거나, 이미 번역된 결과가 다시 치환되지 않는다.
+        """
         if not target_lang:
             target_lang = self.get_language()
         
-        # 간단한 키워드 번역 매핑
-        keyword_translations = {
-            'ko': {
-                'sponsorship': '협찬',
-                'collaboration': '제휴',
-                'partnership': '파트너십',
-                'advertisement': '광고',
-                'promotion': '홍보',
-                'influencer': '인플루언서',
-                'marketing': '마케팅',
-                'brand': '브랜드',
-                'revenue': '수익',
-                'payment': '지급',
-                'fee': '수수료'
-            },
-            'en': {
-                '협찬': 'sponsorship',
-                '제휴': 'collaboration',
-                '파트너십': 'partnership',
-                '광고': 'advertisement',
-                '홍보': 'promotion',
-                '인플루언서': 'influencer',
-                '마케팅': 'marketing',
-                '브랜드': 'brand',
-                '수익': 'revenue',
-                '지급': 'payment',
-                '수수료': 'fee'
-            },
-            'ja': {
-                'sponsorship': '協賛',
-                'collaboration': 'コラボレーション',
-                'partnership': 'パートナーシップ',
-                'advertisement': '広告',
-                'promotion': 'プロモーション',
-                'influencer': 'インフルエンサー',
-                'marketing': 'マーケティング',
-                'brand': 'ブランド',
-                'revenue': '収益',
-                'payment': '支払い',
-                'fee': '手数料'
-            }
-        }
-        
-        translated_content = content
-        translations = keyword_translations.get(target_lang, {})
+        translations = KEYWORD_TRANSLATIONS.get(target_lang)
+        if not translations:
+            return content
         
-        for original, translated in translations.items():
-            translated_content = translated_content.replace(original, translated)
+        # 언어별 키워드 매처는 처음 사용할 때 한 번만 생성
+        matcher = self._keyword_matchers.get(target_lang)
+        if matcher is None:
+            matcher = KeywordMatcher(translations.keys())
+            self._keyword_matchers[target_lang] = matcher
         
-        return translated_content
+        return matcher.replace(content, translations)
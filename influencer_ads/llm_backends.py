@@ -0,0 +1,502 @@
+import os
+import re
+import json
+import time
+import uuid
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from compensation import PERCENT_PATTERN, VIEW_RATE_PATTERN, parse_amount
+
+# 라우팅 방식: priority (LLM_BACKENDS 순서), cost (1000토큰당 비용 낮은 순), latency (응답 시간 짧은 순)
+ROUTING_STRATEGIES = ('priority', 'cost', 'latency')
+
+# 관측한 응답 시간 이동 평균 가중치 (latency 라우팅에 사용)
+LATENCY_SMOOTHING = 0.2
+
+
+def estimate_tokens(text: str) -> int:
+    """응답에 사용량이 없을 때 쓰는 대략적인 토큰 수 (한국어 기준 약 2글자당 1토큰)"""
+    return max(1, len(text or '') // 2)
+
+
+class ClovaAPI:
+    """Naver HyperCLOVA API 클라이언트 (최신 v3 API)"""
+
+    def __init__(self, api_key: str, request_id: str, model: str = 'HCX-005'):
+        # Naver CLOVA Studio API Key (Naver Cloud Platform > CLOVA Studio에서 발급)
+        self.api_key = api_key
+        # 요청 추적을 위한 고유 ID (자동 생성됨)
+        self.request_id = request_id
+        # HyperCLOVA X 최신 API 엔드포인트 (v3)
+        self.host = "https://clovastudio.stream.ntruss.com"
+        self.api_url = f"{self.host}/v3/chat-completions/{model}"
+        # 마지막 응답의 토큰 사용량 (응답에 없으면 None)
+        self.last_total_tokens = None
+
+    def chat(self, messages: list, temperature: float = 0.5, max_tokens: int = 1000) -> str:
+        """
+        HyperCLOVA Chat API 호출 (v3 API)
+
+        Args:
+            messages: 대화 메시지 리스트
+            temperature: 생성 다양성 (0.0~1.0)
+            max_tokens: 최대 토큰 수
+
+        Returns:
+            생성된 응답 텍스트
+        """
+        # v3 API는 Authorization Bearer 토큰 방식 사용
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",  # Bearer 토큰 형식
+            "X-NCP-CLOVASTUDIO-REQUEST-ID": self.request_id,  # 요청 추적 ID
+            "Content-Type": "application/json; charset=utf-8"
+        }
+
+        # v3 API의 메시지 형식 변환
+        formatted_messages = []
+        for msg in messages:
+            formatted_messages.append({
+                "role": msg["role"],
+                "content": [{
+                    "type": "text",
+                    "text": msg["content"]
+                }]
+            })
+
+        payload = {
+            "messages": formatted_messages,
+            "topP": 0.8,
+            "topK": 0,
+            "maxTokens": max_tokens,
+            "temperature": temperature,
+            "repetitionPenalty": 1.1,
+            "stop": [],
+            "includeAiFilters": True,
+            "seed": 0
+        }
+
+        try:
+            response = requests.post(self.api_url, headers=headers, json=payload, timeout=30)
+
+            if response.status_code == 200:
+                result_data = response.json()
+                usage = (result_data.get('result') or {}).get('usage') or {}
+                self.last_total_tokens = usage.get('totalTokens')
+                # v3 API 응답 형식에 맞게 파싱
+                if 'result' in result_data and 'message' in result_data['result']:
+                    return result_data['result']['message']['content']
+                elif 'message' in result_data:
+                    # content가 배열 형태일 수 있음
+                    content = result_data['message'].get('content', '')
+                    if isinstance(content, list) and len(content) > 0:
+                        return content[0].get('text', '')
+                    return str(content)
+                else:
+                    return str(result_data)
+            else:
+                # 상세한 오류 정보 출력
+                error_detail = f"Status: {response.status_code}, Response: {response.text}"
+                raise Exception(f"API 오류: {error_detail}")
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"네트워크 오류: {str(e)}")
+
+
+class LLMResponse:
+    """LLM 응답 한 건 (텍스트, 사용 토큰, 걸린 시간, 예상 비용(원), 처리한 백엔드)"""
+
+    __slots__ = ('text', 'tokens', 'latency_ms', 'cost', 'backend')
+
+    def __init__(self, text: str, tokens: int, latency_ms: float, cost: float, backend: str):
+        self.text = text
+        self.tokens = tokens
+        self.latency_ms = latency_ms
+        self.cost = cost
+        self.backend = backend
+
+
+class LLMBackend:
+    """LLM 호출 방식 공통 인터페이스
+
+    백엔드마다 동시 요청 수, 요청 간 최소 간격, 배치/스트리밍/JSON 모드 지원 여부와
+    라우팅 기준(1000토큰당 비용, 예상 응답 시간)을 선언한다. 비용과 응답 시간은 모델별
+    기본값(MODEL_PROFILES)이 있고, LLM_COST_<이름>[_<모델>], LLM_LATENCY_<이름>[_<모델>]
+    환경 변수로 덮어쓸 수 있다. 하위 클래스는 _complete()만 구현하면 된다.
+    """
+
+    name = 'base'
+    model = ''
+    # 성능 특성
+    max_concurrency = 1          # 동시에 보낼 수 있는 요청 수
+    min_interval = 0.0           # 요청 사이 최소 간격 (초, API 속도 제한)
+    supports_batching = False    # 한 요청에 여러 이메일을 보낼 수 있는지
+    supports_streaming = False   # API가 응답을 나눠 보낼 수 있는지
+    supports_json_mode = False   # 응답을 JSON으로 강제할 수 있는지
+    # 라우팅 기준 (기본값은 대략적인 값)
+    cost_per_1k_tokens = 0.0     # 원
+    latency_ms = 0.0             # 예상 응답 시간
+    # 모델별 (1000토큰당 비용, 예상 응답 시간) 기본값
+    MODEL_PROFILES: Dict[str, Tuple[float, float]] = {}
+
+    def __init__(self, model: str = ''):
+        self.model = model or self.model
+        self.cost_per_1k_tokens, self.latency_ms = self.MODEL_PROFILES.get(
+            self.model, (self.cost_per_1k_tokens, self.latency_ms)
+        )
+        env_names = [self.name.upper()]
+        if self.model:
+            env_names.append(f"{self.name}_{re.sub(r'[^0-9A-Za-z]+', '_', self.model)}".upper())
+        for env_name in env_names:
+            self.cost_per_1k_tokens = float(os.getenv(f'LLM_COST_{env_name}', self.cost_per_1k_tokens))
+            self.latency_ms = float(os.getenv(f'LLM_LATENCY_{env_name}', self.latency_ms))
+        self._throttle_lock = threading.Lock()
+        self._next_request_at = 0.0
+        # 여러 분류기/단계가 같은 백엔드를 써도 동시 요청은 max_concurrency까지
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+
+    @property
+    def key(self) -> str:
+        """집계용 이름 (같은 백엔드의 다른 모델을 구분)"""
+        return f"{self.name}:{self.model}" if self.model else self.name
+
+    def _throttle(self):
+        """min_interval 간격으로 요청 시각을 나눠 줌 (여러 스레드가 함께 호출해도 간격 유지)"""
+        if not self.min_interval:
+            return
+        with self._throttle_lock:
+            now = time.monotonic()
+            wait = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.min_interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def complete(self, messages: List[Dict], temperature: float = 0.3, max_tokens: int = 1000,
+                 json_mode: bool = False) -> LLMResponse:
+        """
+        대화 메시지에 대한 응답 생성
+
+        Args:
+            messages: [{"role": ..., "content": ...}] 메시지 목록
+            temperature: 생성 다양성
+            max_tokens: 최대 토큰 수
+            json_mode: JSON 응답 요청 (supports_json_mode인 백엔드만 강제)
+        """
+        with self._slots:
+            self._throttle()
+            started = time.perf_counter()
+            text, tokens = self._complete(messages, temperature, max_tokens, json_mode)
+            latency_ms = (time.perf_counter() - started) * 1000
+        if tokens is None:
+            tokens = estimate_tokens(''.join(m['content'] for m in messages)) + estimate_tokens(text)
+        return LLMResponse(text, tokens, latency_ms, tokens / 1000 * self.cost_per_1k_tokens, self.key)
+
+    def _complete(self, messages: List[Dict], temperature: float, max_tokens: int, json_mode: bool):
+        """(응답 텍스트, 사용 토큰 수 또는 None) 반환"""
+        raise NotImplementedError
+
+    def describe(self) -> Dict:
+        """백엔드 특성 요약 (화면 표시용)"""
+        return {
+            'key': self.key,
+            'name': self.name,
+            'model': self.model,
+            'max_concurrency': self.max_concurrency,
+            'min_interval': self.min_interval,
+            'supports_batching': self.supports_batching,
+            'supports_streaming': self.supports_streaming,
+            'supports_json_mode': self.supports_json_mode,
+            'cost_per_1k_tokens': self.cost_per_1k_tokens,
+            'latency_ms': self.latency_ms,
+        }
+
+
+class ClovaBackend(LLMBackend):
+    """Naver HyperCLOVA X (CLOVA Studio v3)
+
+    API 제한 때문에 요청 사이에 1초 간격을 두고 한 번에 하나씩 보낸다.
+    HCX-DASH 모델은 HCX-005보다 싸고 빠르므로 분류 단계(cascade)의 앞 단계로 쓸 수 있다.
+    """
+
+    name = 'clova'
+    model = 'HCX-005'
+    max_concurrency = 1
+    min_interval = 1.0
+    supports_batching = False
+    supports_streaming = True
+    cost_per_1k_tokens = 5.0
+    latency_ms = 3000.0
+    MODEL_PROFILES = {
+        'HCX-005': (5.0, 3000.0),
+        'HCX-DASH-002': (1.0, 1200.0),
+    }
+
+    def __init__(self, api_key: str, model: str = 'HCX-005'):
+        """
+        Args:
+            api_key: Naver CLOVA Studio API 키
+            model: CLOVA Studio 모델 이름
+        """
+        super().__init__(model)
+        self.api_key = api_key
+        self._local = threading.local()
+
+    def _api(self) -> ClovaAPI:
+        """스레드별 ClovaAPI (요청 ID와 토큰 사용량을 스레드끼리 공유하지 않음)"""
+        api = getattr(self._local, 'api', None)
+        if api is None:
+            api = self._local.api = ClovaAPI(self.api_key, str(uuid.uuid4()), self.model)
+        return api
+
+    def _complete(self, messages, temperature, max_tokens, json_mode):
+        api = self._api()
+        # 매 요청마다 새로운 UUID 생성
+        api.request_id = str(uuid.uuid4())
+        text = api.chat(messages, temperature=temperature, max_tokens=max_tokens)
+        return text, api.last_total_tokens
+
+
+class OpenAIBackend(LLMBackend):
+    """OpenAI Chat Completions (openai 패키지 필요)"""
+
+    name = 'openai'
+    model = 'gpt-3.5-turbo'
+    max_concurrency = 4
+    supports_batching = False
+    supports_streaming = True
+    supports_json_mode = True
+    cost_per_1k_tokens = 1.5
+    latency_ms = 1500.0
+    MODEL_PROFILES = {
+        'gpt-3.5-turbo': (1.5, 1500.0),
+        'gpt-4o-mini': (0.5, 1200.0),
+        'gpt-4o': (8.0, 2500.0),
+    }
+
+    def __init__(self, api_key: str, model: str = 'gpt-3.5-turbo'):
+        """
+        Args:
+            api_key: OpenAI API 키
+            model: 모델 이름 (기본값은 더 저렴한 모델)
+        """
+        super().__init__(model)
+        from openai import OpenAI
+        self.client = OpenAI(api_key=api_key)
+
+    def _complete(self, messages, temperature, max_tokens, json_mode):
+        options = {'response_format': {'type': 'json_object'}} if json_mode else {}
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **options
+        )
+        usage = getattr(response, 'usage', None)
+        return response.choices[0].message.content, getattr(usage, 'total_tokens', None)
+
+
+class MockBackend(LLMBackend):
+    """API 호출 없이 키워드로 분류하는 로컬 백엔드 (개발/오프라인 테스트용)
+
+    보상 조건 표현(compensation 패턴)으로 단계를 정하고 분류 JSON 형식으로 응답한다.
+    """
+
+    name = 'mock'
+    model = 'keyword'
+    max_concurrency = 8
+    supports_batching = True
+    supports_streaming = False
+    supports_json_mode = True
+    cost_per_1k_tokens = 0.0
+    latency_ms = 1.0
+
+    _SPONSOR_PATTERN = re.compile(r'협찬|광고|제휴|리뷰|sponsor|collab|partnership|campaign', re.IGNORECASE)
+    _COMMISSION_PATTERN = re.compile(r'수수료|커미션|commission|affiliate|판매\s*수익', re.IGNORECASE)
+    _VIEWS_PATTERN = re.compile(r'조회수|CPM|views?', re.IGNORECASE)
+
+    def _complete(self, messages, temperature, max_tokens, json_mode):
+        # 마지막 사용자 메시지(이메일 내용)만 봄
+        text = next((m['content'] for m in reversed(messages) if m['role'] == 'user'), '')
+
+        fixed_fee = parse_amount(text)
+        has_views = bool(self._VIEWS_PATTERN.search(text)) and VIEW_RATE_PATTERN.search(text) is not None
+        has_commission = bool(self._COMMISSION_PATTERN.search(text)) and PERCENT_PATTERN.search(text) is not None
+
+        # 확신도: 보상 조건이 금액/비율로 드러난 경우만 높게
+        if has_commission:
+            category, confidence = 'tier3', 0.8
+        elif has_views:
+            category, confidence = 'tier2', 0.8
+        elif fixed_fee is not None:
+            category, confidence = 'tier1', 0.75 if self._SPONSOR_PATTERN.search(text) else 0.5
+        elif self._SPONSOR_PATTERN.search(text):
+            category, confidence = 'unclear', 0.3
+        else:
+            category, confidence = 'not_sponsorship', 0.6
+
+        result = {
+            'category': category,
+            'confidence': confidence,
+            'explanation': '키워드 기반 로컬 분류 결과입니다.',
+            'details': {
+                '고정금액': f"{fixed_fee:,}원" if fixed_fee is not None else '명시 안됨',
+                '조회수보상': '있음' if has_views else '없음',
+                '판매수수료': '있음' if has_commission else '없음',
+            }
+        }
+        return json.dumps(result, ensure_ascii=False), None
+
+
+class BackendStats:
+    """백엔드별 호출 수, 오류 수, 토큰, 예상 비용, 응답 시간 집계"""
+
+    def __init__(self, keys: List[str] = ()):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict] = {key: self._empty() for key in keys}
+
+    @staticmethod
+    def _empty() -> Dict:
+        return {'calls': 0, 'errors': 0, 'tokens': 0, 'cost': 0.0, 'latency_ms': 0.0}
+
+    def record(self, key: str, response: LLMResponse):
+        """성공한 호출 기록"""
+        with self._lock:
+            stats = self._stats.setdefault(key, self._empty())
+            stats['calls'] += 1
+            stats['tokens'] += response.tokens
+            stats['cost'] += response.cost
+            stats['latency_ms'] += response.latency_ms
+
+    def record_error(self, key: str):
+        """실패한 호출 기록"""
+        with self._lock:
+            self._stats.setdefault(key, self._empty())['errors'] += 1
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """백엔드별 집계 (calls, errors, tokens, cost, avg_latency_ms)"""
+        with self._lock:
+            return {
+                key: {**stats, 'avg_latency_ms': stats['latency_ms'] / stats['calls'] if stats['calls'] else 0.0}
+                for key, stats in self._stats.items()
+            }
+
+
+class BackendRouter:
+    """여러 백엔드 중 라우팅 방식에 따라 순서를 정해 호출 (실패하면 다음 백엔드로)
+
+    백엔드별 호출 수, 오류 수, 토큰, 예상 비용, 응답 시간을 집계하고,
+    latency 라우팅은 선언한 응답 시간 대신 실제로 관측한 이동 평균을 사용한다.
+    """
+
+    def __init__(self, backends: List[LLMBackend], strategy: str = 'priority'):
+        """
+        Args:
+            backends: 백엔드 목록 (priority 라우팅에서는 이 순서)
+            strategy: ROUTING_STRATEGIES 중 하나
+        """
+        if not backends:
+            raise ValueError("백엔드가 하나 이상 필요합니다")
+        if strategy not in ROUTING_STRATEGIES:
+            raise ValueError(f"알 수 없는 라우팅 방식: {strategy}")
+        self.backends = list(backends)
+        self.strategy = strategy
+        self._lock = threading.Lock()
+        self._observed_latency: Dict[str, float] = {}
+        self._stats = BackendStats([backend.key for backend in self.backends])
+
+    def ordered(self) -> List[LLMBackend]:
+        """라우팅 방식에 따른 호출 순서"""
+        if self.strategy == 'cost':
+            return sorted(self.backends, key=lambda backend: backend.cost_per_1k_tokens)
+        if self.strategy == 'latency':
+            with self._lock:
+                observed = dict(self._observed_latency)
+            return sorted(self.backends, key=lambda backend: observed.get(backend.key, backend.latency_ms))
+        return list(self.backends)
+
+    @property
+    def primary(self) -> LLMBackend:
+        """지금 가장 먼저 호출할 백엔드"""
+        return self.ordered()[0]
+
+    def complete(self, messages: List[Dict], temperature: float = 0.3, max_tokens: int = 1000,
+                 json_mode: bool = False, stats: Optional[BackendStats] = None) -> LLMResponse:
+        """
+        순서대로 호출하여 처음 성공한 응답 반환 (모두 실패하면 마지막 오류)
+
+        라우터 집계(프로세스 전체)에 더해 stats를 주면 그 집계(예: 세션별)에도 기록한다.
+        """
+        last_error = None
+        for backend in self.ordered():
+            try:
+                response = backend.complete(messages, temperature, max_tokens, json_mode)
+            except Exception as e:
+                print(f"LLM 백엔드 오류 ({backend.key}): {e}")
+                self._stats.record_error(backend.key)
+                if stats is not None:
+                    stats.record_error(backend.key)
+                last_error = e
+                continue
+            self._record(backend, response)
+            if stats is not None:
+                stats.record(backend.key, response)
+            return response
+        raise last_error
+
+    def _record(self, backend: LLMBackend, response: LLMResponse):
+        """호출 결과 집계 및 관측 응답 시간 갱신"""
+        self._stats.record(backend.key, response)
+        with self._lock:
+            previous = self._observed_latency.get(backend.key)
+            self._observed_latency[backend.key] = (
+                response.latency_ms if previous is None
+                else previous + LATENCY_SMOOTHING * (response.latency_ms - previous)
+            )
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """백엔드별 집계 (calls, errors, tokens, cost, avg_latency_ms, 프로세스 전체)"""
+        return self._stats.snapshot()
+
+
+def create_backend(name: str, clova_api_key: Optional[str] = None) -> LLMBackend:
+    """
+    이름으로 백엔드 생성
+
+    Args:
+        name: 'clova', 'openai', 'mock' (모델을 지정하려면 'clova:HCX-DASH-002'처럼 콜론 뒤에)
+        clova_api_key: CLOVA Studio API 키 (없으면 CLOVA_STUDIO_KEY 환경 변수)
+    """
+    name, _, model = name.strip().partition(':')
+    name = name.lower()
+    if name == 'clova':
+        return ClovaBackend(clova_api_key or os.getenv('CLOVA_STUDIO_KEY', ''),
+                            model=model or os.getenv('CLOVA_MODEL', 'HCX-005'))
+    if name == 'openai':
+        return OpenAIBackend(os.getenv('OPENAI_API_KEY', ''),
+                             model=model or os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo'))
+    if name == 'mock':
+        return MockBackend()
+    raise ValueError(f"알 수 없는 LLM 백엔드: {name}")
+
+
+def router_from_env(clova_api_key: Optional[str] = None) -> BackendRouter:
+    """
+    환경 변수로 라우터 구성
+
+    LLM_BACKENDS: 사용할 백엔드 (쉼표 구분, priority 순서, 기본값 clova)
+    LLM_ROUTING: priority, cost, latency 중 하나 (기본값 priority)
+    생성에 실패한 백엔드(패키지 없음 등)는 건너뛴다.
+    """
+    backends = []
+    for name in os.getenv('LLM_BACKENDS', 'clova').split(','):
+        if not name.strip():
+            continue
+        try:
+            backends.append(create_backend(name, clova_api_key))
+        except Exception as e:
+            print(f"LLM 백엔드 생성 오류 ({name.strip()}): {e}")
+    if not backends:
+        backends.append(create_backend('clova', clova_api_key))
+    return BackendRouter(backends, strategy=os.getenv('LLM_ROUTING', 'priority'))
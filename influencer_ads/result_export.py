@@ -0,0 +1,144 @@
+import csv
+import importlib.util
+import io
+import tempfile
+from typing import IO, Iterable, Iterator, List, Tuple
+
+# 한 번에 Parquet 레코드 배치로 모을 행 수 (메모리 사용량 상한)
+PARQUET_BATCH_ROWS = 5000
+
+# 분류기 DETAILS 항목 중 '있음/없음 및 상세' 형식인 항목
+YES_NO_DETAILS = ('조회수보상', '판매수수료')
+
+# 내보내기 열: (열 이름, 타입) — 타입은 'string', 'bool', 'int', 'float'
+EXPORT_COLUMNS: List[Tuple[str, str]] = [
+    ('id', 'string'),
+    ('제목', 'string'),
+    ('발신자', 'string'),
+    ('날짜', 'string'),
+    ('계정', 'string'),
+    ('분류', 'string'),
+    ('설명', 'string'),
+    ('고정금액', 'string'),
+    ('조회수보상_여부', 'bool'),
+    ('조회수보상', 'string'),
+    ('판매수수료_여부', 'bool'),
+    ('판매수수료', 'string'),
+    ('고정금액_원', 'int'),
+    ('조회수보상_CPM_원', 'float'),
+    ('판매수수료_퍼센트', 'float'),
+    ('일정', 'string'),
+    ('번역_언어', 'string'),
+]
+
+
+def _detail_text(value) -> str:
+    """DETAILS 값 정리 ('명시 안됨'은 빈 값)"""
+    text = str(value or '').strip()
+    return '' if text in ('명시 안됨', '없음') else text
+
+
+def _yes_no(value):
+    """'있음 ...' → True, '없음 ...' → False, 그 외 None"""
+    text = str(value or '').strip()
+    if text.startswith('있음'):
+        return True
+    if text.startswith('없음'):
+        return False
+    return None
+
+
+def iter_rows(results: Iterable) -> Iterator[tuple]:
+    """결과(ResultRecord)를 EXPORT_COLUMNS 순서의 행으로 하나씩 변환"""
+    for record in results:
+        details = record.details or {}
+        schedule_start = record.schedule[0].isoformat() if record.schedule else ''
+        yield (
+            record.id,
+            record.subject,
+            record.sender,
+            record.date,
+            record.account or '',
+            record.classification,
+            record.explanation,
+            _detail_text(details.get('고정금액')),
+            _yes_no(details.get('조회수보상')),
+            _detail_text(details.get('조회수보상')),
+            _yes_no(details.get('판매수수료')),
+            _detail_text(details.get('판매수수료')),
+            record.fixed_fee,
+            record.cpm,
+            record.commission,
+            schedule_start,
+            record.detected_language or '',
+        )
+
+
+def write_csv(results: Iterable, stream: IO[bytes]) -> int:
+    """
+    결과를 CSV(UTF-8 BOM, 엑셀 호환)로 스트림에 기록하고 행 수 반환
+
+    행을 하나씩 바로 쓰므로 결과 수와 관계없이 메모리 사용량이 일정하다.
+    """
+    text_stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    try:
+        writer = csv.writer(text_stream)
+        writer.writerow([name for name, _ in EXPORT_COLUMNS])
+        count = 0
+        for row in iter_rows(results):
+            writer.writerow(['' if value is None else value for value in row])
+            count += 1
+        text_stream.flush()
+        return count
+    finally:
+        # 호출한 쪽 스트림은 닫지 않음
+        text_stream.detach()
+
+
+def parquet_available() -> bool:
+    """Parquet 내보내기 가능 여부 (pyarrow 설치 여부만 확인하고 import하지 않음)"""
+    return importlib.util.find_spec('pyarrow') is not None
+
+
+def write_parquet(results: Iterable, stream: IO[bytes], batch_rows: int = PARQUET_BATCH_ROWS) -> int:
+    """
+    결과를 Parquet(열 단위)으로 스트림에 기록하고 행 수 반환
+
+    batch_rows 행씩 레코드 배치로 만들어 바로 기록하므로 메모리 사용량은 배치 크기로 제한된다.
+    pyarrow가 필요하다 (없으면 ImportError).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = {'string': pa.string(), 'bool': pa.bool_(), 'int': pa.int64(), 'float': pa.float64()}
+    schema = pa.schema([(name, types[kind]) for name, kind in EXPORT_COLUMNS])
+
+    count = 0
+    with pq.ParquetWriter(stream, schema, compression='zstd') as writer:
+        columns = [[] for _ in EXPORT_COLUMNS]
+        for row in iter_rows(results):
+            for column, value in zip(columns, row):
+                column.append(value)
+            count += 1
+            if len(columns[0]) >= batch_rows:
+                writer.write_batch(pa.record_batch(columns, schema=schema))
+                columns = [[] for _ in EXPORT_COLUMNS]
+        if columns[0]:
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+    return count
+
+
+def write_export_file(results: Iterable, extension: str, directory: str = None) -> str:
+    """
+    결과를 임시 파일(csv 또는 parquet)에 기록하고 경로 반환
+
+    st.download_button은 SpooledTemporaryFile 같은 일반 IOBase를 받지 않으므로,
+    호출하는 쪽에서 이 경로를 'rb'로 다시 열어(BufferedReader) 넘긴다.
+    파일 삭제는 호출하는 쪽에서 한다.
+    """
+    writers = {'csv': write_csv, 'parquet': write_parquet}
+    if extension not in writers:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {extension}")
+    with tempfile.NamedTemporaryFile('wb', suffix=f'.{extension}', dir=directory, delete=False) as export_file:
+        writers[extension](results, export_file)
+    return export_file.name
@@ -0,0 +1,263 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from compensation import normalize_details
+
+# 분류 카테고리 (분류기 결과 값)
+CATEGORIES = ('tier1', 'tier2', 'tier3', 'not_sponsorship', 'unclear')
+
+# 정렬/필터용 보상 조건 열 (ResultRecord 속성, 값이 있는 결과만 정렬 인덱스에 들어감)
+#   fixed_fee: 고정금액 (원), cpm: 조회수보상 (1000회당 원), commission: 판매수수료 (%)
+METRICS = ('fixed_fee', 'cpm', 'commission')
+
+# 캘린더 이벤트 데이터 생성용 일정 분석기 (set_event_builder로 지정, 없으면 처음 필요할 때 기본값 생성)
+_event_builder = None
+
+
+def set_event_builder(analyzer):
+    """캘린더 이벤트 데이터를 만들 ScheduleAnalyzer 지정 (일정 분석에 쓴 분석기와 같은 설정)"""
+    global _event_builder
+    _event_builder = analyzer
+
+
+def _get_event_builder():
+    """캘린더 이벤트 데이터(create_calendar_event)를 만들 ScheduleAnalyzer"""
+    global _event_builder
+    if _event_builder is None:
+        from schedule_analyzer import ScheduleAnalyzer
+        _event_builder = ScheduleAnalyzer()
+    return _event_builder
+
+
+class ResultRecord:
+    """분류 결과 한 건 (세션에 오래 남으므로 필요한 값만 슬롯에 저장)
+
+    원본 이메일 dict, 원문을 복사한 번역 dict, 추출 날짜 목록은 저장하지 않고, 예전 dict
+    형식('email', 'translation_data', 'schedule_data')으로 읽을 때 남은 값으로 다시 만든다.
+    캘린더 이벤트 설명/링크는 일정이 있는 결과를 처음 읽을 때 한 번만 만들어 보관한다.
+    """
+
+    __slots__ = (
+        'id', 'subject', 'sender', 'date', 'body', 'account',
+        'classification', 'explanation', 'details',
+        'translated_subject', 'translated_body', 'detected_language',
+        'schedule', 'conflicts', 'free_slot', '_calendar_event',
+        'fixed_fee', 'cpm', 'commission',
+    )
+
+    # dict처럼 읽을 수 있는 키
+    KEYS = ('email', 'classification', 'explanation', 'details', 'translation_data', 'schedule_data')
+
+    def __init__(self, email: Dict, classification: str, explanation: str, details: Dict,
+                 translation_data: Optional[Dict] = None,
+                 schedule: Optional[Tuple[datetime, bool, bool]] = None):
+        """
+        Args:
+            email: Gmail 이메일 데이터
+            classification, explanation, details: 분류 결과
+            translation_data: TranslationClient.translate_email 결과 (번역된 경우만 번역문 저장)
+            schedule: (일정 시작 시각, 마감 여부, 이벤트 여부) (ScheduleBatch.schedule_summary)
+        """
+        self.id = email['id']
+        self.subject = email.get('subject', '')
+        self.sender = email.get('sender', '')
+        self.date = email.get('date', '')
+        self.body = email.get('body') or email.get('snippet', '')
+        self.account = email.get('account')
+        self.classification = classification
+        self.explanation = explanation
+        self.details = details
+        # 보상 조건 숫자 값 (해석할 수 없으면 None)
+        self.fixed_fee, self.cpm, self.commission = normalize_details(details)
+
+        if translation_data and translation_data.get('is_translated'):
+            self.translated_subject = translation_data['translated_subject']
+            self.translated_body = translation_data['translated_body']
+            self.detected_language = translation_data['detected_language']
+        else:
+            self.translated_subject = None
+            self.translated_body = None
+            self.detected_language = None
+
+        self.schedule = schedule
+        self.conflicts = None
+        self.free_slot = None
+        self._calendar_event = None
+
+    def __getitem__(self, key: str):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        """dict.get과 같은 방식으로 읽기"""
+        return getattr(self, key) if key in self.KEYS else default
+
+    @property
+    def email(self) -> Dict:
+        """이메일 데이터 (Gmail 클라이언트 형식)"""
+        email = {
+            'id': self.id,
+            'subject': self.subject,
+            'sender': self.sender,
+            'date': self.date,
+            'body': self.body,
+        }
+        if self.account:
+            email['account'] = self.account
+        return email
+
+    @property
+    def translation_data(self) -> Optional[Dict]:
+        """번역 결과 (번역되지 않은 이메일은 None)"""
+        if self.translated_body is None:
+            return None
+        return {
+            'original_subject': self.subject,
+            'original_body': self.body,
+            'translated_subject': self.translated_subject,
+            'translated_body': self.translated_body,
+            'detected_language': self.detected_language,
+            'is_translated': True
+        }
+
+    @property
+    def calendar_event(self) -> Optional[Dict]:
+        """캘린더 이벤트 데이터 (처음 읽을 때 생성 후 보관, 일정이 없으면 None)"""
+        if self.schedule is None:
+            return None
+
+        if self._calendar_event is None:
+            start, is_deadline, is_event = self.schedule
+            email_data = self.email
+            if self.translated_body is not None:
+                # 일정은 번역된 이메일로 분석했으므로 이벤트 설명도 번역문 사용
+                email_data.update(subject=self.translated_subject, body=self.translated_body)
+
+            self._calendar_event = _get_event_builder().create_calendar_event(
+                email_data,
+                {'date': start},
+                {'hour': start.hour, 'minute': start.minute},
+                is_deadline,
+                is_event
+            )
+        return self._calendar_event
+
+    @property
+    def schedule_data(self) -> Optional[Dict]:
+        """일정 정보 (일정이 없으면 None)"""
+        if self.schedule is None:
+            return None
+
+        _, is_deadline, is_event = self.schedule
+        return {
+            'has_schedule': True,
+            'is_deadline': is_deadline,
+            'is_event': is_event,
+            'calendar_event': self.calendar_event,
+            'conflicts': self.conflicts or [],
+            'free_slot': self.free_slot
+        }
+
+
+class ResultStore:
+    """분류 결과 목록 (카테고리별 버킷과 개수를 추가할 때마다 갱신)
+
+    재실행마다 전체 결과를 다시 걸러내거나 세지 않도록, 결과가 들어올 때
+    카테고리 버킷과 이메일 ID 인덱스에 함께 넣어 둔다. 결과는 ResultRecord로 저장한다.
+    입력 순서대로 순회할 수 있어 기존 리스트처럼 쓸 수 있다.
+    """
+
+    def __init__(self):
+        self._items: List[ResultRecord] = []
+        self._buckets: Dict[str, List[ResultRecord]] = {category: [] for category in CATEGORIES}
+        self._by_id: Dict[str, ResultRecord] = {}
+        self._ids: List[str] = []
+        self._scheduled: List[ResultRecord] = []
+        # 보상 조건별 (값, 입력 순번) 정렬 인덱스
+        self._metric_index: Dict[str, List[Tuple[float, int]]] = {metric: [] for metric in METRICS}
+
+    def add(self, item: ResultRecord):
+        """결과 한 건 추가 (분류 버킷과 ID 인덱스에도 추가)
+
+        같은 ID가 이미 있으면 (여러 계정에서 같은 메일을 받은 경우 등) 먼저 들어온 결과를 유지한다.
+        """
+        if item.id in self._by_id:
+            return
+        self._by_id[item.id] = item
+        self._ids.append(item.id)
+        self._items.append(item)
+        self._buckets.setdefault(item.classification, []).append(item)
+        if item.schedule is not None:
+            self._scheduled.append(item)
+
+        position = len(self._items) - 1
+        for metric, index in self._metric_index.items():
+            value = getattr(item, metric)
+            if value is not None:
+                insort(index, (value, position))
+
+    def get(self, email_id: str) -> Optional[ResultRecord]:
+        """이메일 ID로 결과 조회 (없으면 None)"""
+        return self._by_id.get(email_id)
+
+    def __contains__(self, email_id: str) -> bool:
+        return email_id in self._by_id
+
+    def ids(self) -> List[str]:
+        """전체 이메일 ID 목록 (입력 순서)"""
+        return self._ids
+
+    def scheduled(self) -> List[ResultRecord]:
+        """일정이 발견된 결과 목록 (입력 순서)"""
+        return self._scheduled
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[ResultRecord]:
+        return iter(self._items)
+
+    def items(self, category: str = None) -> List[ResultRecord]:
+        """카테고리의 결과 목록 (None이면 전체, 입력 순서)"""
+        if category is None:
+            return self._items
+        return self._buckets.get(category, [])
+
+    def count(self, category: str = None) -> int:
+        """카테고리의 결과 수 (None이면 전체)"""
+        return len(self.items(category))
+
+    def query(self, category: str = None, sort_by: str = None, descending: bool = True,
+              min_values: Optional[Dict[str, float]] = None) -> List[ResultRecord]:
+        """
+        보상 조건으로 정렬/필터한 결과 목록
+
+        Args:
+            category: 분류 카테고리 (None이면 전체)
+            sort_by: 정렬 기준 METRICS 중 하나 (None이면 입력 순서, 값이 없는 결과는 뒤에)
+            descending: 큰 값부터 정렬
+            min_values: {열: 최솟값} 조건 (예: {'commission': 10}) — 값이 없는 결과는 제외
+        """
+        # 최솟값 조건: 정렬 인덱스에서 이진 탐색으로 조건을 만족하는 순번만 모음
+        positions = None
+        for metric, threshold in (min_values or {}).items():
+            index = self._metric_index[metric]
+            matched = {position for _, position in index[bisect_left(index, (threshold, -1)):]}
+            positions = matched if positions is None else positions & matched
+
+        if sort_by is None:
+            order = range(len(self._items))
+        else:
+            index = self._metric_index[sort_by]
+            ranked = [position for _, position in (reversed(index) if descending else index)]
+            # 정렬 값이 없는 결과는 입력 순서로 뒤에 붙임
+            ranked_set = set(ranked)
+            order = ranked + [position for position in range(len(self._items)) if position not in ranked_set]
+
+        return [
+            self._items[position] for position in order
+            if (positions is None or position in positions)
+            and (category is None or self._items[position].classification == category)
+        ]
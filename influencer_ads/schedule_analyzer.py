@@ -1,29 +1,75 @@
 import re
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 import urllib.parse
 
+from date_resolver import (
+    DEFAULT_TIMEZONE, EN_RELATIVE_REGEX, KO_RELATIVE_REGEX, NUMERIC_RELATIVE_REGEX, RelativeDateResolver
+)
+from keyword_matcher import KeywordMatcher
+
+# 날짜 표현 (긴 형식을 앞에 두어 같은 위치에서는 가장 긴 표현이 선택되고,
+# 이미 매칭된 "2024년 1월 15일" 안의 "1월 15일", "15일"은 다시 매칭되지 않음)
+_DATE_REGEX = r"""
+    (?<!\d)
+    (?:
+        (?P<year>\d{4})\s*[년\-/.]\s*(?P<ymd_month>\d{1,2})\s*[월\-/.]\s*(?P<ymd_day>\d{1,2})(?!\d)\s*일?   # 2024년 1월 15일, 2024/1/15
+      | (?P<md_month>\d{1,2})\s*월\s*(?P<md_day>\d{1,2})\s*일?                                  # 1월 15일
+      | (?P<slash_month>\d{1,2})[/\-](?P<slash_day>\d{1,2})(?![\d/\-])                           # 1/15
+      | (?P<day>\d{1,2})\s*일(?:\s*(?P<day_after>후|뒤))?                                        # 15일, 3일 후
+    )
+"""
+
+# 시간 표현 (오전/오후 접두어가 붙은 형식을 먼저 시도)
+_TIME_REGEX = r"""
+    (?P<meridiem>오전|오후)\s*(?P<m_hour>\d{1,2})(?:\s*:\s*(?P<m_minute>\d{2})|\s*시(?:\s*(?P<m_minute_kr>\d{1,2})\s*분)?)?   # 오후 2시 30분
+  | (?<!\d)(?P<en_hour>\d{1,2})(?::(?P<en_minute>\d{2}))?\s*(?P<ampm>[apAP])\.?[mM]\b\.?                              # 3pm, 3:30 p.m.
+  | (?<!\d)(?P<c_hour>\d{1,2}):(?P<c_minute>\d{2})(?!\d)                                                                # 14:30
+  | (?<!\d)(?P<k_hour>\d{1,2})\s*시(?:\s*(?P<k_minute>\d{1,2})\s*분)?                                                  # 14시 30분
+"""
+
+# 날짜, 한국어 상대 날짜, 시간을 한 번의 스캔으로 찾는 결합 패턴
+# 모든 표현은 숫자 또는 몇 개의 한글 글자('오전', '내일', '다음주', '금요일' 등)로
+# 시작하므로 전방 탐색으로 나머지 위치를 빠르게 건너뜀
+# 분기마다 바깥 그룹 이름(date/time/numeric/ko_relative)을 붙여 match.lastgroup으로
+# 종류를 바로 구분하고, 필요한 그룹만 꺼내 씀 (groupdict()는 모든 그룹을 만들어 느림)
+SCHEDULE_PATTERN = re.compile(
+    r"(?=[\d오내모글이금다차월화수목토일])(?:(?P<date>" + _DATE_REGEX + r")|(?P<time>" + _TIME_REGEX
+    + r")|(?<!\d)(?P<numeric>" + NUMERIC_RELATIVE_REGEX + r")|" + KO_RELATIVE_REGEX + r")",
+    re.VERBOSE
+)
+
+_DATE_GROUPS = ('year', 'ymd_month', 'ymd_day', 'md_month', 'md_day', 'slash_month', 'slash_day', 'day', 'day_after')
+_TIME_GROUPS = ('meridiem', 'm_hour', 'm_minute', 'm_minute_kr', 'en_hour', 'en_minute', 'ampm',
+                'c_hour', 'c_minute', 'k_hour', 'k_minute')
+
+# 영어 상대 날짜 패턴 (소문자로 바꾼 텍스트에 적용)
+# 영어 단어 위치까지 결합 패턴에 넣으면 모든 알파벳 위치에서 분기를 시도하게 되어
+# 한국어 메일까지 느려지므로 별도 패턴으로 분리
+EN_RELATIVE_PATTERN = re.compile(EN_RELATIVE_REGEX, re.VERBOSE)
+
+# 영어 상대 날짜 스캔이 필요한 텍스트인지 확인 (한국어만 있는 메일은 건너뜀)
+_ASCII_LETTER = re.compile(r'[A-Za-z]')
+
+# scan_rows 결과 (값, (시작, 끝)) 튜플의 필드
+_VALUE = itemgetter(0)
+_SPAN = itemgetter(1)
+
+# 해석 캐시에 없는 항목 표시 (None은 해석할 수 없는 표현으로 캐시됨)
+_UNRESOLVED = object()
+
+
 class ScheduleAnalyzer:
     """협찬 이메일에서 일정 정보를 분석하고 캘린더 링크를 생성하는 클래스"""
     
-    def __init__(self):
-        # 날짜 패턴들
-        self.date_patterns = [
-            r'(\d{4})[년\-\/](\d{1,2})[월\-\/](\d{1,2})[일]?',  # 2024년 1월 15일
-            r'(\d{1,2})[월\-\/](\d{1,2})[일]?',  # 1월 15일
-            r'(\d{1,2})[일]',  # 15일
-            r'(\d{4})[년\-\/](\d{1,2})[월\-\/](\d{1,2})',  # 2024/1/15
-            r'(\d{1,2})[\/\-](\d{1,2})',  # 1/15
-        ]
-        
-        # 시간 패턴들
-        self.time_patterns = [
-            r'(\d{1,2}):(\d{2})',  # 14:30
-            r'(\d{1,2})시\s*(\d{1,2})분?',  # 14시 30분
-            r'(\d{1,2})시',  # 14시
-            r'오전\s*(\d{1,2}):?(\d{1,2})?',  # 오전 9시
-            r'오후\s*(\d{1,2}):?(\d{1,2})?',  # 오후 2시
-        ]
+    def __init__(self, timezone: str = DEFAULT_TIMEZONE):
+        """
+        Args:
+            timezone: 기준 시각을 계산할 시간대 (예: 'Asia/Seoul')
+        """
+        # '다음주 화요일', 'next Friday' 같은 상대 날짜 해석기
+        self.resolver = RelativeDateResolver(timezone)
         
         # 마감일 관련 키워드
         self.deadline_keywords = [
@@ -36,128 +82,177 @@ class ScheduleAnalyzer:
             '미팅', '회의', 'meeting', '화상회의', '콜', 'call',
             '촬영', '영상', '사진', '방송', '라이브', 'live'
         ]
+        
+        # 마감/이벤트 키워드 검색기 (대소문자 무시)
+        self.keyword_matcher = KeywordMatcher(self.deadline_keywords + self.event_keywords)
+        
+        # (기준 시각, {(종류, 매칭 텍스트): 해석된 날짜/시간}) - scan_rows 참고
+        self._resolved: Tuple[Optional[datetime], Dict] = (None, {})
     
-    def extract_dates(self, text: str) -> List[Dict]:
-        """텍스트에서 날짜 정보 추출"""
+    def scan(self, text: str, now: Optional[datetime] = None) -> Tuple[List[Dict], List[Dict]]:
+        """
+        텍스트를 왼쪽에서 오른쪽으로 한 번만 스캔하여 날짜와 시간 정보 추출
+        
+        Args:
+            text: 분석할 텍스트
+            now: 상대 날짜와 연도/월이 생략된 날짜의 기준 시각
+                 (여러 이메일을 처리할 때 한 번만 계산해 전달)
+        
+        Returns:
+            (날짜 리스트, 시간 리스트) 튜플
+        """
+        dates, times = self.scan_rows(text, now or self.resolver.reference_now())
+        return (
+            [{'date': date_obj, 'text': text[start:end], 'start_pos': start, 'end_pos': end}
+             for date_obj, (start, end) in dates],
+            [{'hour': hour, 'minute': minute, 'text': text[start:end], 'start_pos': start, 'end_pos': end}
+             for (hour, minute), (start, end) in times]
+        )
+    
+    def scan_rows(self, text: str, now: datetime) -> Tuple[List[Tuple], List[Tuple]]:
+        """
+        scan과 같은 추출을 딕셔너리 없이 (값, (시작 위치, 끝 위치)) 튜플로 반환
+        
+        날짜 값은 datetime, 시간 값은 (시, 분) 튜플이다. 기준 시각이 같으면 같은 표현은
+        항상 같은 값으로 해석되므로 (종류, 매칭 텍스트) -> 값을 기록해 두고 처음 나온 표현만
+        해석한다 ('내일', '다음주 화요일' 등은 이메일마다 반복됨).
+        
+        Args:
+            text: 분석할 텍스트
+            now: 기준 시각 (여러 텍스트에 같은 값을 전달해야 해석 결과가 재사용됨)
+        """
+        resolved = self._resolved_for(now)
         dates = []
+        times = []
+        
+        for match in SCHEDULE_PATTERN.finditer(text):
+            kind = match.lastgroup
+            key = (kind, match.group())
+            value = resolved.get(key, _UNRESOLVED)
+            if value is _UNRESOLVED:
+                value = resolved[key] = self._resolve_match(kind, match, now)
+            if value is not None:
+                (times if kind == 'time' else dates).append((value, match.span()))
+        
+        # 영어 상대 날짜 (영문자가 없으면 소문자 변환과 두 번째 스캔을 건너뜀,
+        # 소문자 변환으로 길이가 달라지는 드문 텍스트는 위치가 어긋나므로 건너뜀)
+        if _ASCII_LETTER.search(text) is None:
+            return dates, times
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            return dates, times
         
-        for pattern in self.date_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                groups = match.groups()
-                try:
-                    if len(groups) == 3:  # 년-월-일
-                        year, month, day = groups
-                        if int(year) < 100:  # 2자리 년도인 경우
-                            year = f"20{year}"
-                        date_obj = datetime(int(year), int(month), int(day))
-                    elif len(groups) == 2:  # 월-일
-                        month, day = groups
-                        current_year = datetime.now().year
-                        date_obj = datetime(current_year, int(month), int(day))
-                    elif len(groups) == 1:  # 일만
-                        day = groups[0]
-                        current_date = datetime.now()
-                        date_obj = datetime(current_date.year, current_date.month, int(day))
-                    
-                    dates.append({
-                        'date': date_obj,
-                        'text': match.group(),
-                        'start_pos': match.start(),
-                        'end_pos': match.end()
-                    })
-                except ValueError:
-                    continue
-        
-        return dates
+        english = []
+        for match in EN_RELATIVE_PATTERN.finditer(lowered):
+            key = ('en', match.group())
+            value = resolved.get(key, _UNRESOLVED)
+            if value is _UNRESOLVED:
+                value = resolved[key] = self._resolve_match('en', match, now)
+            if value is not None:
+                english.append((value, match.span()))
+        if english:
+            dates.extend(english)
+            dates.sort(key=_SPAN)
+        
+        return dates, times
+    
+    def _resolved_for(self, now: datetime) -> Dict:
+        """기준 시각별 해석 결과 캐시 (기준 시각이 바뀌면 새로 시작)"""
+        cache = self._resolved
+        if cache[0] != now:
+            cache = self._resolved = (now, {})
+        return cache[1]
+    
+    def _resolve_match(self, kind: str, match, now: datetime):
+        """매칭 결과를 날짜 또는 (시, 분)으로 변환 (해석할 수 없으면 None)"""
+        if kind == 'time':
+            return self._parse_time(match.group(*_TIME_GROUPS))
+        
+        # 연도가 생략된 날짜는 기준 시각 이후 가장 가까운 날짜로 해석
+        # (예: 20일에 받은 메일의 "15일"은 다음 달 15일)
+        try:
+            if kind == 'date':
+                year, ymd_month, ymd_day, md_month, md_day, slash_month, slash_day, day, day_after = \
+                    match.group(*_DATE_GROUPS)
+                if year:  # 년-월-일
+                    return datetime(int(year), int(ymd_month), int(ymd_day))
+                if md_month:  # 월-일
+                    return self.resolver.upcoming(int(md_month), int(md_day), now)
+                if slash_month:  # 월/일
+                    return self.resolver.upcoming(int(slash_month), int(slash_day), now)
+                if day_after:  # N일 후
+                    return self.resolver.offset(now, int(day), 'day')
+                return self.resolver.upcoming_day(int(day), now)  # 일만
+            
+            # 다음주 화요일, 2주 후, 10th of March, next friday 등
+            return self.resolver.resolve(match.groupdict(), now)
+        except ValueError:
+            return None
+    
+    def extract_dates(self, text: str, now: Optional[datetime] = None) -> List[Dict]:
+        """텍스트에서 날짜 정보 추출"""
+        return self.scan(text, now)[0]
     
     def extract_times(self, text: str) -> List[Dict]:
         """텍스트에서 시간 정보 추출"""
-        times = []
+        return self.scan(text)[1]
+    
+    @staticmethod
+    def _parse_time(groups: Tuple) -> Optional[Tuple[int, int]]:
+        """시간 매칭 그룹(_TIME_GROUPS 순서)을 시/분으로 변환 (존재하지 않는 시각이면 None)"""
+        meridiem, m_hour, m_minute, m_minute_kr, en_hour, en_minute, ampm, c_hour, c_minute, k_hour, k_minute = groups
+        if meridiem:
+            hour = m_hour
+            minute = m_minute or m_minute_kr
+        elif en_hour:
+            hour, minute = en_hour, en_minute
+            meridiem = '오후' if ampm.lower() == 'p' else '오전'
+        elif c_hour:
+            hour, minute = c_hour, c_minute
+        else:
+            hour, minute = k_hour, k_minute
         
-        for pattern in self.time_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                groups = match.groups()
-                try:
-                    if len(groups) == 2:  # 시:분
-                        hour, minute = groups
-                        hour = int(hour)
-                        minute = int(minute) if minute else 0
-                    elif len(groups) == 1:  # 시만
-                        hour = int(groups[0])
-                        minute = 0
-                    else:
-                        continue
-                    
-                    # 오전/오후 처리
-                    if '오후' in match.group() and hour < 12:
-                        hour += 12
-                    elif '오전' in match.group() and hour == 12:
-                        hour = 0
-                    
-                    times.append({
-                        'hour': hour,
-                        'minute': minute,
-                        'text': match.group(),
-                        'start_pos': match.start(),
-                        'end_pos': match.end()
-                    })
-                except ValueError:
-                    continue
-        
-        return times
-    
-    def analyze_schedule(self, email_data: Dict) -> Dict:
-        """이메일에서 일정 정보 분석"""
-        subject = email_data.get('subject', '')
-        body = email_data.get('body', email_data.get('snippet', ''))
-        combined_text = f"{subject} {body}"
+        hour = int(hour)
+        minute = int(minute) if minute else 0
         
-        # 날짜와 시간 추출
-        dates = self.extract_dates(combined_text)
-        times = self.extract_times(combined_text)
-        
-        # 마감일 키워드 확인
-        is_deadline = any(keyword in combined_text.lower() for keyword in self.deadline_keywords)
-        
-        # 이벤트 키워드 확인
-        is_event = any(keyword in combined_text.lower() for keyword in self.event_keywords)
-        
-        # 가장 가까운 날짜 선택
-        target_date = None
-        if dates:
-            # 현재 날짜와 가장 가까운 미래 날짜 선택
-            current_date = datetime.now()
-            future_dates = [d for d in dates if d['date'] >= current_date]
-            if future_dates:
-                target_date = min(future_dates, key=lambda x: x['date'])
-            else:
-                target_date = max(dates, key=lambda x: x['date'])
-        
-        # 기본 시간 설정
-        target_time = None
-        if times:
-            target_time = times[0]  # 첫 번째 시간 사용
-        else:
-            # 기본 시간 설정 (오후 2시)
-            target_time = {'hour': 14, 'minute': 0}
+        # 오전/오후 처리
+        if meridiem == '오후' and hour < 12:
+            hour += 12
+        elif meridiem == '오전' and hour == 12:
+            hour = 0
         
-        # 캘린더 이벤트 생성
-        event_data = self.create_calendar_event(
-            email_data, target_date, target_time, is_deadline, is_event
-        )
+        # 존재하지 않는 시각은 무시 (예: 25시, 14:75)
+        if hour > 23 or minute > 59:
+            return None
         
-        return {
-            'has_schedule': bool(target_date),
-            'target_date': target_date,
-            'target_time': target_time,
-            'is_deadline': is_deadline,
-            'is_event': is_event,
-            'calendar_event': event_data,
-            'extracted_dates': dates,
-            'extracted_times': times
-        }
+        return hour, minute
+    
+    def analyze_schedule(self, email_data: Dict, now: Optional[datetime] = None) -> Dict:
+        """
+        이메일에서 일정 정보 분석
+        
+        Args:
+            email_data: 이메일 데이터
+            now: 기준 시각 (여러 이메일을 분석할 때는 analyze_many 사용 권장)
+        """
+        batch = self.analyze_many([email_data], now)
+        return batch.to_schedule_data(batch.keys[0])
+    
+    def analyze_many(self, emails: List[Dict], now: Optional[datetime] = None) -> 'ScheduleBatch':
+        """
+        여러 이메일의 일정 정보를 한 번에 분석
+        
+        모든 텍스트를 컴파일된 패턴으로 스캔해 추출 결과를 열 단위로 모으고,
+        캘린더 이벤트/링크는 일정이 있는 이메일에 대해 요청될 때만 생성한다.
+        
+        Args:
+            emails: 이메일 데이터 리스트
+            now: 기준 시각 (지정하지 않으면 호출 시점에 한 번 계산)
+        """
+        batch = ScheduleBatch(self, now or self.resolver.reference_now())
+        for email_data in emails:
+            batch.add(email_data)
+        return batch
     
     def create_calendar_event(self, email_data: Dict, target_date: Optional[Dict], 
                             target_time: Optional[Dict], is_deadline: bool, is_event: bool) -> Dict:
@@ -232,3 +327,195 @@ class ScheduleAnalyzer:
         query_string = '&'.join([f"{k}={urllib.parse.quote(str(v))}" for k, v in params.items()])
         
         return f"https://calendar.google.com/calendar/render?{query_string}"
+
+
+class ScheduleBatch:
+    """여러 이메일의 일정 분석 결과 (추출 항목을 열 단위로 저장)
+    
+    열:
+        row_keys: 추출 항목이 나온 이메일 키 (이메일 id, 없으면 입력 순번)
+        values: 'date' 항목은 datetime, 'time' 항목은 (시, 분) 튜플
+        kinds: 'date' 또는 'time'
+        spans: 결합 텍스트("제목 본문") 기준 (시작, 끝) 위치
+    """
+    
+    # 시간이 없을 때 기본 일정 시각 (오후 2시)
+    DEFAULT_TIME = (14, 0)
+    
+    # 일정 길이 (create_calendar_event의 종료 시각과 같음)
+    EVENT_DURATION = timedelta(hours=1)
+    
+    def __init__(self, analyzer: ScheduleAnalyzer, now: datetime):
+        self.analyzer = analyzer
+        self.now = now
+        # '오늘', '내일'처럼 시각 없이 해석된 날짜도 미래 일정으로 취급하기 위한 기준
+        self.today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        self.keys: List = []
+        self.row_keys: List = []
+        self.values: List = []
+        self.kinds: List[str] = []
+        self.spans: List[Tuple[int, int]] = []
+        self._emails: Dict = {}
+        self._rows: Dict = {}
+        # 키 -> (선택된 날짜 행, 선택된 시간 행 또는 None, 마감 여부, 이벤트 여부)
+        self._targets: Dict = {}
+        self._events: Dict = {}
+        # 키 -> {'conflicts', 'free_slot'} (check_conflicts 호출 후)
+        self._conflicts: Dict = {}
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def add(self, email_data: Dict):
+        """이메일 한 건을 스캔하여 열에 추가 후 이메일 키 반환"""
+        key = email_data.get('id', len(self.keys))
+        subject = email_data.get('subject', '')
+        body = email_data.get('body', email_data.get('snippet', ''))
+        combined_text = f"{subject} {body}"
+        
+        dates, times = self.analyzer.scan_rows(combined_text, self.now)
+        
+        self.keys.append(key)
+        self._emails[key] = email_data
+        first_row = len(self.kinds)
+        
+        # 가장 가까운 미래 날짜 (없으면 가장 늦은 과거 날짜)
+        target_row = None
+        best_future = None
+        best_past = None
+        for row, (date_obj, _) in enumerate(dates, first_row):
+            if date_obj >= self.today:
+                if best_future is None or date_obj < best_future:
+                    best_future = date_obj
+                    target_row = row
+            elif best_future is None and (best_past is None or date_obj > best_past):
+                best_past = date_obj
+                target_row = row
+        
+        # 날짜 행 다음에 시간 행 (첫 번째 시간 사용)
+        time_row = first_row + len(dates) if times else None
+        
+        rows = dates + times
+        self.row_keys.extend([key] * len(rows))
+        self.kinds.extend(['date'] * len(dates) + ['time'] * len(times))
+        self.values.extend(map(_VALUE, rows))
+        self.spans.extend(map(_SPAN, rows))
+        
+        self._rows[key] = (first_row, len(self.kinds))
+        
+        if target_row is not None:
+            found = self.analyzer.keyword_matcher.find_keywords(combined_text)
+            is_deadline = not found.isdisjoint(self.analyzer.deadline_keywords)
+            is_event = not found.isdisjoint(self.analyzer.event_keywords)
+            self._targets[key] = (target_row, time_row, is_deadline, is_event)
+        
+        return key
+    
+    def has_schedule(self, key) -> bool:
+        """일정이 발견된 이메일인지 확인"""
+        return key in self._targets
+    
+    def scheduled_keys(self) -> List:
+        """일정이 발견된 이메일 키 목록 (입력 순서)"""
+        return [key for key in self.keys if key in self._targets]
+    
+    def event_datetime(self, key) -> Optional[datetime]:
+        """이메일의 일정 시작 시각 (일정이 없으면 None)"""
+        target = self._targets.get(key)
+        if target is None:
+            return None
+        
+        date_row, time_row, _, _ = target
+        hour, minute = self.values[time_row] if time_row is not None else self.DEFAULT_TIME
+        return self.values[date_row].replace(hour=hour, minute=minute, second=0, microsecond=0)
+    
+    def schedule_summary(self, key) -> Optional[Tuple[datetime, bool, bool]]:
+        """(일정 시작 시각, 마감 여부, 이벤트 여부) (일정이 없으면 None, 결과를 오래 보관할 때 사용)"""
+        target = self._targets.get(key)
+        if target is None:
+            return None
+        return self.event_datetime(key), target[2], target[3]
+    
+    def calendar_event(self, key) -> Optional[Dict]:
+        """캘린더 이벤트 데이터 (처음 요청될 때 생성 후 캐시)"""
+        if key not in self._targets:
+            return None
+        
+        if key not in self._events:
+            date_row, time_row, is_deadline, is_event = self._targets[key]
+            self._events[key] = self.analyzer.create_calendar_event(
+                self._emails[key],
+                self._date_item(date_row),
+                self._time_item(time_row),
+                is_deadline,
+                is_event
+            )
+        return self._events[key]
+    
+    def check_conflicts(self, busy_index) -> Dict:
+        """
+        일정이 있는 모든 이메일을 캘린더 일정과 한 번에 비교
+        
+        Args:
+            busy_index: schedule_conflicts.BusyIndex (캐시된 캘린더 일정,
+                        분석기와 같은 시간대로 생성)
+        
+        Returns:
+            키 -> {'conflicts', 'free_slot'} (to_schedule_data 결과에도 포함됨)
+        """
+        from schedule_conflicts import find_conflicts
+        
+        proposals = {}
+        for key in self.scheduled_keys():
+            start = self.event_datetime(key)
+            proposals[key] = (start, start + self.EVENT_DURATION)
+        
+        self._conflicts = find_conflicts(proposals, busy_index)
+        return self._conflicts
+    
+    def to_schedule_data(self, key) -> Dict:
+        """analyze_schedule과 같은 형식의 결과 딕셔너리"""
+        start, end = self._rows[key]
+        target = self._targets.get(key)
+        
+        if target is None:
+            date_row, time_row, is_deadline, is_event = None, None, False, False
+        else:
+            date_row, time_row, is_deadline, is_event = target
+        
+        return {
+            'has_schedule': target is not None,
+            'target_date': self._date_item(date_row) if date_row is not None else None,
+            'target_time': self._time_item(time_row),
+            'is_deadline': is_deadline,
+            'is_event': is_event,
+            'calendar_event': self.calendar_event(key),
+            'extracted_dates': [self._date_item(row) for row in range(start, end) if self.kinds[row] == 'date'],
+            'extracted_times': [self._time_item(row) for row in range(start, end) if self.kinds[row] == 'time'],
+            'conflicts': self._conflicts.get(key, {}).get('conflicts', []),
+            'free_slot': self._conflicts.get(key, {}).get('free_slot')
+        }
+    
+    def _date_item(self, row: int) -> Dict:
+        """날짜 행을 extract_dates 형식으로 변환"""
+        start_pos, end_pos = self.spans[row]
+        return {
+            'date': self.values[row],
+            'start_pos': start_pos,
+            'end_pos': end_pos
+        }
+    
+    def _time_item(self, row: Optional[int]) -> Dict:
+        """시간 행을 extract_times 형식으로 변환 (None이면 기본 시각)"""
+        if row is None:
+            hour, minute = self.DEFAULT_TIME
+            return {'hour': hour, 'minute': minute}
+        
+        hour, minute = self.values[row]
+        start_pos, end_pos = self.spans[row]
+        return {
+            'hour': hour,
+            'minute': minute,
+            'start_pos': start_pos,
+            'end_pos': end_pos
+        }
@@ -0,0 +1,183 @@
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from calendar_cache import LOCAL_TIMEZONE, to_aware, zone_info
+
+# 빈 시간 추천 범위 (이 시각 사이에서만 대체 일정을 찾음)
+WORK_START_HOUR = 9
+WORK_END_HOUR = 21
+
+# 빈 시간을 찾을 최대 기간
+SEARCH_DAYS = 14
+
+
+class _CenterNode:
+    """구간 트리 노드: 중심 시각을 포함하는 구간과 중심 왼쪽/오른쪽 하위 트리"""
+
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+
+    def __init__(self, intervals: List[Tuple[datetime, datetime, int]]):
+        """
+        Args:
+            intervals: (시작, 종료, 순번) 목록 (시작 시각 순 정렬)
+        """
+        # 시작 시각의 중앙값을 중심으로 하면 양쪽 하위 트리가 각각 절반 이하가 됨
+        self.center = center = intervals[len(intervals) // 2][0]
+        here, left, right = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        self.by_start = here
+        self.by_end = sorted(here, key=lambda interval: interval[1], reverse=True)
+        self.left = _CenterNode(left) if left else None
+        self.right = _CenterNode(right) if right else None
+
+
+class BusyIndex:
+    """캘린더 일정 구간 인덱스 (겹침 조회와 가장 가까운 빈 시간 검색)
+
+    겹침 조회는 중심 구간 트리(centered interval tree)를 쓰므로 긴 일정이 섞여 있어도
+    O(log m + k)에 끝난다 (m: 일정 수, k: 겹친 일정 수).
+    빈 시간 검색은 겹치는 구간을 합친 바쁜 구간 목록에서 이진 탐색한다.
+    """
+
+    def __init__(self, events: Iterable[Tuple[datetime, datetime, Dict]], timezone: str = LOCAL_TIMEZONE):
+        """
+        Args:
+            events: (시작, 종료, 이벤트) 목록 (CalendarEventCache.timed_events)
+            timezone: 시간대 정보가 없는 시각을 해석할 시간대 (ScheduleAnalyzer와 같은 값)
+        """
+        self.tzinfo = zone_info(timezone)
+        intervals = []
+        for start, end, event in events:
+            if event.get('transparency') == 'transparent':  # '한가함'으로 표시된 일정 제외
+                continue
+            start, end = to_aware(start, self.tzinfo), to_aware(end, self.tzinfo)
+            # 종료가 시작보다 앞선 잘못된 일정은 길이 0으로 보정 (트리 분할이 끝나지 않는 것 방지)
+            intervals.append((start, max(start, end), event))
+        intervals.sort(key=lambda interval: (interval[0], interval[1]))
+        self.intervals = intervals
+        self._tree = _CenterNode(
+            [(start, end, order) for order, (start, end, _) in enumerate(intervals)]
+        ) if intervals else None
+
+        # 겹치거나 맞닿은 일정을 합친 바쁜 구간 (시작 순, 서로 떨어져 있음)
+        merged: List[List[datetime]] = []
+        for start, end, _ in intervals:
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._busy_starts = [start for start, _ in merged]
+        self._busy_ends = [end for _, end in merged]
+
+    def __len__(self) -> int:
+        return len(self.intervals)
+
+    def overlaps(self, start: datetime, end: datetime) -> List[Dict]:
+        """[start, end) 구간과 겹치는 일정 목록 (시작 시각 순)"""
+        start, end = to_aware(start, self.tzinfo), to_aware(end, self.tzinfo)
+        found = []
+        node = self._tree
+        pending = []
+        while node is not None or pending:
+            if node is None:
+                node = pending.pop()
+            if end <= node.center:
+                # 조회 구간이 중심 왼쪽: 노드 구간은 모두 중심 이후에 끝나므로 시작 순으로 end 전까지만
+                for event_start, event_end, order in node.by_start:
+                    if event_start >= end:
+                        break
+                    if event_end > start:
+                        found.append(order)
+                node = node.left
+            elif start >= node.center:
+                # 조회 구간이 중심 오른쪽: 노드 구간은 모두 중심 전에 시작하므로 종료 역순으로 start 이후까지만
+                for event_start, event_end, order in node.by_end:
+                    if event_end <= start:
+                        break
+                    if event_start < end:
+                        found.append(order)
+                node = node.right
+            else:
+                # 조회 구간이 중심을 포함: 노드 구간은 모두 겹침, 양쪽 하위 트리 모두 확인
+                found.extend(order for _, _, order in node.by_start)
+                if node.right is not None:
+                    pending.append(node.right)
+                node = node.left
+        found.sort()
+        return [self.intervals[order][2] for order in found]
+
+    def next_free_slot(self, start: datetime, duration: timedelta) -> Optional[datetime]:
+        """start 이후 duration만큼 비어 있는 가장 이른 시작 시각 (업무 시간 안, 없으면 None)
+
+        반환값은 start와 같은 형식(시간대 정보 유무)을 따른다.
+        """
+        naive = start.tzinfo is None
+        candidate = to_aware(start, self.tzinfo)
+        limit = candidate + timedelta(days=SEARCH_DAYS)
+
+        while candidate < limit:
+            candidate = self._within_work_hours(candidate, duration)
+            # candidate 이전에 시작한 바쁜 구간이 candidate 이후까지 이어지면 그 끝으로 이동
+            index = bisect_right(self._busy_starts, candidate) - 1
+            if index >= 0 and self._busy_ends[index] > candidate:
+                candidate = self._busy_ends[index]
+                continue
+            # 다음 바쁜 구간이 duration 안에 시작하면 그 끝으로 이동
+            index += 1
+            if index < len(self._busy_starts) and self._busy_starts[index] < candidate + duration:
+                candidate = self._busy_ends[index]
+                continue
+            return candidate.replace(tzinfo=None) if naive else candidate
+
+        return None
+
+    @staticmethod
+    def _within_work_hours(candidate: datetime, duration: timedelta) -> datetime:
+        """업무 시간 밖이면 가장 가까운 다음 업무 시작 시각으로 이동"""
+        day_start = candidate.replace(hour=WORK_START_HOUR, minute=0, second=0, microsecond=0)
+        day_end = candidate.replace(hour=WORK_END_HOUR, minute=0, second=0, microsecond=0)
+        if candidate < day_start:
+            return day_start
+        if candidate + duration > day_end:
+            return day_start + timedelta(days=1)
+        return candidate
+
+
+def find_conflicts(proposals: Dict, busy_index: BusyIndex) -> Dict:
+    """
+    제안 일정 전체의 겹치는 일정과 대체 가능한 빈 시간 계산
+
+    인덱스를 한 번 만든 뒤(O(m log m)) 제안마다 트리/이진 탐색만 하므로 이메일마다 API를
+    호출하지 않고 O((n + m) log m + k)에 끝난다 (n: 제안 수, m: 캘린더 일정 수, k: 겹친 일정 수).
+
+    Args:
+        proposals: 키 -> (시작, 종료) 구간
+        busy_index: 캘린더 일정 인덱스
+
+    Returns:
+        키 -> {'conflicts': [{'summary', 'start', 'end', 'link'}], 'free_slot': datetime 또는 None}
+        (겹치는 일정이 없으면 free_slot은 None)
+    """
+    results = {}
+    for key, (start, end) in proposals.items():
+        overlapping = busy_index.overlaps(start, end)
+        results[key] = {
+            'conflicts': [
+                {
+                    'summary': event.get('summary', '(제목 없음)'),
+                    'start': event['start'].get('dateTime', event['start'].get('date')),
+                    'end': event.get('end', {}).get('dateTime', event.get('end', {}).get('date')),
+                    'link': event.get('htmlLink', ''),
+                }
+                for event in overlapping
+            ],
+            'free_slot': busy_index.next_free_slot(start, end - start) if overlapping else None,
+        }
+    return results
@@ -0,0 +1,192 @@
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, List
+
+# 검색 인덱스 DB 파일
+SEARCH_DB = 'search_index.db'
+
+# 검색 결과 최대 개수
+SEARCH_LIMIT = 50
+
+# 결과 목록에 보여줄 본문 앞부분 길이
+PREVIEW_CHARS = 300
+
+# 색인 열과 검색 순위 가중치 (bm25, 제목/발신자 일치를 본문보다 높게)
+INDEX_COLUMNS = ('subject', 'sender', 'body', 'translated_body', 'explanation')
+COLUMN_WEIGHTS = (5.0, 3.0, 1.0, 1.0, 2.0)
+
+# 한글/한자/가나는 글자 2개씩(바이그램), 그 외 문자/숫자는 단어 단위로 자름
+_CJK_CHARS = '가-힣ㄱ-ㆎ一-鿿぀-ヿ'
+_TOKEN_PATTERN = re.compile(f'([{_CJK_CHARS}]+)|([^\\W_{_CJK_CHARS}]+)')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    검색용 토큰 목록
+
+    한국어는 띄어쓰기/조사가 일정하지 않아 단어 단위로는 잘 찾아지지 않으므로
+    한글 구간은 겹치는 글자 바이그램으로 색인한다 ("협찬제안" → 협찬, 찬제, 제안).
+    한 글자짜리 한글 구간은 그대로 둔다. 영문/숫자는 소문자 단어로 색인한다.
+    """
+    tokens = []
+    for cjk, word in _TOKEN_PATTERN.findall(text or ''):
+        if cjk:
+            if len(cjk) == 1:
+                tokens.append(cjk)
+            else:
+                tokens.extend(cjk[i:i + 2] for i in range(len(cjk) - 1))
+        else:
+            tokens.append(word.lower())
+    return tokens
+
+
+def build_match_query(query: str) -> str:
+    """검색어 → FTS5 MATCH 식 (모든 토큰 포함, 한 글자 한글은 앞부분 일치)"""
+    terms = []
+    for token in tokenize(query):
+        quoted = '"' + token.replace('"', '""') + '"'
+        if len(token) == 1 and not token.isascii():
+            quoted += '*'
+        terms.append(quoted)
+    return ' AND '.join(terms)
+
+
+class SearchIndex:
+    """처리한 이메일의 로컬 전문 검색 인덱스 (SQLite FTS5)
+
+    분류가 끝난 이메일을 한 건씩 바로 색인하므로, 지난 세션에 처리한 메일도
+    Gmail에 다시 요청하지 않고 밀리초 단위로 찾을 수 있다.
+    FTS5 토크나이저 대신 tokenize()로 미리 자른 토큰을 공백으로 이어 저장한다.
+    같은 이메일 ID를 다시 색인하면 기존 항목을 교체한다.
+    """
+
+    def __init__(self, db_path: str = SEARCH_DB):
+        """
+        Args:
+            db_path: 검색 인덱스 DB 파일 경로
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self.available = True
+        try:
+            self._conn = self._connect()
+        except sqlite3.Error as e:
+            # FTS5가 없는 SQLite 빌드 등
+            print(f"검색 인덱스 초기화 오류: {e}")
+            self._conn = None
+            self.available = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """DB 연결 및 테이블 생성 (캐시된 인스턴스를 여러 세션 스레드가 공유)"""
+        conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        with conn:
+            # 표시용 원문 정보 (rowid = 색인 행 번호)
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS emails (
+                    rowid INTEGER PRIMARY KEY,
+                    email_id TEXT UNIQUE NOT NULL,
+                    subject TEXT,
+                    sender TEXT,
+                    date TEXT,
+                    account TEXT,
+                    classification TEXT,
+                    explanation TEXT,
+                    preview TEXT,
+                    indexed_at TEXT
+                )"""
+            )
+            conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS email_fts USING fts5("
+                f"{', '.join(INDEX_COLUMNS)}, tokenize='unicode61 remove_diacritics 0')"
+            )
+        return conn
+
+    def add(self, record) -> bool:
+        """
+        분류 결과 한 건 색인 (같은 ID가 있으면 교체)
+
+        Args:
+            record: ResultRecord
+
+        Returns:
+            성공 여부
+        """
+        if not self.available:
+            return False
+
+        texts = (record.subject, record.sender, record.body, record.translated_body, record.explanation)
+        tokenized = [' '.join(tokenize(text)) for text in texts]
+        preview = (record.translated_body or record.body or '')[:PREVIEW_CHARS]
+
+        try:
+            with self._lock, self._conn:
+                row = self._conn.execute('SELECT rowid FROM emails WHERE email_id = ?', (record.id,)).fetchone()
+                if row is not None:
+                    self._conn.execute('DELETE FROM email_fts WHERE rowid = ?', (row[0],))
+                    self._conn.execute('DELETE FROM emails WHERE rowid = ?', (row[0],))
+
+                cursor = self._conn.execute(
+                    """INSERT INTO emails (email_id, subject, sender, date, account,
+                                           classification, explanation, preview, indexed_at)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                    (record.id, record.subject, record.sender, record.date, record.account,
+                     record.classification, record.explanation, preview, datetime.now().isoformat())
+                )
+                self._conn.execute(
+                    f"INSERT INTO email_fts (rowid, {', '.join(INDEX_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                    (cursor.lastrowid, *tokenized)
+                )
+            return True
+        except sqlite3.Error as e:
+            print(f"검색 인덱스 추가 오류: {e}")
+            return False
+
+    def search(self, query: str, category: str = None, limit: int = SEARCH_LIMIT) -> List[Dict]:
+        """
+        색인된 이메일 검색 (관련도 순)
+
+        Args:
+            query: 검색어 (모든 단어/글자쌍을 포함하는 이메일만)
+            category: 분류 카테고리 (None이면 전체)
+            limit: 최대 결과 수
+
+        Returns:
+            이메일 정보 목록 (id, subject, sender, date, account, classification, explanation, preview)
+        """
+        match = build_match_query(query)
+        if not self.available or not match:
+            return []
+
+        sql = (
+            f"SELECT e.email_id, e.subject, e.sender, e.date, e.account, "
+            f"e.classification, e.explanation, e.preview "
+            f"FROM email_fts JOIN emails e ON e.rowid = email_fts.rowid "
+            f"WHERE email_fts MATCH ?"
+        )
+        params = [match]
+        if category:
+            sql += " AND e.classification = ?"
+            params.append(category)
+        sql += f" ORDER BY bm25(email_fts, {', '.join(map(str, COLUMN_WEIGHTS))}) LIMIT ?"
+        params.append(limit)
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            print(f"검색 오류: {e}")
+            return []
+
+        fields = ('id', 'subject', 'sender', 'date', 'account', 'classification', 'explanation', 'preview')
+        return [dict(zip(fields, row)) for row in rows]
+
+    def count(self) -> int:
+        """색인된 이메일 수"""
+        if not self.available:
+            return 0
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM emails').fetchone()[0]
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from account_registry import AccountRegistry, MultiAccountFetcher
+from gmail_client import GmailClient
+
+
+def _message(message_id: str) -> dict:
+    return {
+        'id': message_id,
+        'snippet': '협찬 제안',
+        'payload': {
+            'headers': [
+                {'name': 'Subject', 'value': '협찬 제안'},
+                {'name': 'From', 'value': 'Brand <brand@example.com>'},
+                {'name': 'Date', 'value': 'Mon, 5 Jan 2026 10:00:00 +0900'},
+            ],
+            'mimeType': 'text/plain',
+            'body': {},
+        },
+    }
+
+
+def _client(account: str) -> GmailClient:
+    # 인증 없이 파싱만 확인
+    client = GmailClient.__new__(GmailClient)
+    client.account = account
+    return client
+
+
+@pytest.fixture
+def registry(tmp_path):
+    accounts_file = tmp_path / 'accounts.json'
+    accounts_file.write_text(json.dumps([
+        {'name': 'creator_a', 'token_file': 'a.pickle'},
+        {'name': 'creator_b', 'token_file': 'b.pickle'},
+    ]), encoding='utf-8')
+    registry = AccountRegistry(accounts_file=str(accounts_file))
+    registry._clients = {'creator_a': _client('creator_a'), 'creator_b': _client('creator_b')}
+    return registry
+
+
+def test_single_account_emails_are_tagged():
+    email = _client('creator_b')._parse_email(_message('m1'))
+    assert email['account'] == 'creator_b'
+
+
+def test_reply_uses_receiving_account(registry):
+    email = registry.get_client('creator_b')._parse_email(_message('m1'))
+    assert registry.get_reply_client(email).account == 'creator_b'
+
+
+def test_reply_refuses_without_account(registry):
+    with pytest.raises(ValueError):
+        registry.get_reply_client({'id': 'm1', 'subject': '협찬 제안'})
+    with pytest.raises(ValueError):
+        registry.get_reply_client({'id': 'm1', 'account': 'unknown'})
+
+
+def test_interleave_alternates_accounts():
+    merged = MultiAccountFetcher.interleave([[1, 3, 5], [2, 4]])
+    assert merged == [1, 2, 3, 4, 5]
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+
+from calendar_cache import CalendarEventCache
+from calendar_client import CalendarClient
+
+NOW = datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)
+
+
+def _event(event_id: str, start: datetime, end: datetime) -> dict:
+    return {'id': event_id, 'start': {'dateTime': start.isoformat()}, 'end': {'dateTime': end.isoformat()}}
+
+
+def _cache(tmp_path, events) -> CalendarEventCache:
+    cache = CalendarEventCache(str(tmp_path / 'calendar_cache.json'))
+    cache.apply(events)
+    return cache
+
+
+def test_upcoming_includes_events_in_progress(tmp_path):
+    cache = _cache(tmp_path, [
+        _event('trip', NOW - timedelta(days=3), NOW + timedelta(days=2)),
+        _event('done', NOW - timedelta(hours=3), NOW - timedelta(hours=2)),
+        _event('meeting', NOW - timedelta(minutes=30), NOW + timedelta(minutes=30)),
+        _event('ends-now', NOW - timedelta(hours=1), NOW),
+        _event('later', NOW + timedelta(hours=1), NOW + timedelta(hours=2)),
+    ])
+
+    assert [event['id'] for event in cache.upcoming(NOW)] == ['trip', 'meeting', 'later']
+    assert [event['id'] for event in cache.upcoming(NOW, max_results=2)] == ['trip', 'meeting']
+    assert cache.upcoming(NOW + timedelta(days=3)) == []
+
+
+class _FakeRequest:
+    def __init__(self, response):
+        self.response = response
+
+    def execute(self):
+        return self.response
+
+
+class _FakeEvents:
+    """events().list 호출 인자를 기록하고 미리 정한 페이지를 차례로 반환"""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.calls = []
+
+    def list(self, **params):
+        self.calls.append(params)
+        return _FakeRequest(self.pages.pop(0))
+
+
+class _FakeService:
+    def __init__(self, pages):
+        self._events = _FakeEvents(pages)
+
+    def events(self):
+        return self._events
+
+
+def _client(tmp_path, pages) -> CalendarClient:
+    client = CalendarClient()
+    client.cache = CalendarEventCache(str(tmp_path / 'calendar_cache.json'))
+    client.service = _FakeService(pages)
+    return client
+
+
+def test_full_sync_is_bounded_and_incremental_sync_uses_token(tmp_path):
+    start = datetime.now(timezone.utc) + timedelta(days=1)
+    client = _client(tmp_path, [
+        {'items': [_event('a', start, start + timedelta(hours=1))], 'nextPageToken': 'p2'},
+        {'items': [_event('b', start, start + timedelta(hours=2))], 'nextSyncToken': 's1'},
+        {'items': [{'id': 'a', 'status': 'cancelled'}], 'nextSyncToken': 's2'},
+    ])
+
+    assert client._sync(None) == 2
+    first, second = client.service.events().calls
+    assert 'syncToken' not in first and 'timeMin' in first
+    assert second['pageToken'] == 'p2' and second['timeMin'] == first['timeMin']
+    assert client.cache.sync_token == 's1'
+
+    assert client._sync('s1') == 1
+    incremental = client.service.events().calls[-1]
+    assert incremental['syncToken'] == 's1' and 'timeMin' not in incremental
+    assert list(client.cache.events) == ['b']
+    assert client.cache.sync_token == 's2'
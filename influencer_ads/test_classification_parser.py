@@ -0,0 +1,67 @@
+from classification_parser import ParseStats, classify_with_retry, parse_classification_result
+
+JSON_RESPONSE = ('```json\n{"category": "tier 2", "confidence": 85, "explanation": "조회수 보상이 있습니다.", '
+                 '"details": {"고정금액": "100만원", "조회수보상": "있음 - 1000회당 30원"}}\n```')
+
+LEGACY_RESPONSE = """**CATEGORY:** tier3
+CONFIDENCE: 0.9
+EXPLANATION: 판매 수수료가
+포함된 제안입니다.
+DETAILS:
+- 고정금액: 50만원
+- 판매수수료: 있음 - 판매액의
+  10%
+"""
+
+
+def test_json_response():
+    category, explanation, details, confidence, mode = parse_classification_result(JSON_RESPONSE)
+    assert (category, mode) == ('tier2', 'json')
+    assert confidence == 0.85
+    assert explanation == '조회수 보상이 있습니다.'
+    assert details['조회수보상'] == '있음 - 1000회당 30원'
+
+
+def test_legacy_fallback():
+    category, explanation, details, confidence, mode = parse_classification_result(LEGACY_RESPONSE)
+    assert (category, mode) == ('tier3', 'legacy')
+    assert confidence == 0.9
+    assert explanation == '판매 수수료가 포함된 제안입니다.'
+    assert details == {'고정금액': '50만원', '판매수수료': '있음 - 판매액의 10%'}
+
+
+def test_invalid_json_category_falls_back_to_lines():
+    _, _, _, _, mode = parse_classification_result('{"category": "tier9"}\nCATEGORY: 협찬 아님')
+    assert mode == 'legacy'
+    assert parse_classification_result('{"category": "tier9"}')[4] == 'failed'
+
+
+def test_retry_after_unparseable_response():
+    replies = iter(['잘 모르겠습니다.', '{"category": "tier1", "explanation": "고정 금액"}'])
+    calls = []
+
+    def chat(messages, temperature):
+        calls.append((len(messages), temperature))
+        return next(replies)
+
+    stats = ParseStats()
+    result = classify_with_retry(chat, [{'role': 'user', 'content': '협찬'}], stats)
+    assert result[0] == 'tier1' and result[4] == 'json'
+    assert calls == [(1, 0.3), (3, 0.0)]
+    assert stats.snapshot() == {'requests': 1, 'json': 1, 'legacy': 0, 'retries': 1, 'failed': 0}
+
+
+def test_unparseable_after_retries_is_unclear():
+    stats = ParseStats()
+    result = classify_with_retry(lambda messages, temperature: '???', [], stats, retries=1)
+    assert result[0] == 'unclear' and result[4] == 'failed'
+    assert stats.snapshot()['failed'] == 1
+
+
+def test_session_stats_roll_up_to_parent():
+    process = ParseStats()
+    session_a, session_b = ParseStats(parent=process), ParseStats(parent=process)
+    session_a.record('json')
+    session_b.record('legacy')
+    assert session_a.snapshot()['json'] == 1 and session_a.snapshot()['legacy'] == 0
+    assert process.snapshot()['json'] == 1 and process.snapshot()['legacy'] == 1
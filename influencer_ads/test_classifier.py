@@ -0,0 +1,105 @@
+import pytest
+
+pytest.importorskip('requests')
+
+from classifier import CascadeTier, SponsorshipClassifier, tiers_from_env
+from llm_backends import BackendRouter, LLMBackend, MockBackend
+
+SPONSOR = {'subject': '협찬 제안', 'sender': 'brand@example.com', 'body': '제품 리뷰 협찬, 판매 수수료 10% 드립니다.'}
+OTHER = {'subject': '안부', 'sender': 'friend@example.com', 'body': '잘 지내?'}
+
+
+def test_stats_are_kept_per_session():
+    classifier = SponsorshipClassifier(router=BackendRouter([MockBackend()]))
+    session_a, session_b = classifier.new_stats(), classifier.new_stats()
+
+    classifier.classify_many([SPONSOR, OTHER], stats=session_a)
+    classifier.classify_many([SPONSOR], stats=session_b)
+
+    assert session_a.snapshot()['parse']['requests'] == 2
+    assert session_b.snapshot()['parse']['requests'] == 1
+    assert session_b.snapshot()['backends']['mock:keyword']['calls'] == 1
+    # 분류기 자체 집계는 프로세스 전체
+    assert classifier.get_parse_stats()['requests'] == 3
+    assert classifier.get_backend_stats()['mock:keyword']['calls'] == 3
+    assert classifier.get_cascade_stats()['default']['calls'] == 3
+
+
+class _ScriptedBackend(LLMBackend):
+    """정해진 응답을 돌려주고 호출 수를 세는 백엔드"""
+
+    def __init__(self, name: str, reply: str, cost: float = 0.0):
+        self.name = name
+        self.cost_per_1k_tokens = cost
+        super().__init__()
+        self.reply = reply
+        self.calls = 0
+
+    def _complete(self, messages, temperature, max_tokens, json_mode):
+        self.calls += 1
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return self.reply, 1000
+
+
+def _cascade(cheap_reply, strong_reply='{"category": "tier2", "confidence": 0.95, "explanation": "강한 단계"}'):
+    cheap = _ScriptedBackend('cheap', cheap_reply, cost=1.0)
+    strong = _ScriptedBackend('strong', strong_reply, cost=10.0)
+    classifier = SponsorshipClassifier(tiers=[
+        CascadeTier('cheap', BackendRouter([cheap]), min_confidence=0.7),
+        CascadeTier('strong', BackendRouter([strong])),
+    ])
+    return classifier, cheap, strong
+
+
+def test_confident_cheap_answer_is_accepted():
+    classifier, cheap, strong = _cascade('{"category": "tier1", "confidence": 0.9, "explanation": "싼 단계"}')
+    assert classifier.classify_email(SPONSOR)[:2] == ('tier1', '싼 단계')
+    assert (cheap.calls, strong.calls) == (1, 0)
+    stats = classifier.get_cascade_stats()
+    assert stats['cheap']['accepted'] == 1 and stats['strong']['calls'] == 0
+
+
+@pytest.mark.parametrize('cheap_reply', [
+    '{"category": "tier1", "confidence": 0.4, "explanation": "애매함"}',
+    '{"category": "unclear", "confidence": 0.9, "explanation": "정보 부족"}',
+    '해석할 수 없는 응답',
+    RuntimeError('backend down'),
+])
+def test_escalates_to_stronger_tier(cheap_reply):
+    classifier, cheap, strong = _cascade(cheap_reply)
+    stats = classifier.new_stats()
+    assert classifier.classify_email(SPONSOR, stats)[:2] == ('tier2', '강한 단계')
+    assert (cheap.calls, strong.calls) == (1, 1)
+
+    cascade = stats.snapshot()['cascade']
+    assert cascade['cheap']['escalated'] + cascade['cheap']['errors'] == 1
+    assert cascade['strong']['accepted'] == 1
+    assert cascade['strong']['cost'] == pytest.approx(10.0)
+
+
+def test_last_tier_retries_unparseable_answer():
+    classifier, _, strong = _cascade('해석할 수 없는 응답', strong_reply='역시 해석할 수 없는 응답')
+    category, _, _ = classifier.classify_email(SPONSOR)
+    assert category == 'unclear'
+    # 앞 단계는 재요청하지 않고 넘기고, 마지막 단계만 형식 재요청
+    assert strong.calls == 2
+    assert classifier.get_parse_stats()['failed'] == 2
+
+
+def test_env_tiers_with_same_backend_get_separate_stats(monkeypatch):
+    monkeypatch.setenv('CLASSIFIER_CASCADE', 'mock, mock')
+    tiers = tiers_from_env()
+    assert [tier.name for tier in tiers] == ['1:mock', '2:mock']
+
+    classifier = SponsorshipClassifier(tiers=tiers)
+    classifier.classify_many([SPONSOR])
+    stats = classifier.get_cascade_stats()
+    assert set(stats) == {'1:mock', '2:mock'}
+    assert stats['1:mock']['calls'] == 1
+
+
+def test_duplicate_tier_names_are_rejected():
+    router = BackendRouter([MockBackend()])
+    with pytest.raises(ValueError):
+        SponsorshipClassifier(tiers=[CascadeTier('mock', router), CascadeTier('mock', router)])
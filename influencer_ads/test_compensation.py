@@ -0,0 +1,47 @@
+import pytest
+
+from compensation import normalize_details, parse_amount, parse_commission, parse_cpm, parse_fixed_fee
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('1억 2천만원', 120_000_000),
+    ('3천5백만', 35_000_000),
+    ('1,000,000원', 1_000_000),
+    ('₩500,000', 500_000),
+    ('영상 2회, 50만~100만원', 500_000),
+    ('2회 업로드', None),
+    ('', None),
+])
+def test_parse_amount(text, expected):
+    assert parse_amount(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('1000회당 5천원', 5000.0),
+    ('조회수 1만회당 10만원', 10_000.0),
+    ('CPM 3,000원', 3000.0),
+    ('조회수당 10원', 10_000.0),
+    ('없음', 0.0),
+    ('있음 (조건 미정)', None),
+])
+def test_parse_cpm(text, expected):
+    assert parse_cpm(text) == expected
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('있음 - 판매액의 10%', 10.0),
+    ('5~10 %', 5.0),
+    ('수수료 7퍼센트', 7.0),
+    ('없음', 0.0),
+    ('명시 안됨', None),
+])
+def test_parse_commission(text, expected):
+    assert parse_commission(text) == expected
+
+
+def test_normalize_details():
+    assert parse_fixed_fee('없음') == 0
+    assert parse_fixed_fee('명시 안됨') is None
+    details = {'고정금액': '300만원', '조회수보상': '있음 - 1000회당 5천원', '판매수수료': None}
+    assert normalize_details(details) == (3_000_000, 5000.0, None)
+    assert normalize_details(None) == (None, None, None)
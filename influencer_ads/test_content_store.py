@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pytest
+
+from content_store import ContentStore
+from email_manager import FAVORITE_FIELDS, EmailManager
+
+BODY = '안녕하세요, 협찬 제안드립니다. ' * 50
+
+
+def test_put_get_is_content_addressed(tmp_path):
+    store = ContentStore(str(tmp_path / 'bodies'))
+    first = store.put(BODY)
+    assert store.put(BODY) == first
+    assert store.get(first) == BODY
+    assert list(store.hashes()) == [first]
+
+    store.delete(first)
+    assert store.get(first) is None
+    assert list(store.hashes()) == []
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    # EmailManager는 현재 디렉터리에 DB/본문을 둠
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def _email(email_id: str) -> dict:
+    return {'id': email_id, 'subject': '협찬', 'sender': 'brand@example.com', 'date': '', 'body': BODY}
+
+
+def test_body_removed_with_last_reference(workdir):
+    manager = EmailManager()
+    manager.add_to_favorites(_email('a'), 'tier1', '')
+    manager.add_to_favorites(_email('b'), 'tier1', '')
+    assert len(list(manager.bodies.hashes())) == 1
+
+    manager.remove_from_favorites('a')
+    assert manager.get_favorite_body('b') == BODY
+
+    manager.remove_from_favorites('b')
+    assert list(manager.bodies.hashes()) == []
+
+
+def test_remove_waits_for_concurrent_add(workdir):
+    # 두 인스턴스 = 같은 DB를 쓰는 두 프로세스
+    remover = EmailManager()
+    adder = EmailManager()
+    remover.add_to_favorites(_email('a'), 'tier1', '')
+
+    removing = threading.Thread(target=remover.remove_from_favorites, args=('a',))
+    with adder._write_transaction(adder._conn):
+        # 다른 프로세스가 같은 본문을 저장한 뒤 행을 추가하기 직전
+        content_hash = adder.bodies.put(BODY)
+        removing.start()
+        time.sleep(0.3)
+        assert removing.is_alive()
+        row = dict(_email('b'), classification='tier1', explanation='', added_date='', body_hash=content_hash)
+        adder._conn.execute(
+            f"INSERT INTO favorites ({', '.join(FAVORITE_FIELDS)}) VALUES ({', '.join('?' for _ in FAVORITE_FIELDS)})",
+            tuple(row.get(field, '') for field in FAVORITE_FIELDS)
+        )
+    removing.join(10)
+
+    assert not remover.is_favorite('a')
+    assert adder.get_favorite_body('b') == BODY
+
+
+def test_orphaned_bodies_swept_on_load(workdir):
+    manager = EmailManager()
+    orphan = manager.bodies.put('남은 본문')
+    EmailManager()
+    assert manager.bodies.get(orphan) is None
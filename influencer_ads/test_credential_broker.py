@@ -0,0 +1,60 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from credential_broker import CredentialBroker, _BrokeredCredentials, _TokenEntry, _utcnow
+
+
+class _FakeCredentials:
+    """google-auth 인증 정보 흉내 (갱신 횟수만 기록)"""
+
+    def __init__(self):
+        self.token = 'token-0'
+        self.valid = False
+        self.refreshes = 0
+
+    def apply(self, headers):
+        headers['authorization'] = f'Bearer {self.token}'
+
+
+class _CountingBroker(CredentialBroker):
+    def _refresh_locked(self, entry):
+        # 네트워크 대신 잠시 기다렸다가 새 토큰 발급
+        time.sleep(0.05)
+        entry.credentials.refreshes += 1
+        entry.credentials.token = f'token-{entry.credentials.refreshes}'
+        entry.credentials.valid = True
+
+
+def _brokered():
+    broker = _CountingBroker()
+    entry = _TokenEntry('token.pickle', [])
+    entry.credentials = _FakeCredentials()
+    return _BrokeredCredentials(broker, entry), entry
+
+
+def test_concurrent_refreshes_are_serialized():
+    credentials, entry = _brokered()
+    threads = [threading.Thread(target=credentials.refresh, args=(None,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert entry.credentials.refreshes == 1
+
+
+def test_before_request_refreshes_through_broker():
+    credentials, entry = _brokered()
+    headers = {}
+    credentials.before_request(None, 'GET', 'https://example.com', headers)
+    assert headers == {'authorization': 'Bearer token-1'}
+
+    # 401 뒤 갱신 요청은 토큰이 유효해도 다시 갱신
+    credentials.refresh(None)
+    assert entry.credentials.refreshes == 2
+
+
+def test_utcnow_is_naive_utc():
+    now = _utcnow()
+    assert now.tzinfo is None
+    assert abs(now - datetime.fromtimestamp(time.time(), timezone.utc).replace(tzinfo=None)) < timedelta(seconds=5)
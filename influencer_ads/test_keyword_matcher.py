@@ -0,0 +1,43 @@
+from keyword_matcher import KeywordMatcher
+
+
+def test_find_keywords_ignores_case_and_word_boundaries():
+    matcher = KeywordMatcher(['마감', 'Deadline', 'call', '화상회의'])
+    assert matcher.find_keywords('업로드 DEADLINE은 금요일, 화상회의로 recall 예정') == {'deadline', 'call', '화상회의'}
+    assert matcher.find_keywords('') == set()
+
+
+def test_find_tokens_prefers_leftmost_longest_whole_words():
+    matcher = KeywordMatcher(['sponsor', 'sponsorship', 'fee', '협찬'])
+    text = 'Sponsorship fee, coffee 협찬을 sponsors'
+    assert matcher.find_tokens(text) == [(0, 11, 'sponsorship'), (12, 15, 'fee'), (24, 26, '협찬')]
+
+
+def test_replace_whole_words_once():
+    translations = {'fee': '수수료', 'brand': '브랜드', 'payment': '지급'}
+    matcher = KeywordMatcher(translations)
+    assert matcher.replace('Brand fee and coffee payment', translations) == '브랜드 수수료 and coffee 지급'
+    # 치환 결과는 다시 치환하지 않음
+    swap = {'a': 'b', 'b': 'a'}
+    assert KeywordMatcher(swap).replace('a b', swap) == 'b a'
+
+
+def test_case_sensitive_and_empty_matchers():
+    assert KeywordMatcher(['Call'], ignore_case=False).find_tokens('call Call') == [(5, 9, 'Call')]
+    assert KeywordMatcher([]).replace('text', {}) == 'text'
+
+
+def test_find_hits_returns_overlapping_positions():
+    matcher = KeywordMatcher(['회의', '화상회의', 'Call'])
+    text = '화상회의 CALL, recall'
+    assert matcher.find_hits(text) == [(0, 4, '화상회의'), (2, 4, '회의'), (5, 9, 'call'), (13, 17, 'call')]
+    assert KeywordMatcher([]).find_hits(text) == []
+
+
+def test_length_changing_lowercase_keeps_offsets():
+    # 'İ'.lower()는 두 글자이므로 글자별로 소문자화해 위치를 유지
+    matcher = KeywordMatcher(['istanbul', 'deadline'])
+    text = 'İSTANBUL DEADLINE'
+    assert matcher.find_keywords(text) == {'istanbul', 'deadline'}
+    assert matcher.find_tokens(text) == [(0, 8, 'istanbul'), (9, 17, 'deadline')]
+    assert matcher.replace(text, {'deadline': '마감'}) == 'İSTANBUL 마감'
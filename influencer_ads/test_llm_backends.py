@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+pytest.importorskip('requests')
+
+from llm_backends import BackendRouter, ClovaBackend, LLMBackend, MockBackend, create_backend
+
+
+class _FailingBackend(LLMBackend):
+    name = 'failing'
+    cost_per_1k_tokens = 0.1
+
+    def _complete(self, messages, temperature, max_tokens, json_mode):
+        raise RuntimeError('unavailable')
+
+
+class _EchoBackend(LLMBackend):
+    name = 'echo'
+    cost_per_1k_tokens = 10.0
+
+    def _complete(self, messages, temperature, max_tokens, json_mode):
+        return messages[-1]['content'], 2000
+
+
+MESSAGES = [{'role': 'user', 'content': '협찬 제안: 고정금액 50만원, 판매 수수료 10%'}]
+
+
+def test_router_falls_back_and_records_stats():
+    router = BackendRouter([_FailingBackend(), _EchoBackend()])
+    response = router.complete(MESSAGES)
+
+    assert response.backend == 'echo'
+    assert response.cost == pytest.approx(20.0)
+    stats = router.get_stats()
+    assert stats['failing']['errors'] == 1
+    assert stats['echo']['calls'] == 1
+    assert stats['echo']['tokens'] == 2000
+
+
+def test_router_raises_last_error_when_all_fail():
+    router = BackendRouter([_FailingBackend()])
+    with pytest.raises(RuntimeError):
+        router.complete(MESSAGES)
+
+
+def test_cost_routing_orders_cheapest_first():
+    router = BackendRouter([_EchoBackend(), _FailingBackend()], strategy='cost')
+    assert [backend.name for backend in router.ordered()] == ['failing', 'echo']
+    with pytest.raises(ValueError):
+        BackendRouter([_EchoBackend()], strategy='random')
+
+
+def test_mock_backend_classifies_commission():
+    response = create_backend('mock').complete(MESSAGES, json_mode=True)
+    result = json.loads(response.text)
+    assert result['category'] == 'tier3'
+    assert response.backend == MockBackend().key
+
+
+def test_describe_reports_capability_flags():
+    clova = ClovaBackend('key').describe()
+    assert (clova['supports_batching'], clova['supports_streaming'], clova['supports_json_mode']) == (False, True, False)
+
+    mock = MockBackend().describe()
+    assert (mock['supports_batching'], mock['supports_streaming'], mock['supports_json_mode']) == (True, False, True)
+
+    base = _EchoBackend().describe()
+    assert (base['supports_batching'], base['supports_streaming']) == (False, False)
@@ -0,0 +1,55 @@
+import csv
+import importlib.util
+import io
+import os
+import sys
+
+import pytest
+
+from result_export import EXPORT_COLUMNS, parquet_available, write_export_file
+from result_store import ResultRecord
+
+
+def _record(email_id: str, classification: str = 'tier1') -> ResultRecord:
+    email = {'id': email_id, 'subject': f'협찬 제안 {email_id}', 'sender': 'brand@example.com',
+             'date': '2026-01-05', 'body': '본문', 'account': 'me@example.com'}
+    details = {'고정금액': '50만원', '조회수보상': '없음', '판매수수료': '있음 - 10%'}
+    return ResultRecord(email, classification, '설명', details)
+
+
+def test_csv_export_file_reopens_as_buffered_reader(tmp_path):
+    path = write_export_file([_record('a'), _record('b')], 'csv', directory=str(tmp_path))
+    try:
+        # st.download_button에 넘기는 형태 ('rb'로 다시 연 파일)
+        with open(path, 'rb') as export_file:
+            assert isinstance(export_file, io.BufferedReader)
+            rows = list(csv.reader(io.TextIOWrapper(export_file, encoding='utf-8-sig', newline='')))
+    finally:
+        os.remove(path)
+
+    assert rows[0] == [name for name, _ in EXPORT_COLUMNS]
+    assert [row[0] for row in rows[1:]] == ['a', 'b']
+    assert rows[1][4] == 'me@example.com'
+    assert rows[1][10] == 'True'
+
+
+def test_parquet_export_file(tmp_path):
+    pq = pytest.importorskip('pyarrow.parquet')
+    path = write_export_file([_record('a')], 'parquet', directory=str(tmp_path))
+    try:
+        table = pq.read_table(path)
+    finally:
+        os.remove(path)
+    assert table.num_rows == 1
+    assert table.column('판매수수료_퍼센트').to_pylist() == [10.0]
+
+
+def test_unknown_export_format():
+    with pytest.raises(ValueError):
+        write_export_file([], 'xlsx')
+
+
+def test_parquet_available_does_not_import_pyarrow(monkeypatch):
+    monkeypatch.delitem(sys.modules, 'pyarrow', raising=False)
+    assert parquet_available() == (importlib.util.find_spec('pyarrow') is not None)
+    assert 'pyarrow' not in sys.modules
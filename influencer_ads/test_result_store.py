@@ -0,0 +1,74 @@
+from datetime import datetime
+
+import result_store
+from result_store import ResultRecord, ResultStore
+
+
+def _record(email_id: str, classification: str, fee: str = '명시 안됨', commission: str = '명시 안됨') -> ResultRecord:
+    email = {'id': email_id, 'subject': email_id, 'sender': 'brand@example.com', 'date': '', 'body': ''}
+    return ResultRecord(email, classification, '', {'고정금액': fee, '판매수수료': commission})
+
+
+def _store() -> ResultStore:
+    store = ResultStore()
+    store.add(_record('a', 'tier1', fee='50만원'))
+    store.add(_record('b', 'tier3', fee='100만원', commission='10%'))
+    store.add(_record('c', 'unclear'))
+    store.add(_record('d', 'tier3', fee='30만원', commission='5%'))
+    return store
+
+
+def _ids(records) -> list:
+    return [record.id for record in records]
+
+
+def test_buckets_and_duplicates():
+    store = _store()
+    store.add(_record('a', 'tier2'))
+    assert len(store) == 4
+    assert store.get('a').classification == 'tier1'
+    assert store.count('tier3') == 2
+    assert store.count('tier2') == 0
+
+
+def test_query_sorts_with_missing_values_last():
+    store = _store()
+    assert _ids(store.query(sort_by='fixed_fee')) == ['b', 'a', 'd', 'c']
+    assert _ids(store.query(sort_by='fixed_fee', descending=False)) == ['d', 'a', 'b', 'c']
+    assert _ids(store.query()) == ['a', 'b', 'c', 'd']
+
+
+def test_query_filters_by_minimum_and_category():
+    store = _store()
+    assert _ids(store.query(min_values={'fixed_fee': 500_000})) == ['a', 'b']
+    assert _ids(store.query(category='tier3', min_values={'commission': 10})) == ['b']
+    assert _ids(store.query(min_values={'fixed_fee': 300_000, 'commission': 1}, sort_by='commission',
+                            descending=False)) == ['d', 'b']
+    assert store.query(min_values={'cpm': 0}) == []
+
+
+class _CountingBuilder:
+    """create_calendar_event 호출 횟수를 세는 분석기 대역"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def create_calendar_event(self, email_data, target_date, target_time, is_deadline, is_event):
+        self.calls += 1
+        return {'title': email_data['subject'], 'start': target_date['date'].isoformat(), 'deadline': is_deadline}
+
+
+def test_calendar_event_is_built_once_with_registered_builder(monkeypatch):
+    builder = _CountingBuilder()
+    monkeypatch.setattr(result_store, '_event_builder', builder)
+    email = {'id': 'x', 'subject': '촬영 일정', 'sender': '', 'date': '', 'body': ''}
+    record = ResultRecord(email, 'tier1', '', {}, schedule=(datetime(2026, 3, 2, 15, 30), True, False))
+
+    first = record.schedule_data
+    record.free_slot = datetime(2026, 3, 2, 17, 0)
+    second = record['schedule_data']
+    assert builder.calls == 1
+    assert second['calendar_event'] is first['calendar_event']
+    assert first['calendar_event'] == {'title': '촬영 일정', 'start': '2026-03-02T15:30:00', 'deadline': True}
+    assert second['free_slot'] == datetime(2026, 3, 2, 17, 0)
+    assert _record('y', 'tier1').schedule_data is None
@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from schedule_analyzer import ScheduleAnalyzer
+from schedule_conflicts import BusyIndex
+
+NOW = datetime(2026, 3, 2, 10, 0)
+
+EMAILS = [
+    {'id': 'shoot', 'subject': '촬영 일정', 'body': '촬영은 3월 10일 오후 3시, 업로드 마감은 3월 20일입니다.'},
+    {'id': 'hello', 'subject': '안부', 'body': '잘 지내?'},
+    {'id': 'past', 'subject': 'Deadline', 'body': 'Please upload by 2026-02-01 10:30'},
+]
+
+
+@pytest.fixture(scope='module')
+def batch():
+    return ScheduleAnalyzer().analyze_many(EMAILS, NOW)
+
+
+def test_batch_picks_nearest_future_date(batch):
+    assert batch.scheduled_keys() == ['shoot', 'past']
+    assert batch.schedule_summary('shoot') == (datetime(2026, 3, 10, 15, 0), True, True)
+    assert batch.schedule_summary('hello') is None
+    # 미래 날짜가 없으면 가장 늦은 과거 날짜
+    assert batch.schedule_summary('past') == (datetime(2026, 2, 1, 10, 30), True, False)
+
+
+def test_batch_matches_single_email_analysis(batch):
+    analyzer = ScheduleAnalyzer()
+    for email in EMAILS:
+        single = analyzer.analyze_schedule(email, NOW)
+        assert batch.to_schedule_data(email['id']) == single
+
+
+def test_calendar_event_is_cached(batch):
+    event = batch.calendar_event('shoot')
+    assert event['start'] == '2026-03-10T15:00:00'
+    assert event['end'] == '2026-03-10T16:00:00'
+    assert batch.calendar_event('shoot') is event
+    assert batch.calendar_event('hello') is None
+
+
+def test_check_conflicts_uses_busy_index():
+    batch = ScheduleAnalyzer().analyze_many(EMAILS[:1], NOW)
+    busy = datetime(2026, 3, 10, 14, 30)
+    index = BusyIndex([(busy, busy + timedelta(hours=1), {'summary': '미팅', 'start': {'dateTime': busy.isoformat()}})])
+
+    conflicts = batch.check_conflicts(index)
+    assert [item['summary'] for item in conflicts['shoot']['conflicts']] == ['미팅']
+    assert conflicts['shoot']['free_slot'] == datetime(2026, 3, 10, 15, 30)
+    assert batch.to_schedule_data('shoot')['free_slot'] == datetime(2026, 3, 10, 15, 30)
@@ -0,0 +1,89 @@
+import random
+from datetime import datetime, timedelta
+
+from calendar_cache import to_aware
+from schedule_conflicts import BusyIndex, find_conflicts
+
+BASE = datetime(2026, 3, 2, 9, 0)
+
+
+def _event(name: str, start: datetime, end: datetime, **extra) -> tuple:
+    event = {'summary': name, 'start': {'dateTime': start.isoformat()}, 'end': {'dateTime': end.isoformat()}}
+    event.update(extra)
+    return start, end, event
+
+
+def _names(events) -> list:
+    return [event['summary'] for event in events]
+
+
+def test_overlaps_matches_brute_force():
+    rng = random.Random(7)
+    events = []
+    for number in range(300):
+        start = BASE + timedelta(minutes=rng.randrange(0, 60 * 24 * 30))
+        events.append(_event(f'e{number}', start, start + timedelta(minutes=rng.choice([0, 15, 60, 240, 60 * 24]))))
+    index = BusyIndex(events)
+
+    for _ in range(200):
+        start = BASE + timedelta(minutes=rng.randrange(-60, 60 * 24 * 31))
+        end = start + timedelta(minutes=rng.randrange(1, 60 * 24 * 3))
+        expected = [event for event_start, event_end, event in index.intervals
+                    if event_start < to_aware(end) and event_end > to_aware(start)]
+        assert _names(index.overlaps(start, end)) == _names(expected)
+
+
+def test_long_early_event_overlaps():
+    # 한 달짜리 일정이 가장 먼저 시작해도 겹치는 일정만 시작 순으로 반환
+    events = [_event('trip', BASE, BASE + timedelta(days=30))]
+    events += [_event(f'm{day}', BASE + timedelta(days=day, hours=1), BASE + timedelta(days=day, hours=2))
+               for day in range(30)]
+    index = BusyIndex(events)
+
+    start = BASE + timedelta(days=10, hours=1, minutes=30)
+    assert _names(index.overlaps(start, start + timedelta(hours=1))) == ['trip', 'm10']
+    assert _names(index.overlaps(BASE + timedelta(days=31), BASE + timedelta(days=32))) == []
+
+
+def test_transparent_events_and_touching_intervals():
+    events = [
+        _event('free', BASE, BASE + timedelta(hours=2), transparency='transparent'),
+        _event('busy', BASE + timedelta(hours=2), BASE + timedelta(hours=3)),
+    ]
+    index = BusyIndex(events)
+    assert len(index) == 1
+    assert index.overlaps(BASE, BASE + timedelta(hours=2)) == []
+    assert _names(index.overlaps(BASE + timedelta(hours=1), BASE + timedelta(hours=3))) == ['busy']
+
+
+def test_find_conflicts_suggests_free_slot():
+    index = BusyIndex([_event('busy', BASE, BASE + timedelta(hours=2))])
+    results = find_conflicts({
+        'a': (BASE + timedelta(hours=1), BASE + timedelta(hours=2)),
+        'b': (BASE + timedelta(hours=3), BASE + timedelta(hours=4)),
+    }, index)
+    assert _names(results['a']['conflicts']) == ['busy']
+    assert results['a']['free_slot'] == BASE + timedelta(hours=2)
+    assert results['b'] == {'conflicts': [], 'free_slot': None}
+
+
+def test_inverted_interval_is_clamped():
+    # 종료가 시작보다 앞선 일정만 있어도 인덱스 생성이 끝나야 함
+    index = BusyIndex([_event('broken', BASE + timedelta(hours=2), BASE),
+                       _event('busy', BASE + timedelta(hours=1), BASE + timedelta(hours=3))])
+    assert [(start, end) for start, end, _ in index.intervals][0] == (to_aware(BASE + timedelta(hours=1)),
+                                                                      to_aware(BASE + timedelta(hours=3)))
+    assert _names(index.overlaps(BASE + timedelta(hours=2), BASE + timedelta(hours=3))) == ['busy']
+    assert _names(index.overlaps(BASE, BASE + timedelta(hours=1))) == []
+
+
+def test_naive_times_use_index_timezone():
+    # 시간대 정보가 없는 시각은 인덱스의 시간대로 해석 (서울 9시 일정 = 뉴욕 전날 20시)
+    seoul = to_aware(BASE)
+    events = [(seoul, seoul + timedelta(hours=1), {'summary': 'seoul'})]
+    assert _names(BusyIndex(events).overlaps(BASE, BASE + timedelta(hours=1))) == ['seoul']
+
+    new_york = BusyIndex(events, timezone='America/New_York')
+    assert new_york.overlaps(BASE, BASE + timedelta(hours=1)) == []
+    local = seoul.astimezone(new_york.tzinfo).replace(tzinfo=None)
+    assert _names(new_york.overlaps(local, local + timedelta(minutes=30))) == ['seoul']
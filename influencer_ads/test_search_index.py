@@ -0,0 +1,65 @@
+import pytest
+
+from result_store import ResultRecord
+from search_index import SearchIndex, build_match_query, tokenize
+
+
+def _record(email_id: str, subject: str, body: str, classification: str = 'tier1') -> ResultRecord:
+    email = {'id': email_id, 'subject': subject, 'sender': 'brand@example.com', 'date': '2026-01-05',
+             'body': body, 'account': 'me@example.com'}
+    return ResultRecord(email, classification, '', {})
+
+
+@pytest.fixture
+def index():
+    search_index = SearchIndex(':memory:')
+    if not search_index.available:
+        pytest.skip('SQLite FTS5를 사용할 수 없음')
+    search_index.add(_record('a', '신제품 협찬제안', '리뷰 영상 촬영을 부탁드립니다. Fixed fee 50만원'))
+    search_index.add(_record('b', 'Collaboration', 'We offer a commission on sales.', 'tier3'))
+    search_index.add(_record('c', '공지', '다음 주 휴무 안내입니다.', 'not_sponsorship'))
+    return search_index
+
+
+def _ids(results) -> list:
+    return [result['id'] for result in results]
+
+
+def test_tokenize_uses_korean_bigrams_and_lowercase_words():
+    assert tokenize('협찬제안 Fixed-Fee 50만원 가') == ['협찬', '찬제', '제안', 'fixed', 'fee', '50', '만원', '가']
+    assert tokenize('') == []
+    assert tokenize(None) == []
+
+
+def test_build_match_query_quotes_hostile_input():
+    # 따옴표, *, -, OR 같은 FTS5 문법은 토큰화에서 빠지거나 따옴표 안의 일반 단어가 됨
+    assert build_match_query('"협찬" OR -fee* NEAR(a b)') == '"협찬" AND "or" AND "fee" AND "near" AND "a" AND "b"'
+    # 한 글자 한글은 앞부분 일치
+    assert build_match_query('협') == '"협"*'
+    assert build_match_query('"*-') == ''
+
+
+def test_search_finds_partial_korean_words(index):
+    # 띄어쓰기/조사와 관계없이 글자쌍으로 찾음 ("협찬제안" 안의 "제안", "촬영을"의 "촬영")
+    assert _ids(index.search('제안')) == ['a']
+    assert _ids(index.search('촬영')) == ['a']
+    assert _ids(index.search('협')) == ['a']
+    assert _ids(index.search('COMMISSION')) == ['b']
+    assert index.search('협찬 commission') == []
+
+
+def test_search_filters_and_survives_hostile_queries(index):
+    assert _ids(index.search('안내', category='not_sponsorship')) == ['c']
+    assert index.search('안내', category='tier1') == []
+    assert _ids(index.search('"fee" OR -sales*')) == []
+    assert _ids(index.search('fee"')) == ['a']
+    assert index.search('"*-') == []
+
+
+def test_add_replaces_existing_id(index):
+    assert index.count() == 3
+    assert index.add(_record('a', '수정된 제목', '일정 변경'))
+    assert index.count() == 3
+    assert index.search('협찬') == []
+    result = index.search('일정')[0]
+    assert (result['id'], result['subject'], result['preview']) == ('a', '수정된 제목', '일정 변경')